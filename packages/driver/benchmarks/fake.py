@@ -0,0 +1,602 @@
+"""
+A stand-in for a browser running a `Flutterenium` app, so that the driver
+can be exercised without a browser, a server or the network.
+
+`FakeWebDriver` understands only the snippets present in `Scripts` & hands
+over the requests to a `FakePage`, which mimics the way `FluttereniumWeb`
+executes the actions on a tree of `FakeNode`.
+"""
+
+import base64
+import copy
+from collections import OrderedDict, deque
+from datetime import timedelta
+import re
+import threading
+import time
+from typing import Any, Optional
+
+from lib.internal.scripts import Scripts
+
+
+class FakeNode:
+    def __init__(
+        self,
+        widget: str,
+        children: list["FakeNode"] = None,
+        text: str = None,
+        label: str = None,
+        icon: int = None,
+        svg: str = None,
+        hint: str = None,
+        visible: bool = True,
+    ):
+        self.widget = widget
+        self.children = children or []
+        self.text = text
+        self.label = label
+        self.icon = icon
+        self.svg = svg
+        self.hint = hint
+        self.visible = visible
+        self.parent: Optional["FakeNode"] = None
+        for child in self.children:
+            child.parent = self
+
+    @property
+    def matchable_text(self) -> Optional[str]:
+        return self.hint if self.hint is not None else self.text
+
+    def first(self, widget: str) -> Optional["FakeNode"]:
+        for child in self.children:
+            if child.widget == widget:
+                return child
+            result = child.first(widget)
+            if result is not None:
+                return result
+        return None
+
+
+def build_example_tree(rows: int = 25, depth: int = 4) -> FakeNode:
+    """
+    Builds a tree shaped like the example app, every row of the list
+    is wrapped into `depth` widgets to mimic a real widget tree.
+    """
+
+    def wrap(node: FakeNode) -> FakeNode:
+        for _ in range(depth):
+            node = FakeNode("Padding", [node])
+        return node
+
+    list_view = FakeNode(
+        "ListView",
+        [
+            FakeNode(
+                "Scrollable",
+                [wrap(FakeNode("Text", text=str(index))) for index in range(rows)],
+            )
+        ],
+        label="list-view",
+    )
+    return FakeNode(
+        "MaterialApp",
+        [
+            FakeNode(
+                "AppBar",
+                [
+                    FakeNode("Text", text="Flutterenium Plugin example app"),
+                    FakeNode("IconButton", [FakeNode("Icon", icon=0xE047)]),
+                    FakeNode("SizedBox"),
+                    FakeNode("IconButton", [FakeNode("Icon", icon=0xE550)]),
+                ],
+            ),
+            FakeNode(
+                "Column",
+                [
+                    FakeNode("SvgPicture", svg="assets/flutter_logo.svg"),
+                    FakeNode(
+                        "InputDecorator",
+                        [FakeNode("EditableText", text="")],
+                        hint="Enter here",
+                    ),
+                    FakeNode("SizedBox"),
+                    FakeNode(
+                        "ElevatedButton",
+                        [FakeNode("Text", text="Show as toast")],
+                    ),
+                    list_view,
+                ],
+            ),
+        ],
+    )
+
+
+class FakePage:
+    def __init__(self, root: FakeNode, latency: timedelta = timedelta(0)):
+        """
+        Args:
+            root (FakeNode): Root of the tree the actions are executed on
+            latency (timedelta, optional): Time a response takes to be emitted after
+              a request is dispatched, mimics the frames the app takes. Defaults to 0.
+        """
+        self.root = root
+        self.latency = latency
+        self.visited_nodes = 0
+        self.event_logs: Optional[OrderedDict[str, tuple[float, dict]]] = None
+        self.event_logs_limit = 0
+        self.__handles: dict[str, FakeNode] = {}
+        self.__pending_snapshots: dict[str, list[list]] = {}
+        self.__plans: dict[str, tuple[list[list[dict]], bool]] = {}
+        self.__frame_timings: dict[str, list[list[int]]] = {}
+        # mimics the `LabelledElements` of the page, which holds the elements of
+        # the `Labelled` widgets as they get mounted, the tree of the fake never
+        # changes, so the index is built once & lives as long as the page
+        self.__label_index: Optional[dict[str, list[FakeNode]]] = None
+        self.__is_frame_scheduled = False
+
+    def __find(self, finder: dict, root: Optional[FakeNode], skip_current: bool):
+        kind = finder["type"]
+        data = finder.get("data") or {}
+        if kind in ("preceding_sibling", "following_sibling"):
+            return self.__find_sibling(root, kind, data["skip_gaps"])
+        if kind == "nth":
+            matches = self.__find_all(
+                data["finder"], root, skip_current, limit=data["index"] + 1
+            )
+            return matches[data["index"]] if len(matches) > data["index"] else None
+        matches = self.__find_all(finder, root, skip_current, limit=1)
+        return matches[0] if matches else None
+
+    def __find_all(
+        self,
+        finder: dict,
+        root: Optional[FakeNode],
+        skip_current: bool,
+        limit: int = None,
+    ) -> list[FakeNode]:
+        kind = finder["type"]
+        data = finder.get("data") or {}
+        if kind == "label" and not finder.get("scope"):
+            return self.__find_all_by_label(data["label"], root, skip_current, limit)
+        matchers = {
+            "label": lambda node: node.label == data["label"],
+            "text": lambda node: node.matchable_text == data["text"],
+            "icon": lambda node: node.icon == data["icon"],
+            "svg": lambda node: node.svg is not None
+            and re.search(data["svg"], node.svg) is not None,
+            "content": lambda node: node.label is not None
+            or node.matchable_text is not None,
+        }
+        matcher = matchers[kind]
+        scope = finder.get("scope") or {}
+        max_depth = scope.get("max_depth")
+        visible_only = scope.get("visible_only", False)
+        matches = []
+        # popping from the left makes it a queue, so breadth first
+        pending = deque([(root or self.root, skip_current, 0)])
+        pop = pending.popleft if scope.get("breadth_first") else pending.pop
+        while pending and (limit is None or len(matches) < limit):
+            node, skip, depth = pop()
+            self.visited_nodes += 1
+            if not skip and matcher(node):
+                matches.append(node)
+            if max_depth is not None and depth >= max_depth:
+                continue
+            children = [
+                (child, False, depth + 1)
+                for child in node.children
+                if child.visible or not visible_only
+            ]
+            pending.extend(children if pop == pending.popleft else reversed(children))
+        return matches
+
+    def __schedule_frame(self) -> None:
+        self.__is_frame_scheduled = True
+
+    def __find_all_by_label(
+        self,
+        label: str,
+        root: Optional[FakeNode],
+        skip_current: bool,
+        limit: Optional[int],
+    ) -> list[FakeNode]:
+        if self.__label_index is None:
+            self.__label_index = {}
+            pending = [self.root]
+            while pending:
+                node = pending.pop()
+                self.visited_nodes += 1
+                if node.label is not None:
+                    self.__label_index.setdefault(node.label, []).append(node)
+                pending.extend(reversed(node.children))
+        matches = []
+        for node in self.__label_index.get(label, []):
+            if limit is not None and len(matches) >= limit:
+                break
+            self.visited_nodes += 1
+            ancestor = node if not skip_current else node.parent
+            while ancestor is not None and ancestor is not (root or self.root):
+                ancestor = ancestor.parent
+            if ancestor is not None:
+                matches.append(node)
+        return matches
+
+    def __find_sibling(self, node: Optional[FakeNode], kind: str, skip_gaps: bool):
+        while node is not None and node.parent is not None:
+            siblings = node.parent.children
+            index = siblings.index(node)
+            candidates = (
+                reversed(siblings[:index])
+                if kind == "preceding_sibling"
+                else siblings[index + 1 :]
+            )
+            for sibling in candidates:
+                self.visited_nodes += 1
+                if not skip_gaps or sibling.children or sibling.widget != "SizedBox":
+                    return sibling
+            node = node.parent
+        return None
+
+    def __snapshot(self, data: dict, root: Optional[FakeNode]) -> Optional[dict]:
+        if data.get("release"):
+            self.__pending_snapshots.pop(data["id"], None)
+            return {"nodes": [], "total": 0}
+        nodes = []
+        if data["offset"] == 0:
+            stack = [(root or self.root, -1)]
+            while stack:
+                node, parent = stack.pop()
+                self.visited_nodes += 1
+                index = len(nodes)
+                nodes.append(
+                    [
+                        parent,
+                        node.widget,
+                        node.label,
+                        node.matchable_text,
+                        node.icon,
+                        node.svg,
+                        None,
+                    ]
+                )
+                stack.extend((child, index) for child in reversed(node.children))
+        elif data["id"] in self.__pending_snapshots:
+            nodes = self.__pending_snapshots.pop(data["id"])
+        else:
+            return None
+        end = len(nodes) if data["limit"] is None else data["offset"] + data["limit"]
+        if end < len(nodes):
+            self.__pending_snapshots[data["id"]] = nodes
+        return {"nodes": nodes[data["offset"] : end], "total": len(nodes)}
+
+    def __execute_element_action(self, action: dict, node: FakeNode, response: dict):
+        data = action.get("data") or {}
+        match action["type"]:
+            case "get_text":
+                editable = node if node.widget == "EditableText" else node.first("EditableText")
+                response["text"] = node.text if node.text is not None else (
+                    editable.text if editable is not None else None
+                )
+                return True
+            case "set_text":
+                editable = node.first("EditableText")
+                if editable is None:
+                    return False
+                editable.text = data["text"]
+                self.__schedule_frame()
+                return True
+            case "has_text":
+                text = node.text
+                if text is None:
+                    editable = node.first("EditableText")
+                    text = editable.text if editable is not None else None
+                return text == data["text"]
+            case "scroll":
+                self.__schedule_frame()
+                return node.first("Scrollable") is not None
+            case "screenshot":
+                # a tiny image whose size grows with the scale, enough
+                # to account the transfer cost of the real ones
+                pixels = bytes(int(64 * data["scale"]) ** 2)
+                response["screenshot"] = base64.b64encode(pixels).decode()
+                return True
+            case "collect":
+                finder = data["finder"] or {"type": "content"}
+                values = []
+                for match in self.__find_all(finder, node, skip_current=True):
+                    properties = {
+                        "text": match.matchable_text,
+                        "label": match.label,
+                        "visible": match.visible,
+                        "bounds": None,
+                        "type": match.widget,
+                    }
+                    values.append([properties[name] for name in data["properties"]])
+                response["values"] = values
+                return True
+            case "scroll_until_visible":
+                # every node of the fake is laid out on the screen,
+                # so no scrolling is needed to reveal the match
+                match = self.__find(data["finder"], node, skip_current=True)
+                if match is not None and match.visible:
+                    self.__handles[data["id"]] = match
+                response["found"] = match is not None and match.visible
+                response["scrolls"] = 0
+                return True
+            case "is_visible":
+                return node.visible
+            case "press":
+                self.__schedule_frame()
+                return True
+            case "handle":
+                self.__handles[data["id"]] = node
+                return True
+        raise NotImplementedError(f"{action['type']} is not supported by the fake page")
+
+    def __execute_actions(
+        self, actions: list[dict], root: FakeNode = None
+    ) -> tuple[bool, dict]:
+        actions = [action for action in actions if action["data"]["type"] != "wait_until"]
+        node = root
+        start = 0
+        did_succeed = root is not None
+        for index in range(len(actions) - 1, -1, -1):
+            data = actions[index]["data"]
+            if data["type"] == "handle" and data["data"]["id"] in self.__handles:
+                node = self.__handles[data["data"]["id"]]
+                start = index + 1
+                did_succeed = True
+                break
+        response = {}
+        for index in range(start, len(actions)):
+            data = actions[index]["data"]
+            if actions[index]["type"] == "framework":
+                if data["type"] == "find" and data["data"]["type"] == "all":
+                    response["elements"] = []
+                    for match in self.__find_all(
+                        data["data"]["data"], node, skip_current=node is not None
+                    ):
+                        did_succeed, match_data = self.__execute_actions(
+                            actions[index + 1 :], root=match
+                        )
+                        response["elements"].append(
+                            {
+                                "didSucceeded": did_succeed,
+                                **({"data": match_data} if did_succeed else {}),
+                            }
+                        )
+                    return True, response
+                if data["type"] == "find":
+                    node = self.__find(data["data"], node, skip_current=node is not None)
+                    did_succeed = node is not None
+                elif data["type"] == "snapshot":
+                    response["snapshot"] = self.__snapshot(data["data"], node)
+                    did_succeed = response["snapshot"] is not None
+                elif data["type"] == "frame_timings":
+                    id = data["data"]["data"]["id"]
+                    if data["data"]["type"] == "start":
+                        self.__frame_timings[id] = []
+                    else:
+                        response["frameTimings"] = {
+                            "frameBudgetMicroseconds": 16666,
+                            "frames": self.__frame_timings.pop(id),
+                        }
+                    did_succeed = True
+                elif data["type"] == "pump":
+                    self.__handles.clear()
+                    self.__pending_snapshots.clear()
+                    if data["data"]["type"] == "settle":
+                        # the fake page has no animations, so it is settled right away
+                        response["settleFrames"] = 1
+                    did_succeed = True
+                else:
+                    raise NotImplementedError(
+                        f"{data['type']} is not supported by the fake page"
+                    )
+            else:
+                did_succeed = self.__execute_element_action(data, node, response)
+            if not did_succeed:
+                break
+        return did_succeed, response
+
+    def __substitute(self, value: Any, params: dict) -> Any:
+        if isinstance(value, dict):
+            if "$param" in value:
+                return params[value["$param"]]
+            return {key: self.__substitute(item, params) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.__substitute(item, params) for item in value]
+        return value
+
+    def __execute_steps(self, steps: list[list[dict]], stop_on_failure: bool) -> dict:
+        results = []
+        for step in steps:
+            did_succeed, data = self.__execute_actions(step)
+            results.append(
+                {"didSucceeded": did_succeed, **({"data": data} if did_succeed else {})}
+            )
+            if not did_succeed and stop_on_failure:
+                break
+        return {"steps": results}
+
+    @property
+    def plan_count(self) -> int:
+        return len(self.__plans)
+
+    @property
+    def pending_snapshot_count(self) -> int:
+        return len(self.__pending_snapshots)
+
+    def forget_plans(self) -> None:
+        self.__plans.clear()
+
+    def handle_request(self, request: dict) -> dict:
+        started_at = time.perf_counter()
+        visited_nodes = self.visited_nodes
+        self.__is_frame_scheduled = False
+        # every request renders a frame, some of which overshoot the budget
+        for frames in self.__frame_timings.values():
+            frames.append([2000, 4000, 6000 * (len(frames) % 4 + 1)])
+        if "prepare" in request:
+            self.__plans[request["prepare"]] = (
+                request["steps"],
+                request.get("stopOnFailure", False),
+            )
+            did_succeed, data = True, {}
+        elif "release" in request:
+            self.__plans.pop(request["release"], None)
+            did_succeed, data = True, {}
+        elif "plan" in request:
+            plan = self.__plans.get(request["plan"])
+            did_succeed, data = plan is not None, None
+            if plan is not None:
+                steps, stop_on_failure = plan
+                data = self.__execute_steps(
+                    self.__substitute(steps, request["params"]), stop_on_failure
+                )
+        elif "steps" in request:
+            did_succeed, data = True, self.__execute_steps(
+                request["steps"], request.get("stopOnFailure", False)
+            )
+        else:
+            did_succeed, data = self.__execute_actions(request["actions"])
+        return {
+            "didSucceeded": did_succeed,
+            **({"data": data} if did_succeed else {}),
+            "metrics": {
+                "findMicroseconds": 0,
+                "executeMicroseconds": int((time.perf_counter() - started_at) * 1e6),
+                "visitedNodes": self.visited_nodes - visited_nodes,
+                # frame scheduled by this request is rendered right away
+                # by the fake, still it is reported as pending like the
+                # real app does while the response is being emitted
+                "idle": not self.__is_frame_scheduled,
+            },
+        }
+
+    def dispatch(self, id: str, request: dict) -> None:
+        response = self.handle_request(request)
+        ready_at = time.perf_counter() + self.latency.total_seconds()
+        self.event_logs[id] = (ready_at, response)
+        while len(self.event_logs) > self.event_logs_limit:
+            self.event_logs.popitem(last=False)
+
+    def pickup(self, id: str) -> Optional[dict]:
+        entry = self.event_logs.get(id)
+        if entry is None or entry[0] > time.perf_counter():
+            return None
+        del self.event_logs[id]
+        return entry[1]
+
+
+class FakeSwitchTo:
+    def __init__(self, web_driver: "FakeWebDriver"):
+        self.__web_driver = web_driver
+
+    def window(self, handle: str) -> None:
+        self.__web_driver._focus(handle)
+
+    def new_window(self, type_hint: str) -> None:
+        self.__web_driver._new_window()
+
+
+class FakeWebDriver:
+    def __init__(self, page: FakePage, latency: timedelta = timedelta(0)):
+        """
+        Args:
+            page (FakePage): Page in which the scripts are executed, every new
+              window gets a copy of the tree it started with
+            latency (timedelta, optional): Time every command takes, mimics the
+              WebDriver HTTP round trip. Defaults to 0.
+        """
+        self.latency = latency
+        self.round_trips = 0
+        self.switches = 0
+        self.script_timeouts: list[float] = []
+        self.switch_to = FakeSwitchTo(self)
+        self.current_window_handle = "window-0"
+        self.__root = copy.deepcopy(page.root)
+        # window handle => [page, url]
+        self.__windows = {self.current_window_handle: [page, "about:blank"]}
+        self.__opened_windows = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def page(self) -> FakePage:
+        return self.__windows[self.current_window_handle][0]
+
+    @property
+    def current_url(self) -> str:
+        return self.__windows[self.current_window_handle][1]
+
+    def __round_trip(self) -> None:
+        with self.__lock:
+            self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency.total_seconds())
+
+    def _focus(self, handle: str) -> None:
+        self.__round_trip()
+        self.switches += 1
+        self.current_window_handle = handle
+
+    def _new_window(self) -> None:
+        self.__round_trip()
+        page = FakePage(copy.deepcopy(self.__root), self.page.latency)
+        self.__opened_windows += 1
+        self.current_window_handle = f"window-{self.__opened_windows}"
+        self.__windows[self.current_window_handle] = [page, "about:blank"]
+
+    def get(self, url: str) -> None:
+        self.__round_trip()
+        self.__windows[self.current_window_handle][1] = url
+        self.page.event_logs = None
+        self.page.forget_plans()
+
+    def refresh(self) -> None:
+        self.get(self.current_url)
+
+    def set_script_timeout(self, time_to_wait: float) -> None:
+        self.__round_trip()
+        self.script_timeouts.append(time_to_wait)
+
+    def close(self) -> None:
+        self.__round_trip()
+        del self.__windows[self.current_window_handle]
+
+    def quit(self) -> None:
+        self.__round_trip()
+
+    def execute_script(self, script: str, *args) -> Any:
+        self.__round_trip()
+        match script:
+            case Scripts.INSTALL_EVENT_LOGS:
+                if self.page.event_logs is None:
+                    self.page.event_logs = OrderedDict()
+                    self.page.event_logs_limit = args[2]
+            case Scripts.IS_READY:
+                return True
+            case Scripts.GET_EVENT_LOGS_SIZE:
+                return len(self.page.event_logs)
+            case Scripts.DISPATCH:
+                self.page.dispatch(args[0], args[2])
+            case Scripts.POLL_RESPONSE:
+                return self.page.pickup(args[0])
+            case _:
+                raise NotImplementedError("Script is not supported by the fake driver")
+
+    def execute_async_script(self, script: str, *args) -> Any:
+        self.__round_trip()
+        match script:
+            case Scripts.WAIT_TILL_READY:
+                return None
+            case Scripts.DISPATCH_AND_WAIT:
+                id = args[0]
+                self.page.dispatch(id, args[4])
+                ready_at, response = self.page.event_logs.pop(id)
+                delay = ready_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                return response
+            case _:
+                raise NotImplementedError("Script is not supported by the fake driver")
@@ -0,0 +1,269 @@
+"""
+Offline benchmarks of the driver against `benchmarks.fake`, run them via
+
+    python -m benchmarks.run --json results.json
+
+& pass the saved results as `--baseline` to a later run, to fail
+it whenever a metric got worse than the allowed `--tolerance`.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from lib import *
+
+from .fake import FakePage, FakeWebDriver, build_example_tree
+
+# metrics for which a higher value is an improvement, rest are all
+# treated as the ones for which a lower value is an improvement
+HIGHER_IS_BETTER = {"actions_per_second"}
+
+
+class Session:
+    def __init__(
+        self,
+        args: argparse.Namespace,
+        execution_kind: ExecutionKind,
+        read_cache_ttl: timedelta = timedelta(0),
+    ):
+        self.page = FakePage(
+            build_example_tree(rows=args.rows),
+            latency=timedelta(milliseconds=args.page_latency),
+        )
+        self.web_driver = FakeWebDriver(
+            self.page, latency=timedelta(milliseconds=args.webdriver_latency)
+        )
+        self.driver = FluttereniumDriver(
+            BrowserKind.CHROME,
+            execution_kind=execution_kind,
+            web_driver=self.web_driver,
+            # reads are reused only in the "memoized" scenario, so that
+            # the rest keep measuring the cost of going to the page
+            read_cache_ttl=read_cache_ttl,
+        )
+        self.driver.open("http://fake")
+
+
+def measure(
+    sessions: list[Session],
+    action: Callable[[Session, int], None],
+    iterations: int,
+    actions_per_call: int = 1,
+) -> dict[str, float]:
+    for session in sessions:
+        session.web_driver.round_trips = 0
+        session.page.visited_nodes = 0
+
+    def run(session: Session, iterations: int) -> list[float]:
+        latencies = []
+        for iteration in range(iterations):
+            started_at = time.perf_counter()
+            action(session, iteration)
+            latencies.append((time.perf_counter() - started_at) * 1000)
+        return latencies
+
+    def run_all(iterations: int) -> list[float]:
+        with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+            return sum(
+                executor.map(lambda session: run(session, iterations), sessions), []
+            )
+
+    started_at = time.perf_counter()
+    latencies = sorted(run_all(iterations))
+    elapsed = time.perf_counter() - started_at
+    round_trips = sum(session.web_driver.round_trips for session in sessions)
+    visited_nodes = sum(session.page.visited_nodes for session in sessions)
+
+    # tracing slows down everything, so memory is measured
+    # separately with fewer iterations
+    tracemalloc.start()
+    run_all(max(1, iterations // 10))
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    actions = len(latencies) * actions_per_call
+    return {
+        "actions_per_second": actions / elapsed,
+        "round_trips_per_action": round_trips / actions,
+        "visited_nodes_per_action": visited_nodes / actions,
+        "p50_ms": latencies[len(latencies) // 2],
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "peak_memory_kib": peak_memory / 1024,
+        "unread_responses": sum(s.driver.get_event_logs_size() for s in sessions),
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    last_row = str(args.rows - 1)
+    results = {}
+    # fake browser has no DevTools endpoint, so only
+    # the WebDriver based executions can be measured
+    for execution_kind in (ExecutionKind.ASYNC, ExecutionKind.POLL):
+        session = Session(args, execution_kind)
+        cached_row = (
+            session.driver.get(By.label("list-view")).get(By.text(last_row)).cache()
+        )
+        plan = prepare_plan(session, args.batch_size)
+        scenarios = {
+            "single": (
+                [session],
+                lambda s, _: s.driver.get(By.text(last_row)).get_text(),
+                1,
+            ),
+            "chained": (
+                [session],
+                lambda s, _: s.driver.get(By.label("list-view"))
+                .get(By.text(last_row))
+                .is_visible(),
+                1,
+            ),
+            "cached": (
+                [session],
+                lambda s, _: cached_row.is_visible(),
+                1,
+            ),
+            "batch": (
+                [session],
+                lambda s, iteration: run_batch(s, args.batch_size, iteration),
+                args.batch_size,
+            ),
+            "plan": (
+                [session],
+                lambda s, iteration: plan.run(
+                    **{
+                        f"text{index}": f"{iteration}-{index}"
+                        for index in range(args.batch_size)
+                    }
+                ),
+                args.batch_size,
+            ),
+            "snapshot": (
+                [session],
+                lambda s, _: run_snapshot(s, args.batch_size),
+                args.batch_size,
+            ),
+            "memoized": (
+                [Session(args, execution_kind, read_cache_ttl=timedelta(milliseconds=16))],
+                lambda s, _: run_reads(s, last_row),
+                6,
+            ),
+            "concurrent": (
+                [Session(args, execution_kind) for _ in range(args.sessions)],
+                lambda s, _: s.driver.get(By.text(last_row)).get_text(),
+                1,
+            ),
+        }
+        for name, (sessions, action, actions_per_call) in scenarios.items():
+            results[f"{execution_kind.value}/{name}"] = measure(
+                sessions, action, args.iterations, actions_per_call
+            )
+    return results
+
+
+def run_batch(session: Session, size: int, iteration: int) -> None:
+    with session.driver.batch() as batch:
+        for index in range(size):
+            batch.get(By.text("Enter here")).set_text(f"{iteration}-{index}")
+
+
+def prepare_plan(session: Session, size: int) -> Plan:
+    with session.driver.prepare() as plan:
+        for index in range(size):
+            plan.get(By.text("Enter here")).set_text(Param(f"text{index}"))
+    return plan
+
+
+def run_reads(session: Session, text: str) -> None:
+    # page objects tend to read the same element over & over
+    row = session.driver.get(By.label("list-view")).get(By.text(text))
+    for _ in range(2):
+        row.is_valid()
+        row.get_text()
+        row.is_visible()
+
+
+def run_snapshot(session: Session, size: int) -> None:
+    snapshot = session.driver.snapshot()
+    list_view = snapshot.get(By.label("list-view"))
+    for index in range(size):
+        list_view.get(By.text(str(index)))
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    regressions = []
+    for scenario, metrics in results.items():
+        for metric, value in metrics.items():
+            previous = baseline.get(scenario, {}).get(metric)
+            if not previous:
+                continue
+            change = (value - previous) / previous * 100
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > tolerance:
+                regressions.append(
+                    f"{scenario} {metric}: {previous:.3f} -> {value:.3f} ({change:+.1f}% worse)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=500, help="rows in the fake list")
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument(
+        "--webdriver-latency",
+        type=float,
+        default=0.5,
+        help="milliseconds every WebDriver command takes",
+    )
+    parser.add_argument(
+        "--page-latency",
+        type=float,
+        default=1.0,
+        help="milliseconds the page takes to emit a response",
+    )
+    parser.add_argument("--json", help="file to save the results into")
+    parser.add_argument("--baseline", help="results of an earlier run to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=10.0,
+        help="percentage by which a metric may get worse than the baseline",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+    columns = list(next(iter(results.values())).keys())
+    print(f"{'scenario':<20}" + "".join(f"{column:>26}" for column in columns))
+    for scenario, metrics in results.items():
+        print(
+            f"{scenario:<20}" + "".join(f"{metrics[column]:>26.3f}" for column in columns)
+        )
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = find_regressions(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,50 @@
-from .driver import BrowserKind, FluttereniumDriver
-from .action import ActionKind, PumpKind, PressKind
-from .element import Element
+from .driver import BrowserKind, ExecutionKind, FluttereniumDriver
+from .action import ActionKind, PumpKind, PressKind, PropertyKind, ScrollKind
+from .config import BrowserConfig
+from .async_driver import AsyncElement, AsyncFluttereniumDriver
+from .batch import Batch
+from .element import Element, ElementList
 from .finder import By
+from .frame_stats import FrameStats
+from .instrumentation import Instrumentation, RequestTiming, StartupTiming
+from .locator import Locator
+from .plan import Param, Plan
+from .pool import DriverPool
+from .replay import Recorder, Replayer, ReplayKind, ReplayReport
+from .snapshot import Snapshot, SnapshotNode
+from .transport import DevToolsTransport, SeleniumTransport, Transport
 
 __all__ = [
     "BrowserKind",
+    "ExecutionKind",
     "FluttereniumDriver",
+    "AsyncFluttereniumDriver",
+    "DriverPool",
+    "Recorder",
+    "Replayer",
+    "ReplayKind",
+    "ReplayReport",
     "ActionKind",
     "PumpKind",
+    "Batch",
+    "Plan",
+    "Param",
     "Element",
+    "ElementList",
+    "AsyncElement",
     "PressKind",
+    "ScrollKind",
+    "PropertyKind",
     "By",
+    "Locator",
+    "Instrumentation",
+    "RequestTiming",
+    "StartupTiming",
+    "BrowserConfig",
+    "FrameStats",
+    "Snapshot",
+    "SnapshotNode",
+    "Transport",
+    "SeleniumTransport",
+    "DevToolsTransport",
 ]
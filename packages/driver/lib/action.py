@@ -12,6 +12,19 @@ class PressKind(Enum):
     LONG = "long"
 
 
+class ScrollKind(Enum):
+    FORWARD = "forward"
+    BACKWARD = "backward"
+
+
+class PropertyKind(Enum):
+    TEXT = "text"
+    LABEL = "label"
+    VISIBLE = "visible"
+    BOUNDS = "bounds"
+    TYPE = "type"
+
+
 class PumpKind(Enum):
     NORMAL = "normal"
     SETTLE = "settle"
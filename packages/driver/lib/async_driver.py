@@ -0,0 +1,211 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional
+
+from .action import PressKind, PropertyKind, PumpKind, ScrollKind
+from .driver import BrowserKind, FluttereniumDriver
+from .element import Element
+from .finder import By
+
+Runner = Callable[..., Awaitable[Any]]
+
+
+class AsyncElement:
+    def __init__(self, element: Element, run: Runner):
+        self.__element = element
+        self.__run = run
+
+    def get(self, by: By) -> "AsyncElement":
+        """
+        Same as `Element.get()`
+        """
+        return AsyncElement(self.__element.get(by), self.__run)
+
+    def cache(self) -> "AsyncElement":
+        """
+        Same as `Element.cache()`
+        """
+        return AsyncElement(self.__element.cache(), self.__run)
+
+    def get_preceding_sibling(self, skip_gaps: bool = True) -> "AsyncElement":
+        """
+        Same as `Element.get_preceding_sibling()`
+        """
+        return AsyncElement(self.__element.get_preceding_sibling(skip_gaps), self.__run)
+
+    def get_following_sibling(self, skip_gaps: bool = True) -> "AsyncElement":
+        """
+        Same as `Element.get_following_sibling()`
+        """
+        return AsyncElement(self.__element.get_following_sibling(skip_gaps), self.__run)
+
+    async def is_valid(self) -> bool:
+        """
+        Same as `Element.is_valid()`
+        """
+        return await self.__run(self.__element.is_valid)
+
+    async def get_text(self) -> Optional[str]:
+        """
+        Same as `Element.get_text()`
+        """
+        return await self.__run(self.__element.get_text)
+
+    async def set_text(self, text: str) -> bool:
+        """
+        Same as `Element.set_text()`
+        """
+        return await self.__run(self.__element.set_text, text)
+
+    async def scroll_by(self, delta: float, duration: Optional[int] = None) -> bool:
+        """
+        Same as `Element.scroll_by()`
+        """
+        return await self.__run(self.__element.scroll_by, delta, duration)
+
+    async def scroll_until_visible(
+        self,
+        by: By,
+        step: float = 200,
+        max_scrolls: int = 50,
+        direction: ScrollKind = ScrollKind.FORWARD,
+    ) -> tuple[Optional["AsyncElement"], int]:
+        """
+        Same as `Element.scroll_until_visible()`
+        """
+        element, scrolls = await self.__run(
+            self.__element.scroll_until_visible, by, step, max_scrolls, direction
+        )
+        if element is None:
+            return (None, scrolls)
+        return (AsyncElement(element, self.__run), scrolls)
+
+    async def collect(
+        self, properties: list[PropertyKind] = None, by: By = None
+    ) -> list[dict[str, Any]]:
+        """
+        Same as `Element.collect()`
+        """
+        return await self.__run(self.__element.collect, properties, by)
+
+    async def screenshot(self, scale: float = 1.0) -> Optional[bytes]:
+        """
+        Same as `Element.screenshot()`
+        """
+        return await self.__run(self.__element.screenshot, scale)
+
+    async def is_visible(self) -> bool:
+        """
+        Same as `Element.is_visible()`
+        """
+        return await self.__run(self.__element.is_visible)
+
+    async def wait_until_valid(self, timeout: timedelta = timedelta(seconds=10)) -> bool:
+        """
+        Same as `Element.wait_until_valid()`
+        """
+        return await self.__run(self.__element.wait_until_valid, timeout)
+
+    async def wait_until_visible(
+        self, timeout: timedelta = timedelta(seconds=10)
+    ) -> bool:
+        """
+        Same as `Element.wait_until_visible()`
+        """
+        return await self.__run(self.__element.wait_until_visible, timeout)
+
+    async def wait_until_text(
+        self, text: str, timeout: timedelta = timedelta(seconds=10)
+    ) -> bool:
+        """
+        Same as `Element.wait_until_text()`
+        """
+        return await self.__run(self.__element.wait_until_text, text, timeout)
+
+    async def press(self, kind: PressKind = PressKind.NOMRAL) -> bool:
+        """
+        Same as `Element.press()`
+        """
+        return await self.__run(self.__element.press, kind)
+
+
+class AsyncFluttereniumDriver:
+    def __init__(self, driver: FluttereniumDriver):
+        """
+        Wraps the `driver` so that it can be driven from an event loop. Every
+        driver gets its own worker thread, as a WebDriver session can't handle
+        concurrent commands, while different drivers can run concurrently.
+
+        Prefer `AsyncFluttereniumDriver.launch()` which won't block the event loop
+        while the browser is being launched.
+
+        Args:
+            driver (FluttereniumDriver): driver to which all the calls are delegated
+        """
+        self.__driver = driver
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+
+    @classmethod
+    async def launch(
+        cls, browser_kind: BrowserKind, **kwargs
+    ) -> "AsyncFluttereniumDriver":
+        """
+        Launches the browser without blocking the event loop.
+
+        Args:
+            browser_kind (BrowserKind): Same as `FluttereniumDriver()`
+            kwargs: passed as is to the `FluttereniumDriver()`
+        """
+        loop = asyncio.get_running_loop()
+        driver = await loop.run_in_executor(
+            None, partial(FluttereniumDriver, browser_kind, **kwargs)
+        )
+        return cls(driver)
+
+    async def __run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.__executor, partial(func, *args, **kwargs)
+        )
+
+    async def open(self, url: str) -> None:
+        """
+        Same as `FluttereniumDriver.open()`
+        """
+        await self.__run(self.__driver.open, url)
+
+    async def new_tab(self, url: str = None, **kwargs) -> "AsyncFluttereniumDriver":
+        """
+        Same as `FluttereniumDriver.new_tab()`, the tab gets its own worker
+        thread, so that the tabs can be driven concurrently.
+        """
+        return AsyncFluttereniumDriver(
+            await self.__run(self.__driver.new_tab, url, **kwargs)
+        )
+
+    async def close(self, with_browser=False) -> None:
+        """
+        Same as `FluttereniumDriver.close()`, additionally releases the worker
+        thread, so this driver can't be used once it is closed.
+        """
+        try:
+            await self.__run(self.__driver.close, with_browser)
+        finally:
+            self.__executor.shutdown(wait=False)
+
+    def get(self, by: By) -> AsyncElement:
+        """
+        Same as `FluttereniumDriver.get()`, this won't talk to the
+        browser, so there is no need to await it.
+        """
+        return AsyncElement(self.__driver.get(by), self.__run)
+
+    async def pump(
+        self, kind: PumpKind = PumpKind.NORMAL, delta: timedelta = None
+    ) -> bool:
+        """
+        Same as `FluttereniumDriver.pump()`
+        """
+        return await self.__run(self.__driver.pump, kind, delta)
@@ -0,0 +1,76 @@
+from datetime import timedelta
+from typing import Callable
+
+from .action import PumpKind
+from .element import Element
+from .finder import By
+from .locator import Locator
+from .internal.typedefs import *
+from .internal.utils import *
+
+
+class Batch:
+    def __init__(
+        self,
+        on_steps_executed: Callable[[list[list[Action]]], list[ActionResponse]],
+    ):
+        self.__on_steps_executed = on_steps_executed
+        self.__steps: list[list[Action]] = []
+        self.__results: list[ActionResponse] = []
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+
+    @property
+    def results(self) -> list[ActionResponse]:
+        """
+        Responses of all the steps flushed so far, in the order they got queued.
+        """
+        return self.__results
+
+    def __queue(self, actions: list[Action]) -> ActionResponse:
+        self.__steps.append(list(actions))
+        # Actual response will be known only after flushing,
+        # so report it as succeeded till then
+        return (True, QUEUED_DATA)
+
+    def get(self, by: By) -> Element:
+        """
+        Works same as `driver.get()`, only difference was the actions
+        performed on the returned element will be queued instead of
+        getting executed immediately. So the values returned by those
+        actions are placeholders, one should use the `results` instead.
+
+        Args:
+            by (By): Same as `driver.get()`
+        """
+        return Element(
+            Locator(by._to_action()),
+            lambda locator, data: self.__queue(locator._to_actions(data)),
+        )
+
+    def pump(self, kind: PumpKind = PumpKind.NORMAL, delta: timedelta = None) -> None:
+        """
+        Queues a step which works same as `driver.pump()`
+        """
+        actual_delta = delta if delta is not None else kind.get_default_time_delta()
+        self.__queue([to_pump_action(kind, actual_delta)])
+
+    def flush(self) -> list[ActionResponse]:
+        """
+        Sends all the queued steps in a single request.
+
+        Returns:
+            list[ActionResponse]: response of every step, in the order they got queued
+        """
+        if not self.__steps:
+            return []
+        steps = self.__steps
+        self.__steps = []
+        results = self.__on_steps_executed(steps)
+        self.__results.extend(results)
+        return results
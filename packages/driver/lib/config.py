@@ -0,0 +1,113 @@
+from typing import Optional
+
+from selenium import webdriver
+from selenium.webdriver.common.options import ArgOptions
+
+
+class BrowserConfig:
+    def __init__(
+        self,
+        headless: bool = False,
+        page_load_strategy: Optional[str] = None,
+        disable_extensions: bool = False,
+        disable_background_throttling: bool = False,
+        profile_dir: Optional[str] = None,
+        window_size: Optional[tuple[int, int]] = None,
+        arguments: Optional[list[str]] = None,
+    ):
+        """
+        How the browser needs to be launched by the driver.
+
+        Args:
+            headless (bool, optional): If `True`, launches without any window. Defaults to False.
+            page_load_strategy (str, optional): Either "normal", "eager" or "none", with "eager"
+              the page is treated as loaded without waiting for the images & stylesheets, which
+              is enough as the driver waits for `Flutterenium` to get ready anyway.
+              Defaults to the browser's default.
+            disable_extensions (bool, optional): If `True`, extensions won't be loaded. Defaults to False.
+            disable_background_throttling (bool, optional): If `True`, the timers & rendering
+              of the pages in the background won't be slowed down by the browser. Defaults to False.
+            profile_dir (str, optional): If specified, this directory is used as the profile of
+              the browser, reusing it across the launches keeps the cached app assets like
+              the Flutter engine & CanvasKit warm. Defaults to a fresh profile.
+            window_size (tuple[int, int], optional): Width & height of the window. Defaults to
+              the browser's default.
+            arguments (list[str], optional): Any other command line arguments for the browser.
+              Defaults to None.
+        """
+        self.headless = headless
+        self.page_load_strategy = page_load_strategy
+        self.disable_extensions = disable_extensions
+        self.disable_background_throttling = disable_background_throttling
+        self.profile_dir = profile_dir
+        self.window_size = window_size
+        self.arguments = arguments or []
+
+    @classmethod
+    def fast(cls, profile_dir: Optional[str] = None) -> "BrowserConfig":
+        """
+        Preset which launches the browser as quickly as possible & keeps
+        the app running at full speed, suitable for the CI runners.
+
+        Args:
+            profile_dir (str, optional): Same as `BrowserConfig()`, recommended to pass one
+              which is reused across the runs. Defaults to a fresh profile.
+        """
+        return cls(
+            headless=True,
+            page_load_strategy="eager",
+            disable_extensions=True,
+            disable_background_throttling=True,
+            profile_dir=profile_dir,
+            window_size=(1280, 800),
+        )
+
+    @classmethod
+    def debug(cls, profile_dir: Optional[str] = None) -> "BrowserConfig":
+        """
+        Same as `fast()`, but with a window, so that one can watch the app being driven.
+        """
+        config = cls.fast(profile_dir=profile_dir)
+        config.headless = False
+        return config
+
+    def _to_chrome_options(self) -> webdriver.ChromeOptions:
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.disable_extensions:
+            options.add_argument("--disable-extensions")
+        if self.disable_background_throttling:
+            options.add_argument("--disable-background-timer-throttling")
+            options.add_argument("--disable-backgrounding-occluded-windows")
+            options.add_argument("--disable-renderer-backgrounding")
+        if self.profile_dir is not None:
+            options.add_argument(f"--user-data-dir={self.profile_dir}")
+        if self.window_size is not None:
+            width, height = self.window_size
+            options.add_argument(f"--window-size={width},{height}")
+        return self.__apply_common(options)
+
+    def _to_firefox_options(self) -> webdriver.FirefoxOptions:
+        options = webdriver.FirefoxOptions()
+        if self.headless:
+            options.add_argument("-headless")
+        if self.disable_extensions:
+            options.set_preference("extensions.enabledScopes", 0)
+        if self.disable_background_throttling:
+            options.set_preference("dom.timeout.enable_budget_timer_throttling", False)
+            options.set_preference("dom.min_background_timeout_value", 4)
+        if self.profile_dir is not None:
+            options.add_argument("-profile")
+            options.add_argument(self.profile_dir)
+        if self.window_size is not None:
+            options.add_argument(f"--width={self.window_size[0]}")
+            options.add_argument(f"--height={self.window_size[1]}")
+        return self.__apply_common(options)
+
+    def __apply_common(self, options: ArgOptions) -> ArgOptions:
+        if self.page_load_strategy is not None:
+            options.page_load_strategy = self.page_load_strategy
+        for argument in self.arguments:
+            options.add_argument(argument)
+        return options
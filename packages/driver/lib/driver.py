@@ -1,14 +1,32 @@
+from contextlib import contextmanager
 from enum import Enum
-from datetime import timedelta
+from typing import Any, Callable, Iterator, Optional
+from datetime import datetime, timedelta
+import json
+import time
 import uuid
 
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
 
 from .action import *
+from .batch import *
 from .element import *
 from .finder import *
+from .locator import Locator
+from .config import BrowserConfig
+from .frame_stats import FrameStats
+from .instrumentation import Instrumentation, StartupTiming
+from .plan import *
+from .replay import *
+from .snapshot import *
+from .transport import DevToolsTransport, ExecutionKind, SeleniumTransport, Transport
 from .internal.actions_data import *
 from .internal.constants import *
+from .internal.read_cache import ReadCache, is_read_only
+from .internal.scripts import *
+from .internal.tab import TabWebDriver
 from .internal.typedefs import *
 
 
@@ -18,112 +36,446 @@ class BrowserKind(Enum):
 
 
 class FluttereniumDriver:
-    def __init__(self, browser_kind: BrowserKind):
+    def __init__(
+        self,
+        browser_kind: BrowserKind,
+        execution_kind: ExecutionKind = ExecutionKind.ASYNC,
+        timeout: timedelta = timedelta(seconds=30),
+        event_logs_limit: int = 1000,
+        instrumentation: Instrumentation = None,
+        web_driver: WebDriver = None,
+        browser_config: BrowserConfig = None,
+        transport: Transport = None,
+        read_cache_ttl: timedelta = None,
+    ):
+        """
+        Launches the browser which will be used to drive the `Flutterenium` app
+
+        Args:
+            browser_kind (BrowserKind): Browser that need to be launched
+            execution_kind (ExecutionKind, optional): ExecutionKind.ASYNC sends the request & waits
+              for its response inside a single `execute_async_script` call, while ExecutionKind.POLL
+              dispatches the request & polls the response logs till the response arrives, while
+              ExecutionKind.DEVTOOLS talks to the page over the DevTools protocol without going
+              through the WebDriver at all, which is the quickest but works only with Chrome.
+              Defaults to ExecutionKind.ASYNC.
+            timeout (timedelta, optional): Maximum time to wait for the response of a request.
+              Defaults to 30 seconds.
+            event_logs_limit (int, optional): Maximum number of unread responses kept in the page,
+              once exceeded the oldest ones will be evicted. Defaults to 1000.
+            instrumentation (Instrumentation, optional): If specified, the timings of every
+              request will be recorded into it. Defaults to None.
+            web_driver (WebDriver, optional): If specified, this will be driven instead of
+              launching a new browser. Defaults to None.
+            browser_config (BrowserConfig, optional): How the browser needs to be launched,
+              use `BrowserConfig.fast()` for the quickest startup. Defaults to the browser's defaults.
+            transport (Transport, optional): If specified, the requests are sent through this
+              instead of the one picked based on the `execution_kind`. Defaults to None.
+            read_cache_ttl (timedelta, optional): If specified, how long the results of `is_valid()`,
+              `get_text()` & `is_visible()` of an element are reused, ex: 16 milliseconds i.e. a frame.
+              Only the ones read while the app was idle are reused & any other request made by this
+              driver forgets them. Identical reads made at the same time are always sent once. The
+              reused results are recorded & instrumented as `cached`. Defaults to None, i.e. nothing
+              is reused once the read completes.
+        """
+        config = browser_config if browser_config is not None else BrowserConfig()
+        launched_at = time.perf_counter()
         match browser_kind:
+            case _ if isinstance(web_driver, TabWebDriver):
+                self.__driver = web_driver
+            case _ if web_driver is not None:
+                self.__driver = TabWebDriver(web_driver)
             case BrowserKind.CHROME:
-                self.__driver = webdriver.Chrome()
+                self.__driver = TabWebDriver(
+                    webdriver.Chrome(options=config._to_chrome_options())
+                )
             case BrowserKind.FIREFOX:
-                self.__driver = webdriver.Firefox()
+                self.__driver = TabWebDriver(
+                    webdriver.Firefox(options=config._to_firefox_options())
+                )
             case _:
                 raise ValueError("Unhandled browser value")
+        self.__launch_duration = timedelta(seconds=time.perf_counter() - launched_at)
+        self.__startup_timing: Optional[StartupTiming] = None
+        self.__browser_kind = browser_kind
+        self.__execution_kind = execution_kind if transport is None else None
+        self.__timeout = timeout
+        self.__event_logs_limit = event_logs_limit
+        self.__instrumentation = instrumentation
+        self.__recorder: Optional[Recorder] = None
+        # stats being measured currently, which the settling pumps get counted into
+        self.__frame_stats: list[FrameStats] = []
+        self.__read_cache = ReadCache(read_cache_ttl)
+        match execution_kind:
+            case _ if transport is not None:
+                self.__transport = transport
+            case ExecutionKind.ASYNC | ExecutionKind.POLL:
+                self.__transport = SeleniumTransport(
+                    self.__driver, execution_kind, timeout, event_logs_limit
+                )
+            case ExecutionKind.DEVTOOLS:
+                self.__transport = DevToolsTransport(self.__driver, event_logs_limit)
+            case _:
+                raise ValueError("Unhandled execution value")
 
     def open(self, url: str) -> None:
         """
         Opens the specified url in the browser
         and waits till the `Flutterenium` is ready
         to accepts the requests and adds a eventListener
-        to handle the responses emitted by `Flutterenium`
+        to handle the responses emitted by `Flutterenium`.
+
+        If the specified url is already opened & `Flutterenium`
+        is ready, then nothing will be done. Use `reload_app()`
+        to start the app from scratch.
 
         Args:
             url (str): Path of the website
         """
-        self.__driver.get(url)
+        if self.__driver.current_url == url and self.is_ready():
+            return
+        self.__load(lambda: self.__driver.get(url))
+
+    def reload_app(self, url: str = None) -> None:
+        """
+        Restarts the app by reloading the page in the existing browser,
+        which is way cheaper than launching a new browser as the browser
+        process & the cached app assets will be reused.
+
+        Args:
+            url (str, optional): Path of the website to load. If `None` or same as
+              the current url, the current page gets reloaded. Defaults to None.
+        """
+        if url is None or self.__driver.current_url == url:
+            self.__load(self.__driver.refresh)
+        else:
+            self.__load(lambda: self.__driver.get(url))
+
+    def new_tab(
+        self,
+        url: str = None,
+        execution_kind: ExecutionKind = ExecutionKind.POLL,
+        **kwargs,
+    ) -> "FluttereniumDriver":
+        """
+        Opens the app in a new tab of the same browser, which can be driven independently
+        of this one, so that multiple sessions share a single browser process. Every tab has
+        its own event logs, hence the requests & their responses never get mixed up.
 
+        Note: The WebDriver runs only one command at a time for the whole browser, so neither
+        this driver nor the tab can use ExecutionKind.ASYNC, which holds the browser till the
+        response arrives. If this driver was created with ExecutionKind.ASYNC, which is the
+        default, it switches to ExecutionKind.POLL. With the others, the requests of the tabs
+        are interleaved, so that a long running one like `pump(PumpKind.SETTLE)` won't block
+        the other tabs.
+
+        Args:
+            url (str, optional): Path of the website to open in the tab. Defaults to the
+              current url of this driver.
+            execution_kind (ExecutionKind, optional): Either ExecutionKind.POLL or
+              ExecutionKind.DEVTOOLS. Defaults to ExecutionKind.POLL.
+            kwargs: passed as is to the `FluttereniumDriver()`, the `timeout`, `event_logs_limit`
+              & `instrumentation` defaults to the ones of this driver
+
+        Raises:
+            ValueError: if the `execution_kind` is ExecutionKind.ASYNC
+
+        Returns:
+            FluttereniumDriver: one should use this to drive the tab, closing it closes only the tab
+        """
+        if execution_kind == ExecutionKind.ASYNC:
+            raise ValueError(
+                "Tabs can't be driven using ExecutionKind.ASYNC, "
+                "pass either ExecutionKind.POLL or ExecutionKind.DEVTOOLS as the `execution_kind`"
+            )
+        if self.__execution_kind == ExecutionKind.ASYNC:
+            # both share the event logs installed in the page,
+            # so the switch needs nothing else to be done
+            self.__execution_kind = ExecutionKind.POLL
+            self.__transport = SeleniumTransport(
+                self.__driver,
+                ExecutionKind.POLL,
+                self.__timeout,
+                self.__event_logs_limit,
+            )
+        driver = FluttereniumDriver(
+            self.__browser_kind,
+            execution_kind=execution_kind,
+            web_driver=self.__driver.new_tab(),
+            **{
+                "timeout": self.__timeout,
+                "event_logs_limit": self.__event_logs_limit,
+                "instrumentation": self.__instrumentation,
+                **kwargs,
+            },
+        )
+        driver.open(url if url is not None else self.__driver.current_url)
+        return driver
+
+    @property
+    def startup_timing(self) -> Optional[StartupTiming]:
+        """
+        Where the time went while the app got loaded the last time via `open()` or
+        `reload_app()`, the browser launch is accounted only for the first load.
+        `None` if the app is not loaded yet.
+        """
+        return self.__startup_timing
+
+    def __load(self, load_page: Callable[[], None]) -> None:
+        self.__read_cache.clear()
+        started_at = time.perf_counter()
+        load_page()
+        loaded_at = time.perf_counter()
+        self.__wait_till_ready()
+        self.__transport.install()
+        self.__startup_timing = StartupTiming(
+            launch=self.__launch_duration,
+            page_load=timedelta(seconds=loaded_at - started_at),
+            ready=timedelta(seconds=time.perf_counter() - loaded_at),
+        )
+        # browser is launched only once, so the later loads
+        # shouldn't be accounting it
+        self.__launch_duration = timedelta(seconds=0)
+
+    def __wait_till_ready(self) -> None:
         self.__driver.execute_async_script(
-            """
-            const readyEventName = arguments[0];
-            const driverReadyName = arguments[1];
-            const callback = arguments[arguments.length - 1];
-            window.addEventListener(readyEventName, (event) => {
-                window[driverReadyName] = true;
-                callback();
-            }, {once: true});
-            """,
+            Scripts.WAIT_TILL_READY,
             Constants.FLUTTERENIUM_READY_NAME,
             Constants.FLUTTERENIUM_DRIVER_READY_NAME,
         )
 
-        self.__driver.execute_script(
-            """
-            const eventLogsName = arguments[0];
-            const responseEventName = arguments[1];
-            // All the event log responses happens via the driver
-            // will be flushed into the below object
-            window[eventLogsName] = {};
-            window.addEventListener(responseEventName, (event) => {
-                const {id, ...rest} = event.detail;
-                window[eventLogsName][id] = rest;
-            });
-            """,
-            Constants.FLUTTERENIUM_DRIVER_EVENT_LOGS_NAME,
-            Constants.FLUTTERENIUM_RESPONSE_EVENT_NAME,
-        )
+    def is_ready(self) -> bool:
+        """
+        Checks whether the browser is still alive & `Flutterenium`
+        in the opened page is ready to accept the requests.
+
+        Returns:
+            bool: `True` if ready, else `False`
+        """
+        try:
+            return bool(
+                self.__driver.execute_script(
+                    Scripts.IS_READY,
+                    Constants.FLUTTERENIUM_DRIVER_READY_NAME,
+                )
+            )
+        except WebDriverException:
+            return False
 
     def close(self, with_browser=False) -> None:
         """
         Closes the current `window` or `browser` instance.
 
         Args:
-            with_browser (bool, optional): If `True` then entire browser closes,
-            else only closes the window. Defaults to False.
+            with_browser (bool, optional): If `True` then entire browser closes along with
+            all the tabs opened via `new_tab()`, else only closes the window. Defaults to False.
         """
+        self.__transport.close()
         if not with_browser:
             self.__driver.close()
             return
         self.__driver.quit()
 
-    def __execute_actions(self, actions: list[Action]) -> ActionResponse:
+    def get_event_logs_size(self) -> int:
+        """
+        Gets the number of responses which are emitted by `Flutterenium`
+        but not yet read by the driver. This will be helpful to detect
+        the requests which are timed out or never awaited.
+
+        Returns:
+            int: number of unread responses present in the page
+        """
+        return self.__transport.get_unread_count()
+
+    def __execute_request(
+        self, request: dict, timeout: timedelta = None, is_read: bool = False
+    ) -> dict:
+        if not is_read:
+            # page might change while the request is being executed,
+            # so the reads are forgotten both before & after it
+            self.__read_cache.clear()
+            try:
+                return self.__send_request(request, timeout)
+            finally:
+                self.__read_cache.clear()
+        return self.__send_request(request, timeout)
+
+    def __send_request(self, request: dict, timeout: timedelta = None) -> dict:
         id = str(uuid.uuid4())
-        self.__driver.execute_script(
-            """
-            const id = arguments[0];
-            const requestEventName = arguments[1];
-            const actionsToExecute = arguments[2];
-            window.dispatchEvent(
-                new CustomEvent(
-                    requestEventName,
-                    {
-                        detail: {
-                            "id": id,
-                            "actions": actionsToExecute
-                        }
-                    }
-                )
-            );
-            """,
-            id,
-            Constants.FLUTTERENIUM_REQUEST_EVENT_NAME,
-            actions,
+        actual_timeout = timeout if timeout is not None else self.__timeout
+        started_at = time.perf_counter()
+        response, dispatched_at, polls = self.__transport.send(
+            id, request, actual_timeout
         )
-        response = None
-        while response is None:
-            response = self.__driver.execute_script(
-                """
-                const id = arguments[0];
-                const eventLogsName = arguments[1];
-                return window[eventLogsName][id];
-                """,
-                id,
-                Constants.FLUTTERENIUM_DRIVER_EVENT_LOGS_NAME,
+        if response is None:
+            raise TimeoutError(
+                f"No response received for the request {id} within {actual_timeout}"
+            )
+        if self.__recorder is not None:
+            self.__recorder._record(request, wait=actual_timeout - self.__timeout)
+        if self.__instrumentation is not None:
+            self.__instrumentation._record(
+                request,
+                response,
+                dispatch=timedelta(seconds=dispatched_at - started_at),
+                pickup=timedelta(seconds=time.perf_counter() - dispatched_at),
+                polls=polls,
             )
-        did_succeeded = bool(response["didSucceeded"])
-        data = None
-        if did_succeeded:
-            data = response["data"]
+        return response
 
-        if data:
-            data = dict(data)
-        return (did_succeeded, data)
+    def _replay(self, request: dict, wait: timedelta) -> dict:
+        return self.__execute_request(request, timeout=self.__timeout + wait)
+
+    def __execute_actions(self, actions: list[Action]) -> ActionResponse:
+        return utils.to_action_response(
+            self.__execute_request(
+                {"actions": actions},
+                # Waiting inside the page can itself take upto the delta,
+                # so the response should be awaited atleast for that much time.
+                timeout=self.__timeout + utils.get_wait_delta(actions),
+            )
+        )
+
+    def __execute_element_actions(
+        self, locator: Locator, data: ActionData
+    ) -> ActionResponse:
+        actions = locator._to_actions(data)
+        if not is_read_only(data):
+            return self.__execute_actions(actions)
+
+        def read() -> tuple[ActionResponse, bool]:
+            response = self.__execute_request({"actions": actions}, is_read=True)
+            return (
+                utils.to_action_response(response),
+                bool(response.get("metrics", {}).get("idle", False)),
+            )
+
+        # elements found by equal locators are the same element, so
+        # equal reads on them can share the result
+        started_at = time.perf_counter()
+        response, is_cached = self.__read_cache.get(
+            (locator, json.dumps(data, sort_keys=True)), read
+        )
+        if is_cached:
+            self.__record_cached(
+                {"actions": actions},
+                waited=timedelta(seconds=time.perf_counter() - started_at),
+            )
+        return response
+
+    def __record_cached(self, request: dict, waited: timedelta) -> None:
+        # never reached the page, but still accounted so that the
+        # recordings & timings reflect every read the test made
+        if self.__recorder is not None:
+            self.__recorder._record(request, wait=timedelta(0), cached=True)
+        if self.__instrumentation is not None:
+            self.__instrumentation._record(
+                request,
+                {},
+                dispatch=waited,
+                pickup=timedelta(0),
+                polls=0,
+                cached=True,
+            )
+
+    def __execute_steps(
+        self, steps: list[list[Action]], stop_on_failure: bool
+    ) -> list[ActionResponse]:
+        response = self.__execute_request(
+            {
+                "steps": steps,
+                "stopOnFailure": stop_on_failure,
+            },
+            timeout=self.__timeout + sum(
+                (utils.get_wait_delta(step) for step in steps),
+                timedelta(seconds=0),
+            ),
+        )
+        did_succeeded, data = utils.to_action_response(response)
+        if not did_succeeded:
+            return [(False, None)] * len(steps)
+        results = [utils.to_action_response(step) for step in data["steps"]]
+        # steps which are not executed because of an earlier
+        # failure will be treated as failed ones
+        results.extend([(False, None)] * (len(steps) - len(results)))
+        return results
+
+    def __prepare_plan(
+        self, id: str, steps: list[list[Action]], stop_on_failure: bool
+    ) -> bool:
+        did_succeeded, _ = utils.to_action_response(
+            self.__execute_request(
+                {
+                    "prepare": id,
+                    "steps": steps,
+                    "stopOnFailure": stop_on_failure,
+                }
+            )
+        )
+        return did_succeeded
+
+    def __run_plan(
+        self, id: str, params: dict[str, Any], wait_delta: timedelta
+    ) -> Optional[list[ActionResponse]]:
+        response = self.__execute_request(
+            {
+                "plan": id,
+                "params": params,
+            },
+            timeout=self.__timeout + wait_delta,
+        )
+        did_succeeded, data = utils.to_action_response(response)
+        if not did_succeeded:
+            return None
+        return [utils.to_action_response(step) for step in data["steps"]]
+
+    def __release_plan(self, id: str) -> None:
+        # forgetting a plan doesn't change the app, so the reads
+        # made so far can still be reused
+        self.__execute_request({"release": id}, is_read=True)
+
+    def batch(self, stop_on_failure: bool = False) -> Batch:
+        """
+        Queues the actions performed via the returned `Batch` & sends all
+        of them in a single request, either when `Batch.flush()` gets called
+        or when the `with` block gets exited.
+
+        Args:
+            stop_on_failure (bool, optional): If `True` then the remaining steps won't be executed
+              once a step fails. Defaults to False.
+
+        Returns:
+            Batch: one should use this to queue the actions
+        """
+        return Batch(
+            on_steps_executed=lambda steps: self.__execute_steps(
+                steps,
+                stop_on_failure=stop_on_failure,
+            ),
+        )
+
+    def prepare(self, stop_on_failure: bool = False) -> Plan:
+        """
+        Records the actions performed via the returned `Plan` as its steps, which are
+        sent to the page only once, so that running them repeatedly sends just the
+        values of the `Param` used in them instead of all the actions.
+
+        Args:
+            stop_on_failure (bool, optional): Same as `driver.batch()`
+
+        Returns:
+            Plan: one should use this to record the actions & run them,
+              `Plan.close()` it once it is no longer needed
+        """
+        return Plan(
+            on_prepared=lambda id, steps: self.__prepare_plan(
+                id,
+                steps,
+                stop_on_failure=stop_on_failure,
+            ),
+            on_run=self.__run_plan,
+            on_released=self.__release_plan,
+        )
 
     def get(self, by: By) -> Element:
         """
@@ -138,14 +490,147 @@ class FluttereniumDriver:
             Element: one should use this as a handle to perform actions
         """
 
-        return Element(
-            on_actions_executed=lambda data: on_element_actions_executed(
-                find_action=by._to_action(),
-                data=data,
-                callback=self.__execute_actions,
-            )
+        return Element(Locator(by._to_action()), self.__execute_element_actions)
+
+    def get_all(self, by: By) -> ElementList:
+        """
+        Finds all the elements matching the `by` in a single walk of the tree.
+
+        Args:
+            by (By): Based on how we need to find the elements
+
+        Returns:
+            ElementList: one element per match, in the order they are present in the tree
+        """
+        return ElementList.find(
+            by,
+            locator=Locator(by._to_find_all_action()),
+            on_actions_executed=self.__execute_element_actions,
+            get=self.get,
+        )
+
+    @contextmanager
+    def record(self, path: str) -> Iterator[Recorder]:
+        """
+        Records every request sent inside the `with` block into the file at `path`,
+        which can be replayed later using `driver.replay()` or a `Replayer`.
+
+        Args:
+            path (str): Path of the file to write into
+
+        Yields:
+            Recorder: one can use this to know how many requests got recorded
+        """
+        recorder = Recorder(path)
+        self.__recorder = recorder
+        try:
+            yield recorder
+        finally:
+            self.__recorder = None
+            recorder.close()
+
+    def replay(
+        self,
+        path: str,
+        kind: ReplayKind = ReplayKind.FAST,
+        iterations: int = 1,
+        batch_size: int = 20,
+    ) -> ReplayReport:
+        """
+        Replays the requests recorded into the file at `path` using `driver.record()`,
+        use a `Replayer` to replay them in multiple sessions at once.
+
+        Args:
+            path (str): Path of the file written while recording
+            kind (ReplayKind, optional): Same as `Replayer.replay()`. Defaults to ReplayKind.FAST.
+            iterations (int, optional): Same as `Replayer.replay()`. Defaults to 1.
+            batch_size (int, optional): Same as `Replayer.replay()`. Defaults to 20.
+
+        Returns:
+            ReplayReport: throughput & latencies of the replayed requests
+        """
+        return Replayer(path).replay(
+            [self], kind=kind, iterations=iterations, batch_size=batch_size
         )
 
+    @contextmanager
+    def measure_frames(self) -> Iterator[FrameStats]:
+        """
+        Records the timings of the frames rendered by the app inside the `with` block,
+        ex: `with driver.measure_frames() as stats:` around a `scroll_by()`.
+
+        Note: The stats are filled only after the `with` block gets exited, except for
+        the `settle_frames` which gets added on every `pump(PumpKind.SETTLE)`.
+
+        Yields:
+            FrameStats: timings of the frames, along with the jank & dropped frames
+        """
+        id = str(uuid.uuid4())
+        did_succeeded, _ = self.__execute_actions(
+            [utils.to_frame_timings_action("start", id)]
+        )
+        if not did_succeeded:
+            raise RuntimeError("Couldn't start recording the frame timings")
+        stats = FrameStats()
+        self.__frame_stats.append(stats)
+        try:
+            yield stats
+        finally:
+            self.__frame_stats.remove(stats)
+            did_succeeded, data = self.__execute_actions(
+                [utils.to_frame_timings_action("stop", id)]
+            )
+            if did_succeeded:
+                stats._update(data["frameTimings"])
+
+    def snapshot(self, chunk_size: int = None) -> Optional[Snapshot]:
+        """
+        Serializes the whole element tree in a single request, so that any number of
+        lookups can be made on it without going to the browser again.
+
+        Note: The snapshot won't reflect the changes made to the page after it was taken.
+
+        Args:
+            chunk_size (int, optional): If specified, the nodes are transferred in
+              chunks of this size, useful for the huge trees. Defaults to all at once.
+
+        Returns:
+            Optional[Snapshot]: `None` if the snapshot couldn't be taken, including when
+              the page got pumped while the chunks were being transferred
+        """
+        return Snapshot.take(self.__execute_actions, chunk_size=chunk_size)
+
+    def wait_until(
+        self,
+        predicate: Callable[[], bool],
+        timeout: timedelta = timedelta(seconds=10),
+    ) -> bool:
+        """
+        Keeps calling the `predicate` till it returns `True` or the `timeout` elapses.
+        Checks are made quickly at first & spaced out gradually, so that the conditions
+        which hold soon are detected without oversleeping, while the long ones won't
+        flood the browser with requests.
+
+        Note: Prefer the `wait_until_*` methods of the `Element` whenever possible,
+        as those conditions are checked inside the page on every frame.
+
+        Args:
+            predicate (Callable[[], bool]): condition to wait for
+            timeout (timedelta, optional): Maximum time to wait. Defaults to 10 seconds.
+
+        Returns:
+            bool: `True` if the condition holds, `False` if timed out
+        """
+        wait_till = datetime.now() + timeout
+        interval = Constants.POLL_MIN_INTERVAL
+        while not predicate():
+            remaining = wait_till - datetime.now()
+            if remaining <= timedelta(seconds=0):
+                return False
+            time.sleep(min(interval, remaining).total_seconds())
+            interval = min(interval * 2, Constants.WAIT_MAX_INTERVAL)
+        return True
+
     def pump(self, kind: PumpKind = PumpKind.NORMAL, delta: timedelta = None) -> bool:
         """
         This will helpful when we want to wait till the frame/frames gets completed
@@ -158,20 +643,10 @@ class FluttereniumDriver:
             bool: `True` if succeeded, else `False`
         """
         actual_delta = delta if delta is not None else kind.get_default_time_delta()
-        (didSucceeded, _) = self.__execute_actions(
-            [
-                utils.to_action(
-                    ActionKind.FRAMEWORK,
-                    {
-                        "type": "pump",
-                        "data": {
-                            "type": kind.value,
-                            "data": {
-                                "milliseconds": actual_delta.total_seconds() * 1000,
-                            },
-                        },
-                    },
-                )
-            ],
+        (didSucceeded, data) = self.__execute_actions(
+            [utils.to_pump_action(kind, actual_delta)],
         )
+        if didSucceeded and kind == PumpKind.SETTLE:
+            for stats in self.__frame_stats:
+                stats.settle_frames += data["settleFrames"]
         return didSucceeded
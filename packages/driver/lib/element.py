@@ -1,19 +1,63 @@
-from typing import Callable, Optional
+import base64
+from datetime import timedelta
+from typing import Any, Callable, Optional
+import uuid
 
-
-from .action import PressKind
+from .action import PressKind, PropertyKind, ScrollKind
 from .finder import By
+from .locator import Locator
+from .snapshot import Snapshot
 from .internal.actions_data import *
 from .internal.typedefs import *
 from .internal.utils import *
 
 
+# Executes the `ActionData` on the element found by the `Locator`
+ElementExecutor = Callable[[Locator, ActionData], ActionResponse]
+
+
 class Element:
+    __slots__ = ("__locator", "__on_actions_executed")
+
     def __init__(
         self,
-        on_actions_executed: Callable[[ActionData], ActionResponse],
+        locator: Locator,
+        on_actions_executed: ElementExecutor,
     ):
-        self.__on_action_executed = on_actions_executed
+        """
+        Handle to perform the actions on the element found by the `locator`, it
+        is immutable & the elements having equal locators which are driven by the
+        same driver are equal to each other.
+        """
+        self.__locator = locator
+        self.__on_actions_executed = on_actions_executed
+
+    @property
+    def locator(self) -> Locator:
+        """
+        Path using which the element is found
+        """
+        return self.__locator
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Element):
+            return NotImplemented
+        return (
+            self.__locator == other.__locator
+            and self.__on_actions_executed == other.__on_actions_executed
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.__locator)
+
+    def __repr__(self) -> str:
+        return f"Element({self.__locator!r})"
+
+    def __on_action_executed(self, data: ActionData) -> ActionResponse:
+        return self.__on_actions_executed(self.__locator, data)
+
+    def __append(self, action: Action) -> "Element":
+        return Element(self.__locator._append(action), self.__on_actions_executed)
 
     def get(self, by: By):
         """
@@ -25,12 +69,31 @@ class Element:
             by (By): Same as `driver.get()`
         """
 
-        return Element(
-            on_actions_executed=lambda data: on_element_actions_executed(
-                find_action=by._to_action(),
-                data=data,
-                callback=self.__on_action_executed,
-            ),
+        return self.__append(by._to_action())
+
+    def cache(self):
+        """
+        Remembers the element in the page once it gets found, so that the
+        actions performed via the returned element will skip finding it again.
+        If the remembered element gets rebuilt or frames get pumped, it will
+        be found again automatically on the next action.
+
+        Returns:
+            Element: same as this, but backed by the remembered element
+        """
+        return self._cache(str(uuid.uuid4()))
+
+    def _cache(self, id: str) -> "Element":
+        return self.__append(
+            utils.to_action(
+                ActionKind.ELEMENT,
+                {
+                    "type": "handle",
+                    "data": {
+                        "id": id,
+                    },
+                },
+            )
         )
 
     def is_valid(self) -> bool:
@@ -92,6 +155,65 @@ class Element:
         )
         return did_succeed
 
+    def scroll_until_visible(
+        self,
+        by: By,
+        step: float = 200,
+        max_scrolls: int = 50,
+        direction: ScrollKind = ScrollKind.FORWARD,
+    ) -> tuple[Optional["Element"], int]:
+        """
+        Keeps scrolling the element till the element found by the `by` inside it
+        becomes visible, the whole loop runs inside the page in a single request.
+
+        Args:
+            by (By): Based on how we need to find the element inside this element
+            step (float, optional): The number of pixels to scroll at a time. Defaults to 200.
+            max_scrolls (int, optional): Maximum number of times to scroll. Defaults to 50.
+            direction (ScrollKind, optional): Which way to scroll. Defaults to ScrollKind.FORWARD.
+
+        Returns:
+            tuple[Optional[Element], int]: the element, already remembered in the page as if
+              `cache()` was called on it, or `None` if it didn't become visible, along with
+              the number of scrolls made. Inside a `Batch` it is always `(None, 0)`, use
+              the `Batch.results` instead.
+        """
+        id = str(uuid.uuid4())
+        did_succeed, data = self.__on_action_executed(
+            {
+                "type": "scroll_until_visible",
+                "data": {
+                    "id": id,
+                    "finder": by._to_finder(),
+                    "step": step,
+                    "max_scrolls": max_scrolls,
+                    "direction": direction.value,
+                },
+            }
+        )
+        if not did_succeed or data is QUEUED_DATA:
+            return (None, 0)
+        element = self.get(by)._cache(id) if data["found"] else None
+        return (element, data["scrolls"])
+
+    def screenshot(self, scale: float = 1.0) -> Optional[bytes]:
+        """
+        Captures only the region the element is painted in, the cropping
+        is done inside the page, so just the element's pixels are transferred.
+
+        Args:
+            scale (float, optional): Multiplied with the device pixel ratio, pass a value
+              below 1 to downscale the image. Defaults to 1.0.
+
+        Returns:
+            Optional[bytes]: the image as PNG, `None` if the element is not painted
+              or inside a `Batch`, use the `Batch.results` instead.
+        """
+        did_succeed, data = self.__on_action_executed(_to_screenshot_action(scale))
+        if not did_succeed or data is QUEUED_DATA:
+            return None
+        return base64.b64decode(data["screenshot"])
+
     def is_visible(self) -> bool:
         """
         Checks whether the element is visible on the screen and returns `True` or `False` accordingly.
@@ -124,6 +246,133 @@ class Element:
         )
         return did_succeed
 
+    def collect(
+        self, properties: list[PropertyKind] = None, by: By = None
+    ) -> list[dict[str, Any]]:
+        """
+        Walks the subtree of the element once & collects the `properties`
+        of the elements inside it, useful for verifying a whole list or table.
+
+        Args:
+            properties (list[PropertyKind], optional): Properties to collect. Defaults to all.
+            by (By, optional): If specified, only the elements matching it are collected.
+              Defaults to the elements rendering any text or having a label.
+
+        Returns:
+            list[dict[str, Any]]: properties of every element keyed by the value of the
+              `PropertyKind`, in the order they are present in the tree. Bounds are
+              `(left, top, right, bottom)` in global coordinates. Empty if the element is not found
+              or inside a `Batch`, use the `Batch.results` instead.
+        """
+        kinds = properties if properties is not None else list(PropertyKind)
+        did_succeed, data = self.__on_action_executed(
+            {
+                "type": "collect",
+                "data": {
+                    "properties": [kind.value for kind in kinds],
+                    "finder": by._to_finder() if by is not None else None,
+                },
+            }
+        )
+        if not did_succeed or data is QUEUED_DATA:
+            return []
+        names = [kind.value for kind in kinds]
+        bounds = PropertyKind.BOUNDS.value
+        results = []
+        for values in data["values"]:
+            result = dict(zip(names, values))
+            if result.get(bounds) is not None:
+                result[bounds] = tuple(result[bounds])
+            results.append(result)
+        return results
+
+    def get_all(self, by: By) -> "ElementList":
+        """
+        Works same as `driver.get_all()`, only difference was driver
+        will start looking from the root element, where as this
+        will start looking from the element on which this was called
+
+        Args:
+            by (By): Same as `driver.get_all()`
+        """
+        return ElementList.find(
+            by,
+            locator=self.__locator._append(by._to_find_all_action()),
+            on_actions_executed=self.__on_actions_executed,
+            get=self.get,
+        )
+
+    def snapshot(self, chunk_size: int = None) -> Optional[Snapshot]:
+        """
+        Works same as `driver.snapshot()`, only difference was driver
+        will serialize from the root element, where as this
+        will serialize the subtree of the element on which this was called
+
+        Args:
+            chunk_size (int, optional): Same as `driver.snapshot()`
+        """
+        return Snapshot.take(self.__on_action_executed, chunk_size=chunk_size)
+
+    def wait_until_valid(self, timeout: timedelta = timedelta(seconds=10)) -> bool:
+        """
+        Waits till the element can be found, the check is made inside the page
+        on every frame, so this returns as soon as the element appears.
+
+        Args:
+            timeout (timedelta, optional): Maximum time to wait. Defaults to 10 seconds.
+
+        Returns:
+            bool: `True` if the element is found, `False` if timed out
+        """
+        did_succeed, _ = self.__on_action_executed(to_wait_until_action(timeout))
+        return did_succeed
+
+    def wait_until_visible(self, timeout: timedelta = timedelta(seconds=10)) -> bool:
+        """
+        Same as `wait_until_valid()`, but waits till the element is visible on the screen.
+
+        Args:
+            timeout (timedelta, optional): Maximum time to wait. Defaults to 10 seconds.
+
+        Returns:
+            bool: `True` if the element is visible, `False` if timed out
+        """
+        did_succeed, _ = self.__on_action_executed(
+            [
+                {
+                    "type": "is_visible",
+                },
+                to_wait_until_action(timeout),
+            ]
+        )
+        return did_succeed
+
+    def wait_until_text(
+        self, text: str, timeout: timedelta = timedelta(seconds=10)
+    ) -> bool:
+        """
+        Same as `wait_until_valid()`, but waits till the text of the element matches the `text`.
+
+        Args:
+            text (str): The text the element should have.
+            timeout (timedelta, optional): Maximum time to wait. Defaults to 10 seconds.
+
+        Returns:
+            bool: `True` if the text matched, `False` if timed out
+        """
+        did_succeed, _ = self.__on_action_executed(
+            [
+                {
+                    "type": "has_text",
+                    "data": {
+                        "text": text,
+                    },
+                },
+                to_wait_until_action(timeout),
+            ]
+        )
+        return did_succeed
+
     def get_preceding_sibling(self, skip_gaps: bool = True):
         """
         This will helpful when we want to get the preceding sibiling of an element
@@ -135,23 +384,19 @@ class Element:
         Returns:
             bool: `True` if succeeded, else `False`
         """
-        return Element(
-            on_actions_executed=lambda data: on_element_actions_executed(
-                find_action=utils.to_action(
-                    ActionKind.FRAMEWORK,
-                    {
-                        "type": "find",
+        return self.__append(
+            utils.to_action(
+                ActionKind.FRAMEWORK,
+                {
+                    "type": "find",
+                    "data": {
+                        "type": "preceding_sibling",
                         "data": {
-                            "type": "preceding_sibling",
-                            "data": {
-                                "skip_gaps": skip_gaps,
-                            },
+                            "skip_gaps": skip_gaps,
                         },
                     },
-                ),
-                data=data,
-                callback=self.__on_action_executed,
-            ),
+                },
+            )
         )
 
     def get_following_sibling(self, skip_gaps: bool = True):
@@ -165,21 +410,97 @@ class Element:
         Returns:
             bool: `True` if succeeded, else `False`
         """
-        return Element(
-            on_actions_executed=lambda data: on_element_actions_executed(
-                find_action=utils.to_action(
-                    ActionKind.FRAMEWORK,
-                    {
-                        "type": "find",
+        return self.__append(
+            utils.to_action(
+                ActionKind.FRAMEWORK,
+                {
+                    "type": "find",
+                    "data": {
+                        "type": "following_sibling",
                         "data": {
-                            "type": "following_sibling",
-                            "data": {
-                                "skip_gaps": skip_gaps,
-                            },
+                            "skip_gaps": skip_gaps,
                         },
                     },
-                ),
-                data=data,
-                callback=self.__on_action_executed,
-            ),
+                },
+            )
         )
+
+
+def _to_screenshot_action(scale: float) -> ActionData:
+    return {
+        "type": "screenshot",
+        "data": {
+            "scale": scale,
+        },
+    }
+
+
+class ElementList(list):
+    def __init__(
+        self,
+        elements: list[Element],
+        locator: Locator,
+        on_actions_executed: ElementExecutor,
+    ):
+        """
+        List of elements which are found together, actions performed
+        on the list are performed on every element in a single request.
+        """
+        super().__init__(elements)
+        self.__locator = locator
+        self.__on_actions_executed = on_actions_executed
+
+    @classmethod
+    def find(
+        cls,
+        by: By,
+        locator: Locator,
+        on_actions_executed: ElementExecutor,
+        get: Callable[[By], Element],
+    ) -> "ElementList":
+        elements = cls([], locator, on_actions_executed)
+        count = len(elements.__execute(None))
+        elements.extend(get(by.at(index)).cache() for index in range(count))
+        return elements
+
+    def __execute(self, data: ActionData) -> list[ActionResponse]:
+        did_succeed, response = self.__on_actions_executed(self.__locator, data)
+        # inside a `Batch` nothing is known until it gets flushed
+        if not did_succeed or response is QUEUED_DATA:
+            return []
+        return [to_action_response(element) for element in response["elements"]]
+
+    def get_text(self) -> list[Optional[str]]:
+        """
+        Same as `Element.get_text()`, but for every element.
+        """
+        return [
+            data.get("text") if did_succeed else None
+            for did_succeed, data in self.__execute(
+                {
+                    "type": "get_text",
+                },
+            )
+        ]
+
+    def screenshot(self, scale: float = 1.0) -> list[Optional[bytes]]:
+        """
+        Same as `Element.screenshot()`, but for every element.
+        """
+        return [
+            base64.b64decode(data["screenshot"]) if did_succeed else None
+            for did_succeed, data in self.__execute(_to_screenshot_action(scale))
+        ]
+
+    def is_visible(self) -> list[bool]:
+        """
+        Same as `Element.is_visible()`, but for every element.
+        """
+        return [
+            did_succeed
+            for did_succeed, _ in self.__execute(
+                {
+                    "type": "is_visible",
+                },
+            )
+        ]
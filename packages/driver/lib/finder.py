@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Any
 
 from .driver import ActionKind
 from .internal import utils
@@ -12,15 +13,27 @@ class FinderKind(Enum):
 
 
 class By:
-    def __init__(self, value: str | int, kind: FinderKind):
+    def __init__(
+        self,
+        value: str | int,
+        kind: FinderKind,
+        index: int = None,
+        scope: dict[str, Any] = None,
+    ):
         """Initializes the By class with a value and a finder type.
 
         Args:
             value (str): The value used for finding elements.
             finder_type (FinderKind): The type of finding mechanism.
+            index (int, optional): If specified, finds the match present at this index
+              instead of the first one. Defaults to None.
+            scope (dict[str, Any], optional): Bounds the part of the tree that is looked up,
+              one should use `scoped()` to create it. Defaults to the whole tree.
         """
         self.value = value
         self.kind = kind
+        self.index = index
+        self.scope = scope
 
     @classmethod
     def label(cls, label: str) -> "By":
@@ -74,17 +87,93 @@ class By:
         """
         return cls(value=value, kind=FinderKind.ICON)
 
-    def _to_action(self):
+    def at(self, index: int) -> "By":
+        """
+        Creates a By instance which finds the match present at the `index`,
+        in the order the elements are present in the tree.
+
+        Args:
+            index (int): Zero based position of the match.
+
+        Returns:
+            By: instance with the same value & FinderKind.
+        """
+        return By(value=self.value, kind=self.kind, index=index, scope=self.scope)
+
+    def scoped(
+        self,
+        visible_only: bool = False,
+        skip_offstage: bool = False,
+        max_depth: int = None,
+        breadth_first: bool = False,
+    ) -> "By":
+        """
+        Creates a By instance which looks up only a part of the tree, so that
+        the elements which can't be the match are not visited at all.
+
+        Args:
+            visible_only (bool, optional): If `True`, skips the subtrees painted outside of
+              the screen along with the ones skipped by `skip_offstage`. Defaults to False.
+            skip_offstage (bool, optional): If `True`, skips the subtrees which are offstage,
+              like the routes covered by other routes. Defaults to False.
+            max_depth (int, optional): If specified, skips the elements deeper than this from
+              where the search starts. Defaults to None.
+            breadth_first (bool, optional): If `True`, looks up the tree level by level, which
+              finds the shallow matches faster & makes `at()` follow the same order.
+              Defaults to False.
+
+        Returns:
+            By: instance with the same value, FinderKind & index.
+        """
+        return By(
+            value=self.value,
+            kind=self.kind,
+            index=self.index,
+            scope={
+                "visible_only": visible_only,
+                "skip_offstage": skip_offstage,
+                "max_depth": max_depth,
+                "breadth_first": breadth_first,
+            },
+        )
+
+    def _to_finder(self):
         name = self.kind.value
+        finder = {
+            "type": name,
+            "data": {
+                name: self.value,
+            },
+        }
+        if self.scope is not None:
+            finder["scope"] = self.scope
+        if self.index is None:
+            return finder
+        return {
+            "type": "nth",
+            "data": {
+                "index": self.index,
+                "finder": finder,
+            },
+        }
+
+    def _to_action(self):
+        return utils.to_action(
+            ActionKind.FRAMEWORK,
+            {
+                "type": "find",
+                "data": self._to_finder(),
+            },
+        )
+
+    def _to_find_all_action(self):
         return utils.to_action(
             ActionKind.FRAMEWORK,
             {
                 "type": "find",
                 "data": {
-                    "type": name,
-                    "data": {
-                        name: self.value,
-                    },
+                    "type": "all",
+                    "data": self._to_finder(),
                 },
             },
         )
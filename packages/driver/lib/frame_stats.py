@@ -0,0 +1,91 @@
+from datetime import timedelta
+import math
+from typing import Any
+
+from .instrumentation import _percentile
+
+
+def _to_milliseconds(duration: timedelta) -> float:
+    return duration.total_seconds() * 1000
+
+
+class FrameStats:
+    def __init__(self):
+        """
+        Timings of the frames rendered by the app while being measured,
+        gets filled only once the measuring is stopped.
+        """
+        self.frame_budget = timedelta(seconds=0)
+        self.build: list[timedelta] = []
+        self.raster: list[timedelta] = []
+        self.total: list[timedelta] = []
+        # frames rendered till the app got settled, by the `pump(PumpKind.SETTLE)`s
+        # made while being measured
+        self.settle_frames = 0
+
+    def _update(self, data: dict[str, Any]) -> None:
+        self.frame_budget = timedelta(microseconds=data["frameBudgetMicroseconds"])
+        self.build = [timedelta(microseconds=frame[0]) for frame in data["frames"]]
+        self.raster = [timedelta(microseconds=frame[1]) for frame in data["frames"]]
+        self.total = [timedelta(microseconds=frame[2]) for frame in data["frames"]]
+
+    @property
+    def frame_count(self) -> int:
+        """
+        Number of frames rendered while being measured
+        """
+        return len(self.total)
+
+    @property
+    def jank_frames(self) -> int:
+        """
+        Number of frames whose build or raster took longer than the `frame_budget`
+        """
+        return sum(
+            1
+            for build, raster in zip(self.build, self.raster)
+            if build > self.frame_budget or raster > self.frame_budget
+        )
+
+    @property
+    def dropped_frames(self) -> int:
+        """
+        Number of vsyncs missed because of the frames taking longer than the `frame_budget`
+        """
+        if not self.frame_budget:
+            return 0
+        # a frame taking upto the budget misses no vsync, while
+        # every budget exceeded after that misses one more
+        return sum(
+            max(0, math.ceil(total / self.frame_budget) - 1) for total in self.total
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Summarizes the timings, durations are in milliseconds.
+
+        Returns:
+            dict[str, Any]: frame count, jank, dropped & settle frames along with the
+              mean, p50, p90, p99 & max of the build, raster & total durations
+        """
+        result = {
+            "frame_count": self.frame_count,
+            "frame_budget": self.frame_budget.total_seconds() * 1000,
+            "jank_frames": self.jank_frames,
+            "dropped_frames": self.dropped_frames,
+            "settle_frames": self.settle_frames,
+        }
+        for name in ("build", "raster", "total"):
+            durations = sorted(getattr(self, name))
+            if not durations:
+                durations = [timedelta(seconds=0)]
+            result[name] = {
+                "mean": _to_milliseconds(
+                    sum(durations, timedelta(seconds=0)) / len(durations)
+                ),
+                "p50": _to_milliseconds(_percentile(durations, 50)),
+                "p90": _to_milliseconds(_percentile(durations, 90)),
+                "p99": _to_milliseconds(_percentile(durations, 99)),
+                "max": _to_milliseconds(durations[-1]),
+            }
+        return result
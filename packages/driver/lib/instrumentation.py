@@ -0,0 +1,236 @@
+from collections import deque
+from datetime import timedelta
+import json
+import threading
+from typing import Any, Callable, Optional, TypeVar
+
+from .action import ActionKind
+
+# Upper bounds (in milliseconds) of the histogram buckets, the last
+# bucket holds everything which is greater than the previous bound
+HISTOGRAM_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class RequestTiming:
+    def __init__(
+        self,
+        action_type: str,
+        finder_kinds: tuple[str, ...],
+        dispatch: timedelta,
+        pickup: timedelta,
+        find: timedelta,
+        execute: timedelta,
+        polls: int,
+        visited_nodes: int = 0,
+        cached: bool = False,
+    ):
+        """
+        Where the time went for a single request.
+
+        Args:
+            action_type (str): Type of the action the request was made for, like `press` or `pump`
+            finder_kinds (tuple[str, ...]): Values of the `FinderKind` used to find the element, in order
+            dispatch (timedelta): Time taken to hand over the request to the page
+            pickup (timedelta): Time taken to receive the response after the request is handed over
+            find (timedelta): Time spent inside the page in finding the elements
+            execute (timedelta): Time spent inside the page in executing the actions
+            polls (int): Number of times the response logs were checked
+            visited_nodes (int, optional): Number of elements looked up inside the page
+              while finding the elements. Defaults to 0.
+            cached (bool, optional): Whether the result of an earlier or a concurrent identical
+              read was reused, so the request never reached the page & the `dispatch` is the
+              time spent waiting for that result. Defaults to False.
+        """
+        self.action_type = action_type
+        self.finder_kinds = finder_kinds
+        self.dispatch = dispatch
+        self.pickup = pickup
+        self.find = find
+        self.execute = execute
+        self.polls = polls
+        self.visited_nodes = visited_nodes
+        self.cached = cached
+
+    @property
+    def key(self) -> str:
+        """
+        Key using which the timings of similar requests are grouped together,
+        the cached ones are kept apart so that they don't skew the others
+        """
+        parts = [self.action_type, ">".join(self.finder_kinds)]
+        if self.cached:
+            parts.append("cached")
+        return ":".join(parts)
+
+    @property
+    def total(self) -> timedelta:
+        return self.dispatch + self.pickup
+
+    @property
+    def overhead(self) -> timedelta:
+        """
+        Time which is not spent inside the page, such as the WebDriver transport & polling
+        """
+        return self.total - self.find - self.execute
+
+
+class StartupTiming:
+    def __init__(self, launch: timedelta, page_load: timedelta, ready: timedelta):
+        """
+        Where the time went while starting the app.
+
+        Args:
+            launch (timedelta): Time taken to launch the browser, zero if it was reused
+            page_load (timedelta): Time taken by the browser to load the page
+            ready (timedelta): Time taken by `Flutterenium` to get ready after the page got loaded
+        """
+        self.launch = launch
+        self.page_load = page_load
+        self.ready = ready
+
+    @property
+    def total(self) -> timedelta:
+        return self.launch + self.page_load + self.ready
+
+
+def _describe(actions: list[dict[str, Any]]) -> tuple[str, tuple[str, ...]]:
+    action_type = "find"
+    finder_kinds = []
+    for action in actions:
+        data = action["data"]
+        if action["type"] == ActionKind.FRAMEWORK.value and data["type"] == "find":
+            finder_kinds.append(data["data"]["type"])
+        else:
+            action_type = data["type"]
+    return action_type, tuple(finder_kinds)
+
+
+T = TypeVar("T")
+
+
+def _percentile(sorted_values: list[T], percentile: float) -> T:
+    # nearest-rank method, `sorted_values` should have atleast one value
+    index = max(0, int(round(percentile / 100 * len(sorted_values))) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class Instrumentation:
+    def __init__(
+        self,
+        on_request_timed: Optional[Callable[[RequestTiming], None]] = None,
+        max_timings: int = 100000,
+    ):
+        """
+        Collects the `RequestTiming` of every request made by the driver
+        it is passed to.
+
+        Args:
+            on_request_timed (Callable[[RequestTiming], None], optional): Called with the timing
+              as soon as a request completes. Defaults to None.
+            max_timings (int, optional): Maximum number of timings to keep, once exceeded
+              the oldest ones will be dropped. Defaults to 100000.
+        """
+        self.__on_request_timed = on_request_timed
+        self.__lock = threading.Lock()
+        # oldest timings fall off the other end in constant time
+        self.__timings: deque[RequestTiming] = deque(maxlen=max_timings)
+
+    @property
+    def timings(self) -> list[RequestTiming]:
+        with self.__lock:
+            return list(self.__timings)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__timings.clear()
+
+    def _record(
+        self,
+        request: dict[str, Any],
+        response: dict[str, Any],
+        dispatch: timedelta,
+        pickup: timedelta,
+        polls: int,
+        cached: bool = False,
+    ) -> None:
+        if "prepare" in request:
+            action_type, finder_kinds = "prepare", ()
+        elif "plan" in request:
+            action_type, finder_kinds = "plan", ()
+        elif "release" in request:
+            action_type, finder_kinds = "release", ()
+        elif "steps" in request:
+            action_type, finder_kinds = "batch", ()
+        else:
+            action_type, finder_kinds = _describe(request["actions"])
+        metrics = response.get("metrics") or {}
+        timing = RequestTiming(
+            action_type=action_type,
+            finder_kinds=finder_kinds,
+            dispatch=dispatch,
+            pickup=pickup,
+            find=timedelta(microseconds=metrics.get("findMicroseconds", 0)),
+            execute=timedelta(microseconds=metrics.get("executeMicroseconds", 0)),
+            polls=polls,
+            visited_nodes=metrics.get("visitedNodes", 0),
+            cached=cached,
+        )
+        with self.__lock:
+            self.__timings.append(timing)
+        if self.__on_request_timed is not None:
+            self.__on_request_timed(timing)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Summarizes the timings grouped by their `key`. Durations are in milliseconds.
+
+        Returns:
+            dict[str, dict[str, Any]]: for every key, the count, polls, visited nodes & for each of the
+              `total`, `find`, `execute` & `overhead` durations their mean, percentiles
+              & a histogram whose buckets are bounded by `HISTOGRAM_BOUNDS`
+        """
+        groups: dict[str, list[RequestTiming]] = {}
+        for timing in self.timings:
+            groups.setdefault(timing.key, []).append(timing)
+
+        result = {}
+        for key, timings in groups.items():
+            summary = {
+                "count": len(timings),
+                "polls": sum(timing.polls for timing in timings),
+                "visited_nodes": sum(timing.visited_nodes for timing in timings),
+            }
+            for name in ("total", "find", "execute", "overhead"):
+                values = sorted(
+                    getattr(timing, name).total_seconds() * 1000 for timing in timings
+                )
+                histogram = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+                for value in values:
+                    index = 0
+                    while index < len(HISTOGRAM_BOUNDS) and value > HISTOGRAM_BOUNDS[index]:
+                        index += 1
+                    histogram[index] += 1
+                summary[name] = {
+                    "mean": sum(values) / len(values),
+                    "p50": _percentile(values, 50),
+                    "p90": _percentile(values, 90),
+                    "p99": _percentile(values, 99),
+                    "max": values[-1],
+                    "histogram": histogram,
+                }
+            result[key] = summary
+        return result
+
+    def export(self, path: str) -> None:
+        """
+        Writes the `summary()` as JSON into the file at `path`
+        """
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "histogramBounds": HISTOGRAM_BOUNDS,
+                    "summary": self.summary(),
+                },
+                file,
+                indent=2,
+            )
@@ -1,15 +1,18 @@
+from typing import Iterable
+
 from ..action import ActionKind
 from . import utils
 
+_ACTION_KIND_VALUES = frozenset(kind.value for kind in ActionKind)
+
 
 class ElementActionsData(list):
-    def __init__(self, arg):
+    def __init__(self, actions: Iterable = ()):
         super().__init__()
-        self.append(arg)
+        self.extend(actions)
 
     def __transform(self, item):
-        enum_values = [kind.value for kind in ActionKind]
-        if item.get("type", None) in enum_values:
+        if item.get("type", None) in _ACTION_KIND_VALUES:
             return item
         return utils.to_action(ActionKind.ELEMENT, item)
 
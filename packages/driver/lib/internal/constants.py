@@ -1,7 +1,15 @@
+from datetime import timedelta
+
+
 class Constants:
     FLUTTERENIUM_READY_NAME = 'ext.flutterenium.ready'
     FLUTTERENIUM_REQUEST_EVENT_NAME = 'ext.flutterenium.request'
     FLUTTERENIUM_RESPONSE_EVENT_NAME = 'ext.flutterenium.response'
 
     FLUTTERENIUM_DRIVER_READY_NAME = 'ext_flutterenium_driver_ready'
-    FLUTTERENIUM_DRIVER_EVENT_LOGS_NAME = 'ext_flutterenium_driver_logs'
\ No newline at end of file
+    FLUTTERENIUM_DRIVER_EVENT_LOGS_NAME = 'ext_flutterenium_driver_logs'
+    FLUTTERENIUM_DRIVER_BINDING_NAME = 'ext_flutterenium_driver_binding'
+
+    POLL_MIN_INTERVAL = timedelta(milliseconds=1)
+    POLL_MAX_INTERVAL = timedelta(milliseconds=50)
+    WAIT_MAX_INTERVAL = timedelta(milliseconds=500)
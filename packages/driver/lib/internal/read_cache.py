@@ -0,0 +1,104 @@
+from concurrent.futures import Future
+from datetime import timedelta
+import threading
+import time
+from typing import Callable, Hashable, Optional
+
+from .typedefs import *
+
+# Element actions which only read the element, so their results
+# can be shared as long as the page doesn't change
+READ_ONLY_ACTION_TYPES = frozenset({"get_text", "is_visible", "has_text", "collect"})
+
+
+def is_read_only(data: ActionData) -> bool:
+    """
+    Use this to know whether the `data` performed on an element only reads it
+
+    Args:
+        data (ActionData): actions performed on the element, `None` only finds it
+
+    Returns:
+        bool: `True` if none of the actions changes the page
+    """
+    if data is None:
+        return True
+    actions = data if isinstance(data, list) else [data]
+    return all(action.get("type") in READ_ONLY_ACTION_TYPES for action in actions)
+
+
+class ReadCache:
+    def __init__(self, ttl: Optional[timedelta]):
+        """
+        Shares the results of the reads made on the elements. Identical reads
+        made at the same time from different threads are sent only once, while
+        the results the page emitted when it was idle are reused for the `ttl`
+        or till the cache gets cleared, whichever happens first. `None` or zero
+        `ttl` reuses nothing once the read completes.
+        """
+        self.__ttl = ttl.total_seconds() if ttl is not None else 0
+        self.__lock = threading.Lock()
+        # bumped on every clear, so that the reads which were in flight
+        # while the page got changed won't be remembered
+        self.__generation = 0
+        self.__results: dict[Hashable, tuple[float, ActionResponse]] = {}
+        self.__in_flight: dict[Hashable, Future] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        fetch: Callable[[], tuple[ActionResponse, bool]],
+    ) -> tuple[ActionResponse, bool]:
+        """
+        Gets the result of the read identified by the `key`, by calling the `fetch`
+        only if it is neither remembered nor being fetched by any other thread.
+
+        Args:
+            key (Hashable): identifies the read
+            fetch (Callable[[], tuple[ActionResponse, bool]]): makes the read, along with
+              whether the page was idle when it emitted the result
+
+        Returns:
+            tuple[ActionResponse, bool]: result of the read & whether it was shared
+              instead of being fetched by this call
+        """
+        with self.__lock:
+            result = self.__results.get(key)
+            if result is not None:
+                expires_at, response = result
+                if time.perf_counter() < expires_at:
+                    return (response, True)
+                del self.__results[key]
+            future = self.__in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self.__in_flight[key] = future
+            generation = self.__generation
+        if not is_owner:
+            return (future.result(), True)
+        try:
+            response, is_idle = fetch()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self.__lock:
+                if self.__in_flight.get(key) is future:
+                    del self.__in_flight[key]
+        with self.__lock:
+            if is_idle and self.__ttl > 0 and generation == self.__generation:
+                self.__results[key] = (time.perf_counter() + self.__ttl, response)
+        future.set_result(response)
+        return (response, False)
+
+    def clear(self) -> None:
+        """
+        Forgets all the results, should be called whenever the page might get changed.
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.__results.clear()
+            # reads made from now on shouldn't wait
+            # for the ones made before the change
+            self.__in_flight.clear()
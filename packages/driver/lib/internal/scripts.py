@@ -0,0 +1,140 @@
+class Scripts:
+    """
+    JavaScript snippets the driver executes inside the page. Every
+    snippet reads its arguments at the top in the order they need
+    to be passed.
+    """
+
+    WAIT_TILL_READY = """
+        const readyEventName = arguments[0];
+        const driverReadyName = arguments[1];
+        const callback = arguments[arguments.length - 1];
+        if (window[readyEventName] === true) {
+            // `Flutterenium` got ready even before
+            // the driver started waiting for it
+            window[driverReadyName] = true;
+            callback();
+            return;
+        }
+        window.addEventListener(readyEventName, (event) => {
+            window[driverReadyName] = true;
+            callback();
+        }, {once: true});
+    """
+
+    INSTALL_EVENT_LOGS = """
+        const eventLogsName = arguments[0];
+        const responseEventName = arguments[1];
+        const eventLogsLimit = arguments[2];
+        if (window[eventLogsName] !== undefined) {
+            // listener is still alive from an earlier install
+            return;
+        }
+        // All the event log responses happens via the driver
+        // will be flushed into the below map, & will be removed
+        // as soon as the driver reads them. Responses no one is
+        // waiting for are evicted in the order they arrived,
+        // so that the map never grows beyond the limit.
+        window[eventLogsName] = new Map();
+        window.addEventListener(responseEventName, (event) => {
+            const {id, ...rest} = event.detail;
+            const eventLogs = window[eventLogsName];
+            eventLogs.set(id, rest);
+            while (eventLogs.size > eventLogsLimit) {
+                eventLogs.delete(eventLogs.keys().next().value);
+            }
+        });
+    """
+
+    INSTALL_RESPONSE_BINDING = """
+        const bindingName = arguments[0];
+        const responseEventName = arguments[1];
+        const installedName = `${bindingName}_installed`;
+        if (window[installedName] === true) {
+            // listener is still alive from an earlier install
+            return;
+        }
+        window[installedName] = true;
+        // The binding is added by the driver through the DevTools protocol,
+        // calling it pushes the response straight to the driver, so nothing
+        // needs to be kept in the page.
+        window.addEventListener(responseEventName, (event) => {
+            window[bindingName](JSON.stringify(event.detail));
+        });
+    """
+
+    IS_READY = """
+        const driverReadyName = arguments[0];
+        return window[driverReadyName] === true;
+    """
+
+    GET_EVENT_LOGS_SIZE = """
+        const eventLogsName = arguments[0];
+        return window[eventLogsName].size;
+    """
+
+    DISPATCH_AND_WAIT = """
+        const id = arguments[0];
+        const requestEventName = arguments[1];
+        const responseEventName = arguments[2];
+        const eventLogsName = arguments[3];
+        const request = arguments[4];
+        const timeoutMilliseconds = arguments[5];
+        const callback = arguments[arguments.length - 1];
+        // Listener should be in place before dispatching the request,
+        // as the response can be emitted synchronously.
+        const onResponse = (event) => {
+            const {id: responseId, ...rest} = event.detail;
+            if (responseId !== id) {
+                return;
+            }
+            clearTimeout(timer);
+            window.removeEventListener(responseEventName, onResponse);
+            // Response is consumed here, so there is no need
+            // for the event logs to hold it anymore.
+            window[eventLogsName].delete(id);
+            callback(rest);
+        };
+        const timer = setTimeout(() => {
+            window.removeEventListener(responseEventName, onResponse);
+            callback(null);
+        }, timeoutMilliseconds);
+        window.addEventListener(responseEventName, onResponse);
+        window.dispatchEvent(
+            new CustomEvent(
+                requestEventName,
+                {
+                    detail: {
+                        "id": id,
+                        ...request
+                    }
+                }
+            )
+        );
+    """
+
+    DISPATCH = """
+        const id = arguments[0];
+        const requestEventName = arguments[1];
+        const request = arguments[2];
+        window.dispatchEvent(
+            new CustomEvent(
+                requestEventName,
+                {
+                    detail: {
+                        "id": id,
+                        ...request
+                    }
+                }
+            )
+        );
+    """
+
+    POLL_RESPONSE = """
+        const id = arguments[0];
+        const eventLogsName = arguments[1];
+        const eventLogs = window[eventLogsName];
+        const response = eventLogs.get(id);
+        eventLogs.delete(id);
+        return response;
+    """
@@ -0,0 +1,119 @@
+from contextlib import contextmanager
+import threading
+from typing import Any, Iterator, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class _Tabs:
+    def __init__(self):
+        # WebDriver executes the commands on whichever window is focused,
+        # so focusing a tab & running the command on it should be atomic
+        self.lock = threading.Lock()
+        self.focused: Optional[str] = None
+        # script timeout belongs to the browser session, not to a tab
+        self.script_timeout: Optional[float] = None
+
+
+class TabWebDriver:
+    def __init__(
+        self,
+        web_driver: WebDriver,
+        tabs: _Tabs = None,
+        handle: str = None,
+    ):
+        """
+        Routes the commands used by the driver to a single tab of a browser which
+        is shared among multiple drivers. The tab gets focused only when the last
+        command went to some other tab, so a browser with a single tab never pays
+        for it.
+
+        Args:
+            web_driver (WebDriver): Browser the tab belongs to
+            tabs (_Tabs, optional): Shared by all the tabs of the browser. Defaults to a new one.
+            handle (str, optional): Window handle of the tab. Defaults to the focused one,
+              which is looked up only when a second tab gets opened.
+        """
+        self.__web_driver = web_driver
+        self.__tabs = tabs if tabs is not None else _Tabs()
+        self.__handle = handle
+
+    @contextmanager
+    def __focus(self) -> Iterator[WebDriver]:
+        with self.__tabs.lock:
+            if self.__handle is not None and self.__tabs.focused != self.__handle:
+                self.__web_driver.switch_to.window(self.__handle)
+                self.__tabs.focused = self.__handle
+            yield self.__web_driver
+
+    def new_tab(self) -> "TabWebDriver":
+        """
+        Opens a new blank tab in the same browser.
+
+        Returns:
+            TabWebDriver: routes the commands to the new tab
+        """
+        with self.__tabs.lock:
+            if self.__handle is None:
+                # this is the first tab, so it is still the focused one
+                self.__handle = self.__web_driver.current_window_handle
+                self.__tabs.focused = self.__handle
+        with self.__focus() as web_driver:
+            web_driver.switch_to.new_window("tab")
+            handle = web_driver.current_window_handle
+            self.__tabs.focused = handle
+        return TabWebDriver(self.__web_driver, self.__tabs, handle)
+
+    @property
+    def capabilities(self) -> dict:
+        return self.__web_driver.capabilities
+
+    @property
+    def current_window_handle(self) -> str:
+        if self.__handle is not None:
+            return self.__handle
+        return self.__web_driver.current_window_handle
+
+    @property
+    def current_url(self) -> str:
+        with self.__focus() as web_driver:
+            return web_driver.current_url
+
+    def get(self, url: str) -> None:
+        with self.__focus() as web_driver:
+            web_driver.get(url)
+
+    def refresh(self) -> None:
+        with self.__focus() as web_driver:
+            web_driver.refresh()
+
+    def ensure_script_timeout(self, time_to_wait: float) -> None:
+        """
+        Makes sure the script timeout of the browser is atleast `time_to_wait`
+        seconds, it is shared by all the tabs, so a tab never shortens the one
+        some other tab is relying on.
+        """
+        with self.__tabs.lock:
+            current = self.__tabs.script_timeout
+            if current is not None and current >= time_to_wait:
+                return
+            self.__web_driver.set_script_timeout(time_to_wait)
+            self.__tabs.script_timeout = time_to_wait
+
+    def execute_script(self, script: str, *args) -> Any:
+        with self.__focus() as web_driver:
+            return web_driver.execute_script(script, *args)
+
+    def execute_async_script(self, script: str, *args) -> Any:
+        with self.__focus() as web_driver:
+            return web_driver.execute_async_script(script, *args)
+
+    def close(self) -> None:
+        with self.__focus() as web_driver:
+            web_driver.close()
+            # no tab is focused once the current one gets closed
+            self.__tabs.focused = None
+
+    def quit(self) -> None:
+        with self.__tabs.lock:
+            self.__web_driver.quit()
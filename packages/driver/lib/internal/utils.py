@@ -1,8 +1,14 @@
-from typing import Any, Callable
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any
 
-from .actions_data import ElementActionsData
 from .typedefs import *
 from ..driver import ActionKind
+from ..action import PumpKind
+
+# Data of the actions which are queued into a `Batch`, the actual
+# one will be known only once the batch gets flushed
+QUEUED_DATA = MappingProxyType({})
 
 
 def to_action(kind: ActionKind, data: dict[str, Any]) -> dict[str, Any]:
@@ -19,16 +25,147 @@ def to_action(kind: ActionKind, data: dict[str, Any]) -> dict[str, Any]:
     return {"type": kind.value, "data": data}
 
 
-def on_element_actions_executed(
-    find_action: Action,
-    data: ActionData,
-    callback: Callable[[ElementActionsData], ActionResponse],
-) -> ActionResponse:
-    actions = ElementActionsData(find_action)
-    if data is not None:
-        if isinstance(data, list):
-            actions.extend(data)
-        else:
-            actions.append(data)
+def to_pump_action(kind: PumpKind, delta: timedelta) -> dict[str, Any]:
+    """
+    Use this to create an action which pumps the frames
+
+    Args:
+        kind (PumpKind): how the frames need to be pumped
+        delta (timedelta): maximum time the pumping can take
+
+    Returns:
+        dict[str, Any]: an action which pumps the frames as per the specified kind
+    """
+    return to_action(
+        ActionKind.FRAMEWORK,
+        {
+            "type": "pump",
+            "data": {
+                "type": kind.value,
+                "data": {
+                    "milliseconds": delta.total_seconds() * 1000,
+                },
+            },
+        },
+    )
+
+
+def to_wait_until_action(timeout: timedelta) -> dict[str, Any]:
+    """
+    Use this to create an action which makes the other actions of the
+    request to be re-executed on every frame till all of them succeed
+
+    Args:
+        timeout (timedelta): maximum time to keep re-executing
+
+    Returns:
+        dict[str, Any]: an action which waits as per the specified timeout
+    """
+    return to_action(
+        ActionKind.FRAMEWORK,
+        {
+            "type": "wait_until",
+            "data": {
+                "milliseconds": timeout.total_seconds() * 1000,
+            },
+        },
+    )
+
+
+def to_snapshot_action(
+    id: str, offset: int, limit: int = None, release: bool = False
+) -> dict[str, Any]:
+    """
+    Use this to create an action which serializes the element tree
+
+    Args:
+        id (str): unique id, against which the page keeps the rest of the nodes
+        offset (int): position of the first node to be returned
+        limit (int, optional): maximum number of nodes to be returned. Defaults to all.
+        release (bool, optional): If `True`, the page forgets the rest of the nodes
+          instead of returning any. Defaults to False.
+
+    Returns:
+        dict[str, Any]: an action which takes the snapshot as per the specified chunk
+    """
+    return to_action(
+        ActionKind.FRAMEWORK,
+        {
+            "type": "snapshot",
+            "data": {
+                "id": id,
+                "offset": offset,
+                "limit": limit,
+                "release": release,
+            },
+        },
+    )
+
+
+def to_frame_timings_action(kind: str, id: str) -> dict[str, Any]:
+    """
+    Use this to create an action which starts or stops recording the frame timings
+
+    Args:
+        kind (str): either "start" or "stop"
+        id (str): unique id, using which the stop is matched with its start
+
+    Returns:
+        dict[str, Any]: an action which starts or stops the recording
+    """
+    return to_action(
+        ActionKind.FRAMEWORK,
+        {
+            "type": "frame_timings",
+            "data": {
+                "type": kind,
+                "data": {
+                    "id": id,
+                },
+            },
+        },
+    )
+
+
+def get_wait_delta(actions: list[dict[str, Any]]) -> timedelta:
+    """
+    Use this to know how long the `actions` can keep waiting inside the page
+
+    Args:
+        actions (list[dict[str, Any]]): actions which are about to be executed
+
+    Returns:
+        timedelta: sum of the durations all the waiting actions can take
+    """
+    milliseconds = 0
+    for action in actions:
+        if action["type"] != ActionKind.FRAMEWORK.value:
+            continue
+        data = action["data"]
+        match data["type"]:
+            case "pump":
+                milliseconds += data["data"]["data"]["milliseconds"]
+            case "wait_until":
+                milliseconds += data["data"]["milliseconds"]
+    return timedelta(milliseconds=milliseconds)
+
+
+def to_action_response(response: dict[str, Any]) -> ActionResponse:
+    """
+    Use this to convert the response emitted by `Flutterenium` into an `ActionResponse`
+
+    Args:
+        response (dict[str, Any]): response containing whether it is succeeded & the data
+
+    Returns:
+        ActionResponse: the data will be present only if it is succeeded
+    """
+    did_succeeded = bool(response["didSucceeded"])
+    data = None
+    if did_succeeded:
+        data = response.get("data")
+
+    if data:
+        data = dict(data)
+    return (did_succeeded, data)
 
-    return callback(actions)
@@ -0,0 +1,78 @@
+import json
+from typing import Any, Optional
+
+from .internal.actions_data import *
+from .internal.typedefs import *
+
+
+class Locator:
+    __slots__ = ("__parent", "__actions", "__keys", "__hash")
+
+    def __init__(self, action: Action, parent: Optional["Locator"] = None):
+        """
+        Path to an element, i.e. the actions which find it one after the other
+        starting from the root. It is immutable & the same path built twice is
+        equal to each other, so it can be compared, used as a key or in a set.
+        One should use `Element.locator` instead of creating it.
+
+        Args:
+            action (Action): the last action of the path
+            parent (Locator, optional): path the `action` continues from. Defaults to the root.
+        """
+        # key is the action in a canonical form, so that
+        # the equal actions built differently match too
+        key = json.dumps(action, sort_keys=True, separators=(",", ":"))
+        self.__parent = parent
+        if parent is None:
+            self.__actions: tuple[Action, ...] = (action,)
+            self.__keys: tuple[str, ...] = (key,)
+        else:
+            self.__actions = parent.__actions + (action,)
+            self.__keys = parent.__keys + (key,)
+        self.__hash = hash(self.__keys)
+
+    @property
+    def parent(self) -> Optional["Locator"]:
+        """
+        Path without the last action, `None` if this starts from the root.
+        """
+        return self.__parent
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Locator):
+            return NotImplemented
+        return self.__hash == other.__hash and self.__keys == other.__keys
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __repr__(self) -> str:
+        return f"Locator({' > '.join(_describe(action) for action in self.__actions)})"
+
+    def _append(self, action: Action) -> "Locator":
+        return Locator(action, parent=self)
+
+    def _to_actions(self, data: ActionData) -> ElementActionsData:
+        actions = ElementActionsData(self.__actions)
+        if data is not None:
+            actions.extend(data if isinstance(data, list) else [data])
+        return actions
+
+
+def _describe(action: Action) -> str:
+    data = action["data"]
+    if data["type"] != "find":
+        return data["type"]
+    finder = data["data"]
+    suffix = ""
+    if finder["type"] == "all":
+        finder = finder["data"]
+        suffix = "[*]"
+    elif finder["type"] == "nth":
+        suffix = f"[{finder['data']['index']}]"
+        finder = finder["data"]["finder"]
+    values = ", ".join(f"{name}={value!r}" for name, value in finder["data"].items())
+    return f"{finder['type']}({values}){suffix}"
@@ -0,0 +1,129 @@
+from datetime import timedelta
+from typing import Any, Callable, Optional
+import uuid
+
+from .action import PumpKind
+from .batch import Batch
+from .element import Element
+from .finder import By
+from .internal.typedefs import *
+from .internal.utils import *
+
+
+class Param(dict):
+    def __init__(self, name: str):
+        """
+        Placeholder for a value which will be known only while running a `Plan`,
+        can be used in place of any value passed while recording the plan,
+        ex: `plan.get(By.text("Enter here")).set_text(Param("text"))`.
+
+        Args:
+            name (str): name with which the value is passed to `Plan.run()`
+        """
+        super().__init__({"$param": name})
+        self.name = name
+
+
+class Plan:
+    def __init__(
+        self,
+        on_prepared: Callable[[str, list[list[Action]]], bool],
+        on_run: Callable[
+            [str, dict[str, Any], timedelta], Optional[list[ActionResponse]]
+        ],
+        on_released: Callable[[str], None],
+    ):
+        """
+        Steps which are recorded once & sent to the page only while preparing,
+        every run after that sends just the id of the plan & the values of
+        the `Param` used in it.
+        """
+        self.__id = str(uuid.uuid4())
+        self.__on_prepared = on_prepared
+        self.__on_run = on_run
+        self.__on_released = on_released
+        self.__steps: list[list[Action]] = []
+        self.__wait_delta = timedelta(seconds=0)
+        self.__is_prepared = False
+        self.__batch = Batch(on_steps_executed=self.__record)
+
+    def __enter__(self) -> "Plan":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.prepare()
+
+    def __record(self, steps: list[list[Action]]) -> list[ActionResponse]:
+        self.__steps.extend(steps)
+        self.__wait_delta += sum(
+            (get_wait_delta(step) for step in steps), timedelta(seconds=0)
+        )
+        self.__is_prepared = False
+        return [(True, {})] * len(steps)
+
+    def get(self, by: By) -> Element:
+        """
+        Works same as `Batch.get()`, only difference was the actions performed
+        on the returned element will be recorded as the steps of this plan.
+
+        Args:
+            by (By): Same as `driver.get()`
+        """
+        return self.__batch.get(by)
+
+    def pump(self, kind: PumpKind = PumpKind.NORMAL, delta: timedelta = None) -> None:
+        """
+        Records a step which works same as `driver.pump()`
+        """
+        self.__batch.pump(kind, delta)
+
+    def prepare(self) -> bool:
+        """
+        Sends the recorded steps to the page, so that they are parsed only once.
+        Gets called automatically when the `with` block gets exited or on the first run.
+
+        Returns:
+            bool: `True` if succeeded, else `False`
+        """
+        self.__batch.flush()
+        self.__is_prepared = self.__on_prepared(self.__id, self.__steps)
+        return self.__is_prepared
+
+    def run(self, **params: Any) -> list[ActionResponse]:
+        """
+        Executes the recorded steps in a single request.
+
+        Args:
+            params: value for every `Param` used while recording, by its name
+
+        Returns:
+            list[ActionResponse]: response of every step, in the order they got recorded
+        """
+        self.__batch.flush()
+        if not self.__is_prepared:
+            self.prepare()
+        results = self.__on_run(self.__id, params, self.__wait_delta)
+        if results is None:
+            # page forgets the plans whenever the app gets reloaded or once
+            # too many of them are prepared, so prepare it again & give it
+            # one more try
+            self.prepare()
+            results = self.__on_run(self.__id, params, self.__wait_delta)
+        if results is None:
+            results = []
+        # steps which are not executed because of an earlier
+        # failure will be treated as failed ones
+        results.extend([(False, None)] * (len(self.__steps) - len(results)))
+        return results
+
+    def close(self) -> None:
+        """
+        Forgets the plan in the page, running it again after this prepares it again.
+        Page keeps only the recently used plans, so the ones which are never closed
+        get forgotten eventually, still one should close the plans not needed anymore.
+        """
+        if not self.__is_prepared:
+            return
+        self.__is_prepared = False
+        self.__on_released(self.__id)
@@ -0,0 +1,157 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from datetime import timedelta
+import queue
+import threading
+from typing import Iterator, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from .driver import BrowserKind, FluttereniumDriver
+
+
+class DriverPool:
+    def __init__(
+        self,
+        url: str,
+        size: int,
+        browser_kind: BrowserKind = BrowserKind.CHROME,
+        **kwargs,
+    ):
+        """
+        Launches `size` browsers in parallel & opens the `url` in each one of
+        them, so that they are warm by the time they get leased.
+
+        Args:
+            url (str): Path of the website every driver should be opened with
+            size (int): Number of browsers to keep in the pool
+            browser_kind (BrowserKind, optional): Browser that need to be launched. Defaults to BrowserKind.CHROME.
+            kwargs: passed as is to the `FluttereniumDriver()`
+        """
+        if size <= 0:
+            raise ValueError("Pool size should be greater than zero")
+        self.__url = url
+        self.__browser_kind = browser_kind
+        self.__kwargs = kwargs
+        self.__lock = threading.Lock()
+        self.__drivers: set[FluttereniumDriver] = set()
+        # `None` stands for a driver which couldn't be replaced,
+        # a new one gets launched whenever it is leased
+        self.__idle_drivers: queue.Queue[Optional[FluttereniumDriver]] = queue.Queue()
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(self.__launch) for _ in range(size)]
+        for future in futures:
+            if future.exception() is not None:
+                # browsers which did launch are owned by the pool
+                # by now, so closing it quits all of them
+                self.close()
+                raise future.exception()
+        for future in futures:
+            self.__idle_drivers.put(future.result())
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of drivers owned by the pool, including the leased ones.
+        """
+        with self.__lock:
+            return len(self.__drivers)
+
+    def __launch(self) -> FluttereniumDriver:
+        driver = FluttereniumDriver(self.__browser_kind, **self.__kwargs)
+        try:
+            driver.open(self.__url)
+        except Exception:
+            driver.close(with_browser=True)
+            raise
+        with self.__lock:
+            self.__drivers.add(driver)
+        return driver
+
+    def __discard(self, driver: FluttereniumDriver) -> None:
+        with self.__lock:
+            if driver not in self.__drivers:
+                return
+            self.__drivers.discard(driver)
+        try:
+            driver.close(with_browser=True)
+        except WebDriverException:
+            # browser might be crashed already, so nothing to close
+            pass
+
+    def __reset(self, driver: FluttereniumDriver) -> FluttereniumDriver:
+        try:
+            driver.reload_app(self.__url)
+            if driver.is_ready():
+                return driver
+        except (WebDriverException, TimeoutError):
+            pass
+        # browser got crashed or the app is no longer responding,
+        # so replace it with a fresh one
+        self.__discard(driver)
+        return self.__launch()
+
+    def __release(self, driver: FluttereniumDriver) -> None:
+        replacement = None
+        try:
+            replacement = self.__reset(driver)
+        except BaseException:
+            self.__discard(driver)
+            raise
+        finally:
+            # slot is given back even if neither the driver could be reset
+            # nor a new one could be launched, so the pool never shrinks
+            self.__idle_drivers.put(replacement)
+
+    @contextmanager
+    def lease(self, timeout: timedelta = None) -> Iterator[FluttereniumDriver]:
+        """
+        Leases an idle driver for the duration of the `with` block. Once the
+        block exits the app gets reloaded, so that the next lease starts from a
+        clean state. If the browser got crashed it will be replaced.
+
+        Args:
+            timeout (timedelta, optional): Maximum time to wait for a driver to become idle.
+              If `None` then waits forever. Defaults to None.
+
+        Raises:
+            TimeoutError: if no driver becomes idle within the `timeout`
+            Exception: if neither the driver could be reset nor replaced, only when
+              the `with` block itself didn't raise. The pool keeps its size regardless.
+        """
+        try:
+            driver = self.__idle_drivers.get(
+                timeout=timeout.total_seconds() if timeout is not None else None
+            )
+        except queue.Empty:
+            raise TimeoutError(f"No driver became idle within {timeout}")
+        if driver is None:
+            try:
+                driver = self.__launch()
+            except BaseException:
+                self.__idle_drivers.put(None)
+                raise
+        try:
+            yield driver
+        except BaseException:
+            # error raised inside the `with` block is the one the caller
+            # needs to see, so the one of the reset is not let to hide it
+            with suppress(Exception):
+                self.__release(driver)
+            raise
+        self.__release(driver)
+
+    def close(self) -> None:
+        """
+        Closes all the browsers owned by the pool.
+        """
+        with self.__lock:
+            drivers = list(self.__drivers)
+        for driver in drivers:
+            self.__discard(driver)
@@ -0,0 +1,219 @@
+"""
+pytest plugin of `Flutterenium`, it is opt-in so that the test runs which don't
+drive the app never load it. Enable it via `pytest -p lib.pytest_plugin` or by
+adding `pytest_plugins = ["lib.pytest_plugin"]` to the root `conftest.py`. It provides
+
+- `flutterenium_session`: a driver which lives for the whole session, with
+  `pytest-xdist` it lives for the whole worker as every worker is a session.
+- `flutterenium_driver`: the same driver, but with the app reloaded before the
+  test, so that every test starts from a clean state without a browser launch.
+
+It also records how long every test took into `--flutterenium-durations`, which is
+used by `--flutterenium-shard` to split the tests such that all the shards take
+roughly the same time, instead of the same number of tests.
+"""
+
+from datetime import timedelta
+import heapq
+import json
+import os
+import statistics
+from typing import Iterator, Optional
+
+import pytest
+
+from .config import BrowserConfig
+from .driver import BrowserKind, ExecutionKind, FluttereniumDriver
+
+# Used for the tests not present in the history, when the history is empty too
+DEFAULT_DURATION = 1.0
+
+_FRESH = pytest.StashKey[bool]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("flutterenium")
+    group.addoption(
+        "--flutterenium-url",
+        help="Url of the app opened by the `flutterenium_session` fixture",
+    )
+    group.addoption(
+        "--flutterenium-browser",
+        choices=[kind.name.lower() for kind in BrowserKind],
+        default=BrowserKind.CHROME.name.lower(),
+        help="Browser to launch, defaults to chrome",
+    )
+    group.addoption(
+        "--flutterenium-execution",
+        choices=[kind.value for kind in ExecutionKind],
+        default=ExecutionKind.ASYNC.value,
+        help="How the requests are sent to the app, defaults to async",
+    )
+    group.addoption(
+        "--flutterenium-config",
+        choices=["default", "fast", "debug"],
+        default="default",
+        help="`BrowserConfig` preset the browser gets launched with",
+    )
+    group.addoption(
+        "--flutterenium-timeout",
+        type=float,
+        default=30,
+        help="Seconds to wait for the response of a request, defaults to 30",
+    )
+    group.addoption(
+        "--flutterenium-durations",
+        default=".flutterenium-durations.json",
+        help="File to read & update the durations of the tests, relative to the rootdir",
+    )
+    group.addoption(
+        "--flutterenium-shard",
+        help="Runs only a shard of the tests, in the form of INDEX/COUNT with "
+        "the INDEX starting from 0, ex: 1/4 runs the second of four shards",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if hasattr(config, "workerinput"):
+        # `pytest-xdist` workers report to the controller,
+        # so only it needs to record the durations
+        return
+    config.pluginmanager.register(_DurationsRecorder(config), "flutterenium-durations")
+
+
+def pytest_report_header(config: pytest.Config) -> Optional[str]:
+    shard = _get_shard(config)
+    if shard is None:
+        return None
+    index, count = shard
+    return f"flutterenium: running shard {index}/{count}"
+
+
+def _get_shard(config: pytest.Config) -> Optional[tuple[int, int]]:
+    value = config.getoption("flutterenium_shard")
+    if value is None:
+        return None
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--flutterenium-shard should be INDEX/COUNT, got {value}")
+    if count <= 0 or not 0 <= index < count:
+        raise pytest.UsageError(f"--flutterenium-shard {value} is out of range")
+    return (index, count)
+
+
+def _get_durations_path(config: pytest.Config) -> str:
+    return os.path.join(config.rootpath, config.getoption("flutterenium_durations"))
+
+
+def _read_durations(path: str) -> dict[str, float]:
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _split(
+    ids: list[str], durations: dict[str, float], count: int
+) -> list[list[str]]:
+    # Longest processing time first, every test goes to the shard which
+    # is least loaded so far. Ties are broken by the id & the shard index,
+    # so that all the shards arrive at the same split independently.
+    default = (
+        statistics.median(durations.values()) if durations else DEFAULT_DURATION
+    )
+    shards = [[] for _ in range(count)]
+    loads = [(0.0, index) for index in range(count)]
+    for id in sorted(ids, key=lambda id: (-durations.get(id, default), id)):
+        load, index = heapq.heappop(loads)
+        shards[index].append(id)
+        heapq.heappush(loads, (load + durations.get(id, default), index))
+    return shards
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    shard = _get_shard(config)
+    if shard is None:
+        return
+    index, count = shard
+    durations = _read_durations(_get_durations_path(config))
+    selected_ids = set(
+        _split([item.nodeid for item in items], durations, count)[index]
+    )
+    selected = [item for item in items if item.nodeid in selected_ids]
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+class _DurationsRecorder:
+    def __init__(self, config: pytest.Config):
+        self.__path = _get_durations_path(config)
+        self.__durations: dict[str, float] = {}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        # setup & teardown are accounted too, as those include the app reloads
+        self.__durations[report.nodeid] = (
+            self.__durations.get(report.nodeid, 0.0) + report.duration
+        )
+
+    def pytest_sessionfinish(self) -> None:
+        if not self.__durations:
+            return
+        # tests which didn't run this time keep their earlier durations,
+        # so that the other shards can still be balanced
+        history = _read_durations(self.__path)
+        history.update(self.__durations)
+        temporary_path = f"{self.__path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(history, file, indent=2, sort_keys=True)
+        os.replace(temporary_path, self.__path)
+
+
+@pytest.fixture(scope="session")
+def flutterenium_session(
+    pytestconfig: pytest.Config,
+) -> Iterator[FluttereniumDriver]:
+    """
+    Driver which lives for the whole session, with the app opened.
+    """
+    url = pytestconfig.getoption("flutterenium_url")
+    if url is None:
+        raise pytest.UsageError("--flutterenium-url is needed to open the app")
+    match pytestconfig.getoption("flutterenium_config"):
+        case "fast":
+            browser_config = BrowserConfig.fast()
+        case "debug":
+            browser_config = BrowserConfig.debug()
+        case _:
+            browser_config = None
+    driver = FluttereniumDriver(
+        BrowserKind[pytestconfig.getoption("flutterenium_browser").upper()],
+        execution_kind=ExecutionKind(pytestconfig.getoption("flutterenium_execution")),
+        timeout=timedelta(seconds=pytestconfig.getoption("flutterenium_timeout")),
+        browser_config=browser_config,
+    )
+    try:
+        driver.open(url)
+        pytestconfig.stash[_FRESH] = True
+        yield driver
+    finally:
+        driver.close(with_browser=True)
+
+
+@pytest.fixture
+def flutterenium_driver(
+    pytestconfig: pytest.Config, flutterenium_session: FluttereniumDriver
+) -> FluttereniumDriver:
+    """
+    Same driver as the `flutterenium_session`, but the app gets reloaded
+    before the test, unless it was just opened.
+    """
+    if not pytestconfig.stash.get(_FRESH, False):
+        flutterenium_session.reload_app()
+    pytestconfig.stash[_FRESH] = False
+    return flutterenium_session
@@ -0,0 +1,239 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from enum import Enum
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .instrumentation import _percentile
+
+if TYPE_CHECKING:
+    from .driver import FluttereniumDriver
+
+# Bumped whenever the format of the replay file changes
+REPLAY_FILE_VERSION = 1
+
+
+class ReplayKind(Enum):
+    ORIGINAL = "original"
+    FAST = "fast"
+    BATCHED = "batched"
+
+
+class Recorder:
+    def __init__(self, path: str):
+        """
+        Writes every request sent by the driver into the file at `path`, one JSON
+        per line, along with when it was sent & how long it was allowed to wait
+        inside the page. Reads served by the read cache of the driver are written
+        too, but marked as `cached`. One should use `driver.record()` to create it.
+        """
+        self.__file = open(path, "w")
+        self.__lock = threading.Lock()
+        self.__started_at = time.perf_counter()
+        self.__count = 0
+        self.__write({"version": REPLAY_FILE_VERSION})
+
+    @property
+    def count(self) -> int:
+        """
+        Number of requests recorded so far
+        """
+        return self.__count
+
+    def __write(self, entry: dict[str, Any]) -> None:
+        self.__file.write(json.dumps(entry, separators=(",", ":")))
+        self.__file.write("\n")
+
+    def _record(
+        self, request: dict[str, Any], wait: timedelta, cached: bool = False
+    ) -> None:
+        entry = {
+            "at": round(time.perf_counter() - self.__started_at, 6),
+            "wait": wait.total_seconds(),
+            "request": request,
+        }
+        if cached:
+            entry["cached"] = True
+        with self.__lock:
+            if self.__file.closed:
+                return
+            self.__write(entry)
+            self.__count += 1
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__file.close()
+
+
+class ReplayReport:
+    def __init__(self, latencies: list[float], failures: int, elapsed: float):
+        """
+        Outcome of a replay, durations are in milliseconds.
+
+        Args:
+            latencies (list[float]): Time taken by every request that got a response
+            failures (int): Number of requests or their steps which didn't succeed,
+              including the ones which didn't get a response
+            elapsed (float): Time taken by the whole replay
+        """
+        self.latencies = sorted(latencies)
+        self.failures = failures
+        self.elapsed = elapsed
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Number of requests completed per second
+        """
+        return self.requests / (self.elapsed / 1000) if self.elapsed else 0
+
+    def percentile(self, percentile: float) -> float:
+        if not self.latencies:
+            return 0
+        return _percentile(self.latencies, percentile)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "mean": sum(self.latencies) / len(self.latencies) if self.latencies else 0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.latencies[-1] if self.latencies else 0,
+        }
+
+
+def _count_failures(response: dict[str, Any]) -> int:
+    if not response["didSucceeded"]:
+        return 1
+    # steps of a batch or a plan succeed or fail independently
+    steps = (response.get("data") or {}).get("steps") or []
+    return sum(1 for step in steps if not step["didSucceeded"])
+
+
+class Replayer:
+    def __init__(self, path: str):
+        """
+        Sends the requests recorded by a `Recorder` once again, use it to
+        generate load on the app without writing the tests by hand.
+
+        Args:
+            path (str): Path of the file written by the `Recorder`
+        """
+        with open(path) as file:
+            header = json.loads(file.readline())
+            if header.get("version") != REPLAY_FILE_VERSION:
+                raise ValueError(f"Unsupported replay file version {header}")
+            self.entries = [json.loads(line) for line in file if line.strip()]
+
+    @staticmethod
+    def __batch(
+        recorded: list[dict[str, Any]], batch_size: int
+    ) -> list[dict[str, Any]]:
+        # the consecutive requests made for the actions are merged into
+        # steps, while the rest of them are sent the way they were
+        entries = []
+        pending: list[dict[str, Any]] = []
+
+        def flush():
+            if not pending:
+                return
+            entries.append(
+                {
+                    "at": pending[0]["at"],
+                    "wait": sum(entry["wait"] for entry in pending),
+                    "request": {
+                        "steps": [entry["request"]["actions"] for entry in pending],
+                        "stopOnFailure": False,
+                    },
+                }
+            )
+            pending.clear()
+
+        for entry in recorded:
+            if "actions" not in entry["request"]:
+                flush()
+                entries.append(entry)
+                continue
+            pending.append(entry)
+            if len(pending) >= batch_size:
+                flush()
+        flush()
+        return entries
+
+    def replay(
+        self,
+        drivers: list["FluttereniumDriver"],
+        kind: ReplayKind = ReplayKind.FAST,
+        iterations: int = 1,
+        batch_size: int = 20,
+        on_response: Optional[Callable[[dict[str, Any]], None]] = None,
+    ) -> ReplayReport:
+        """
+        Replays the recorded requests in every driver in parallel, each one of
+        them should have the app opened already. The `cached` ones never reached
+        the page when they were recorded, so they are not replayed.
+
+        Args:
+            drivers (list[FluttereniumDriver]): sessions in which the requests are replayed
+            kind (ReplayKind, optional): ReplayKind.ORIGINAL keeps the gaps between the
+              requests as they were recorded, ReplayKind.FAST sends them one after the other,
+              while ReplayKind.BATCHED merges the consecutive action requests into batches.
+              Defaults to ReplayKind.FAST.
+            iterations (int, optional): Number of times to replay in every session, useful
+              for soak tests. Defaults to 1.
+            batch_size (int, optional): Maximum requests merged when batched. Defaults to 20.
+            on_response (Callable[[dict[str, Any]], None], optional): Called with every
+              response, from the thread of its driver. Defaults to None.
+
+        Returns:
+            ReplayReport: throughput & latencies across all the drivers
+        """
+        entries = [entry for entry in self.entries if not entry.get("cached")]
+        if kind == ReplayKind.BATCHED:
+            entries = self.__batch(entries, batch_size)
+        lock = threading.Lock()
+        latencies: list[float] = []
+        failures = 0
+
+        def run(driver: "FluttereniumDriver") -> None:
+            nonlocal failures
+            for _ in range(iterations):
+                started_at = time.perf_counter()
+                for entry in entries:
+                    if kind == ReplayKind.ORIGINAL:
+                        delay = entry["at"] - (time.perf_counter() - started_at)
+                        if delay > 0:
+                            time.sleep(delay)
+                    sent_at = time.perf_counter()
+                    try:
+                        response = driver._replay(
+                            entry["request"], timedelta(seconds=entry["wait"])
+                        )
+                    except TimeoutError:
+                        with lock:
+                            failures += 1
+                        continue
+                    latency = (time.perf_counter() - sent_at) * 1000
+                    with lock:
+                        latencies.append(latency)
+                        failures += _count_failures(response)
+                    if on_response is not None:
+                        on_response(response)
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+            # list() surfaces the exceptions raised in the drivers
+            list(executor.map(run, drivers))
+        return ReplayReport(
+            latencies, failures, (time.perf_counter() - started_at) * 1000
+        )
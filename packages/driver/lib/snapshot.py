@@ -0,0 +1,258 @@
+from bisect import bisect_left
+from collections import defaultdict
+import re
+from typing import Any, Callable, Optional
+import uuid
+
+from .finder import By, FinderKind
+from .internal.typedefs import *
+from .internal.utils import *
+
+
+class SnapshotNode:
+    __slots__ = (
+        "index",
+        "parent",
+        "type",
+        "label",
+        "text",
+        "icon",
+        "svg",
+        "bounds",
+        "depth",
+        "end",
+        "_snapshot",
+    )
+
+    def __init__(self, snapshot: "Snapshot", index: int, node: list[Any]):
+        """
+        An element of the `Snapshot`, along with the details it had at the time
+        the snapshot was taken.
+        """
+        self._snapshot = snapshot
+        self.index = index
+        self.parent: Optional[int] = node[0] if node[0] >= 0 else None
+        self.type: str = node[1]
+        self.label: Optional[str] = node[2]
+        self.text: Optional[str] = node[3]
+        self.icon: Optional[int] = node[4]
+        self.svg: Optional[str] = node[5]
+        self.bounds: Optional[tuple[float, float, float, float]] = (
+            tuple(node[6]) if node[6] is not None else None
+        )
+        # number of ancestors the node has
+        self.depth = 0
+        # position of the node that comes after this node's subtree
+        self.end = index + 1
+
+    def get_parent(self) -> Optional["SnapshotNode"]:
+        """
+        Gets the node this node is a child of, `None` if this is the root.
+        """
+        return self._snapshot[self.parent] if self.parent is not None else None
+
+    def get_children(self) -> list["SnapshotNode"]:
+        """
+        Gets the direct children of this node, in the order they are present in the tree.
+        """
+        children = []
+        index = self.index + 1
+        while index < self.end:
+            child = self._snapshot[index]
+            children.append(child)
+            index = child.end
+        return children
+
+    def get(self, by: By) -> Optional["SnapshotNode"]:
+        """
+        Works same as `Element.get()`, but looks up the snapshot instead of the page.
+        """
+        return self._snapshot.get(by, root=self)
+
+    def get_all(self, by: By) -> list["SnapshotNode"]:
+        """
+        Works same as `Element.get_all()`, but looks up the snapshot instead of the page.
+        """
+        return self._snapshot.get_all(by, root=self)
+
+    def __repr__(self):
+        return (
+            f"SnapshotNode(index={self.index}, type={self.type!r}, "
+            f"label={self.label!r}, text={self.text!r})"
+        )
+
+
+class Snapshot(list):
+    def __init__(self, nodes: list[list[Any]]):
+        """
+        Serialized element tree which can be queried without going to the browser,
+        nodes are in the order they are present in the tree, so a node's subtree
+        is the range of nodes from its `index` till its `end`.
+        """
+        super().__init__(
+            SnapshotNode(self, index, node) for index, node in enumerate(nodes)
+        )
+        # parents always come before their children
+        for node in self:
+            if node.parent is not None:
+                node.depth = self[node.parent].depth + 1
+        for node in reversed(self):
+            if node.parent is not None:
+                parent = self[node.parent]
+                parent.end = max(parent.end, node.end)
+
+        # positions of the nodes are added in increasing order,
+        # so every index below is sorted & can be bisected
+        self.__indexes: dict[FinderKind, dict[Any, list[int]]] = {
+            FinderKind.LABEL: defaultdict(list),
+            FinderKind.TEXT: defaultdict(list),
+            FinderKind.ICON: defaultdict(list),
+        }
+        self.__types: dict[str, list[int]] = defaultdict(list)
+        self.__svgs: list[int] = []
+        for node in self:
+            self.__types[node.type].append(node.index)
+            if node.label is not None:
+                self.__indexes[FinderKind.LABEL][node.label].append(node.index)
+            if node.text is not None:
+                self.__indexes[FinderKind.TEXT][node.text].append(node.index)
+            if node.icon is not None:
+                self.__indexes[FinderKind.ICON][node.icon].append(node.index)
+            if node.svg is not None:
+                self.__svgs.append(node.index)
+
+    @classmethod
+    def take(
+        cls,
+        on_actions_executed: Callable[[ActionData], ActionResponse],
+        chunk_size: int = None,
+    ) -> Optional["Snapshot"]:
+        id = str(uuid.uuid4())
+        nodes = []
+        try:
+            while True:
+                did_succeed, data = on_actions_executed(
+                    [to_snapshot_action(id, offset=len(nodes), limit=chunk_size)],
+                )
+                if not did_succeed:
+                    # page forgets the rest of the nodes when it fails
+                    # or gets pumped, so there is nothing to release
+                    return None
+                snapshot = data["snapshot"]
+                nodes.extend(snapshot["nodes"])
+                if not snapshot["nodes"] or len(nodes) >= snapshot["total"]:
+                    return cls(nodes)
+        except BaseException:
+            if nodes:
+                # otherwise the rest of the nodes are kept in the page
+                # till some other snapshots push them out
+                try:
+                    on_actions_executed([to_snapshot_action(id, 0, release=True)])
+                except Exception:
+                    pass
+            raise
+
+    @property
+    def root(self) -> Optional[SnapshotNode]:
+        return self[0] if self else None
+
+    def __range(self, root: Optional[SnapshotNode]) -> tuple[int, int]:
+        if root is None:
+            return (0, len(self))
+        # same as the page, the element itself is not considered
+        # while looking for the elements under it
+        return (root.index + 1, root.end)
+
+    @staticmethod
+    def __slice(positions: list[int], start: int, end: int) -> list[int]:
+        return positions[bisect_left(positions, start) : bisect_left(positions, end)]
+
+    def __matches(self, by: By, start: int, end: int) -> list[int]:
+        if by.kind == FinderKind.SVG:
+            pattern = re.compile(by.value)
+            return [
+                index
+                for index in self.__slice(self.__svgs, start, end)
+                if pattern.search(self[index].svg)
+            ]
+        positions = self.__indexes[by.kind].get(by.value, [])
+        return self.__slice(positions, start, end)
+
+    def __scope(
+        self, scope: dict[str, Any], positions: list[int], root: Optional[SnapshotNode]
+    ) -> list[int]:
+        if scope.get("visible_only") or scope.get("skip_offstage"):
+            raise ValueError(
+                "Snapshot doesn't know which elements are visible or offstage, "
+                "so `visible_only` & `skip_offstage` can't be used with it"
+            )
+        max_depth = scope.get("max_depth")
+        if max_depth is not None:
+            start_depth = root.depth if root is not None else 0
+            positions = [
+                index
+                for index in positions
+                if self[index].depth - start_depth <= max_depth
+            ]
+        if scope.get("breadth_first"):
+            # nodes of the same level are in the same order either way
+            positions = sorted(positions, key=lambda index: (self[index].depth, index))
+        return positions
+
+    def get_all(self, by: By, root: SnapshotNode = None) -> list[SnapshotNode]:
+        """
+        Works same as `driver.get_all()`, but looks up the snapshot instead of the page.
+
+        Args:
+            by (By): Based on how we need to find the nodes, its `scope` is honoured
+              except for `visible_only` & `skip_offstage`
+            root (SnapshotNode, optional): If specified, only the nodes under it are looked up.
+
+        Raises:
+            ValueError: if the `by` is scoped to the visible or onstage elements
+
+        Returns:
+            list[SnapshotNode]: matched nodes, in the order they are present in the tree
+        """
+        positions = self.__matches(by, *self.__range(root))
+        if by.scope is not None:
+            positions = self.__scope(by.scope, positions, root)
+        matches = [self[index] for index in positions]
+        if by.index is not None:
+            return matches[by.index : by.index + 1]
+        return matches
+
+    def get(self, by: By, root: SnapshotNode = None) -> Optional[SnapshotNode]:
+        """
+        Works same as `driver.get()`, but looks up the snapshot instead of the page.
+
+        Args:
+            by (By): Based on how we need to find the node
+            root (SnapshotNode, optional): If specified, only the nodes under it are looked up.
+
+        Raises:
+            ValueError: same as `get_all()`
+
+        Returns:
+            Optional[SnapshotNode]: the first match, `None` if nothing matched
+        """
+        matches = self.get_all(by, root=root)
+        return matches[0] if matches else None
+
+    def get_all_by_type(
+        self, type: str, root: SnapshotNode = None
+    ) -> list[SnapshotNode]:
+        """
+        Finds all the nodes whose widget's runtime type is `type`, ex: "ElevatedButton".
+
+        Args:
+            type (str): runtime type of the widget
+            root (SnapshotNode, optional): If specified, only the nodes under it are looked up.
+
+        Returns:
+            list[SnapshotNode]: matched nodes, in the order they are present in the tree
+        """
+        positions = self.__types.get(type, [])
+        return [
+            self[index] for index in self.__slice(positions, *self.__range(root))
+        ]
@@ -0,0 +1,347 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from enum import Enum
+import itertools
+import json
+import threading
+import time
+from typing import Any, Optional
+import urllib.request
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .internal.constants import *
+from .internal.scripts import *
+from .internal.tab import TabWebDriver
+
+try:
+    import websocket
+except ImportError:  # pragma: no cover - optional dependency
+    websocket = None
+
+
+class ExecutionKind(Enum):
+    POLL = "poll"
+    ASYNC = "async"
+    DEVTOOLS = "devtools"
+
+
+class Transport(ABC):
+    """
+    How the requests reach `Flutterenium` inside the page & how
+    its responses come back to the driver.
+    """
+
+    @abstractmethod
+    def install(self) -> None:
+        """
+        Called every time the page got loaded & `Flutterenium` is ready,
+        so that whatever needed to receive the responses can be set up.
+        """
+
+    @abstractmethod
+    def send(
+        self, id: str, request: dict, timeout: timedelta
+    ) -> tuple[Optional[dict], float, int]:
+        """
+        Sends the `request` & waits for its response.
+
+        Args:
+            id (str): Unique id of the request, the response carries the same
+            request (dict): Request to send
+            timeout (timedelta): Maximum time to wait for the response
+
+        Returns:
+            tuple[Optional[dict], float, int]: response or `None` if timed out,
+              `time.perf_counter()` at which the request got dispatched &
+              the number of round trips made to pick the response
+        """
+
+    @abstractmethod
+    def get_unread_count(self) -> int:
+        """
+        Number of responses emitted by `Flutterenium` but no one read them yet
+        """
+
+    def close(self) -> None:
+        """
+        Releases whatever the transport holds, the browser is not closed by this.
+        """
+
+
+class SeleniumTransport(Transport):
+    def __init__(
+        self,
+        web_driver: WebDriver,
+        execution_kind: ExecutionKind,
+        timeout: timedelta,
+        event_logs_limit: int,
+    ):
+        """
+        Sends every request through the `execute_script` of the WebDriver, which
+        works with any browser but costs atleast one HTTP round trip per request.
+        """
+        # tabs of a browser share the script timeout, which the `TabWebDriver` tracks
+        self.__driver = (
+            web_driver
+            if isinstance(web_driver, TabWebDriver)
+            else TabWebDriver(web_driver)
+        )
+        self.__execution_kind = execution_kind
+        self.__event_logs_limit = event_logs_limit
+        self.__ensure_script_timeout(timeout)
+
+    def install(self) -> None:
+        self.__driver.execute_script(
+            Scripts.INSTALL_EVENT_LOGS,
+            Constants.FLUTTERENIUM_DRIVER_EVENT_LOGS_NAME,
+            Constants.FLUTTERENIUM_RESPONSE_EVENT_NAME,
+            self.__event_logs_limit,
+        )
+
+    def send(
+        self, id: str, request: dict, timeout: timedelta
+    ) -> tuple[Optional[dict], float, int]:
+        match self.__execution_kind:
+            case ExecutionKind.ASYNC:
+                return self.__dispatch_and_wait(id, request, timeout)
+            case ExecutionKind.POLL:
+                return self.__dispatch_and_poll(id, request, timeout)
+            case _:
+                raise ValueError("Unhandled execution value")
+
+    def get_unread_count(self) -> int:
+        return int(
+            self.__driver.execute_script(
+                Scripts.GET_EVENT_LOGS_SIZE,
+                Constants.FLUTTERENIUM_DRIVER_EVENT_LOGS_NAME,
+            )
+        )
+
+    def __ensure_script_timeout(self, timeout: timedelta) -> None:
+        # Updating the script timeout costs a round trip, so it is done
+        # only when the requested timeout won't fit in the current one,
+        # which is tracked by the browser as all its tabs share it. An
+        # extra second is given so that the timer inside the script
+        # always fires before the one maintained by the WebDriver.
+        self.__driver.ensure_script_timeout(
+            (timeout + timedelta(seconds=1)).total_seconds()
+        )
+
+    def __dispatch_and_wait(
+        self, id: str, request: dict, timeout: timedelta
+    ) -> tuple[Optional[dict], float, int]:
+        self.__ensure_script_timeout(timeout)
+        response = self.__driver.execute_async_script(
+            Scripts.DISPATCH_AND_WAIT,
+            id,
+            Constants.FLUTTERENIUM_REQUEST_EVENT_NAME,
+            Constants.FLUTTERENIUM_RESPONSE_EVENT_NAME,
+            Constants.FLUTTERENIUM_DRIVER_EVENT_LOGS_NAME,
+            request,
+            timeout.total_seconds() * 1000,
+        )
+        # request & response share the same round trip, so
+        # there is no separate pickup for the response
+        return (response, time.perf_counter(), 0)
+
+    def __dispatch_and_poll(
+        self, id: str, request: dict, timeout: timedelta
+    ) -> tuple[Optional[dict], float, int]:
+        self.__driver.execute_script(
+            Scripts.DISPATCH,
+            id,
+            Constants.FLUTTERENIUM_REQUEST_EVENT_NAME,
+            request,
+        )
+        dispatched_at = time.perf_counter()
+        wait_till = datetime.now() + timeout
+        interval = Constants.POLL_MIN_INTERVAL
+        polls = 0
+        response = None
+        while response is None:
+            polls += 1
+            response = self.__driver.execute_script(
+                Scripts.POLL_RESPONSE,
+                id,
+                Constants.FLUTTERENIUM_DRIVER_EVENT_LOGS_NAME,
+            )
+            if response is not None or datetime.now() >= wait_till:
+                break
+            # Most of the actions completes within a frame, so start
+            # polling aggressively & back off for the long running ones.
+            time.sleep(interval.total_seconds())
+            interval = min(interval * 2, Constants.POLL_MAX_INTERVAL)
+        return (response, dispatched_at, polls)
+
+
+class DevToolsTransport(Transport):
+    def __init__(
+        self,
+        web_driver: WebDriver,
+        event_logs_limit: int,
+        websocket_url: str = None,
+    ):
+        """
+        Sends the requests over a persistent DevTools protocol connection to the page,
+        while the responses are pushed back through a runtime binding as soon as
+        `Flutterenium` emits them, so there is neither a HTTP round trip per request
+        nor any polling. Works only with the Chromium based browsers & needs the
+        `websocket-client` package to be installed.
+
+        Args:
+            web_driver (WebDriver): Browser which has the page opened
+            event_logs_limit (int): Maximum number of unread responses to be kept
+            websocket_url (str, optional): DevTools websocket of the page. Defaults
+              to the one of the current window of the `web_driver`.
+        """
+        if websocket is None:
+            raise ImportError(
+                "DevToolsTransport needs the `websocket-client` package, "
+                "install it via `pip install flutterenium[devtools]`"
+            )
+        self.__event_logs_limit = event_logs_limit
+        self.__lock = threading.Lock()
+        self.__send_lock = threading.Lock()
+        self.__command_ids = itertools.count(1)
+        # request or command id => [event, response]
+        self.__waiters: dict[Any, list] = {}
+        self.__unread: dict[str, dict] = {}
+        self.__socket = websocket.create_connection(
+            websocket_url or self.__find_websocket_url(web_driver),
+            # Chrome rejects the connections made with an origin,
+            # unless the browser is launched allowing it
+            suppress_origin=True,
+        )
+        self.__reader = threading.Thread(target=self.__read, daemon=True)
+        self.__reader.start()
+        self.__command("Runtime.enable")
+        # bindings survive the reloads, so adding it once is enough
+        self.__command(
+            "Runtime.addBinding",
+            {"name": Constants.FLUTTERENIUM_DRIVER_BINDING_NAME},
+        )
+
+    @staticmethod
+    def __find_websocket_url(web_driver: WebDriver) -> str:
+        capabilities = web_driver.capabilities
+        options = capabilities.get("goog:chromeOptions") or capabilities.get(
+            "ms:edgeOptions"
+        )
+        address = options.get("debuggerAddress") if options else None
+        if address is None:
+            raise ValueError("DevTools protocol is available only on Chromium based browsers")
+        with urllib.request.urlopen(f"http://{address}/json") as response:
+            targets = [
+                target
+                for target in json.loads(response.read())
+                if target.get("type") == "page"
+            ]
+        # Chromium uses the target id as the window handle
+        handle = web_driver.current_window_handle
+        for target in targets:
+            if target["id"] == handle:
+                return target["webSocketDebuggerUrl"]
+        # connecting to some other page would drive the wrong tab
+        raise ValueError(f"No DevTools target found for the window {handle!r}")
+
+    def install(self) -> None:
+        self.__evaluate(
+            Scripts.INSTALL_RESPONSE_BINDING,
+            Constants.FLUTTERENIUM_DRIVER_BINDING_NAME,
+            Constants.FLUTTERENIUM_RESPONSE_EVENT_NAME,
+            wait=True,
+        )
+
+    def send(
+        self, id: str, request: dict, timeout: timedelta
+    ) -> tuple[Optional[dict], float, int]:
+        # Waiter should be in place before dispatching the request,
+        # as the response can be pushed even before `send` returns.
+        waiter = self.__add_waiter(id)
+        self.__evaluate(
+            Scripts.DISPATCH,
+            id,
+            Constants.FLUTTERENIUM_REQUEST_EVENT_NAME,
+            request,
+        )
+        dispatched_at = time.perf_counter()
+        return (self.__wait(id, waiter, timeout), dispatched_at, 0)
+
+    def get_unread_count(self) -> int:
+        with self.__lock:
+            return len(self.__unread)
+
+    def close(self) -> None:
+        self.__socket.close()
+        self.__reader.join()
+
+    def __evaluate(self, script: str, *args, wait: bool = False) -> None:
+        # snippets read their arguments the same way as the `execute_script`
+        # ones do, so that both the transports can share them
+        expression = f"(function() {{{script}}}).apply(null, {json.dumps(args)})"
+        self.__command("Runtime.evaluate", {"expression": expression}, wait=wait)
+
+    def __command(self, method: str, params: dict = None, wait: bool = True) -> None:
+        id = next(self.__command_ids)
+        waiter = self.__add_waiter(id) if wait else None
+        with self.__send_lock:
+            self.__socket.send(
+                json.dumps({"id": id, "method": method, "params": params or {}})
+            )
+        if waiter is None:
+            return
+        reply = self.__wait(id, waiter, timedelta(seconds=30))
+        if reply is None:
+            raise TimeoutError(f"No reply received for {method}")
+        if "error" in reply:
+            raise RuntimeError(f"{method} failed: {reply['error']}")
+
+    def __add_waiter(self, id: Any) -> threading.Event:
+        event = threading.Event()
+        with self.__lock:
+            self.__waiters[id] = [event, None]
+        return event
+
+    def __wait(
+        self, id: Any, event: threading.Event, timeout: timedelta
+    ) -> Optional[dict]:
+        event.wait(timeout.total_seconds())
+        with self.__lock:
+            _, response = self.__waiters.pop(id)
+        return response
+
+    def __read(self) -> None:
+        while True:
+            try:
+                message = json.loads(self.__socket.recv())
+            except Exception:
+                # socket got closed, so no one should be waiting anymore
+                with self.__lock:
+                    for waiter in self.__waiters.values():
+                        waiter[0].set()
+                return
+            if "id" in message:
+                self.__resolve(message["id"], message)
+            elif (
+                message.get("method") == "Runtime.bindingCalled"
+                and message["params"]["name"] == Constants.FLUTTERENIUM_DRIVER_BINDING_NAME
+            ):
+                response = json.loads(message["params"]["payload"])
+                self.__resolve(response.pop("id"), response)
+
+    def __resolve(self, id: Any, response: dict) -> None:
+        with self.__lock:
+            waiter = self.__waiters.get(id)
+            if waiter is not None:
+                waiter[1] = response
+                waiter[0].set()
+                return
+            if isinstance(id, int):
+                # replies of the commands sent without waiting
+                return
+            # Responses no one is waiting for are evicted in the order
+            # they arrived, so that these never grow beyond the limit.
+            self.__unread[id] = response
+            while len(self.__unread) > self.__event_logs_limit:
+                self.__unread.pop(next(iter(self.__unread)))
@@ -16,6 +16,10 @@ setup(
         # List your package dependencies here
         'selenium>=4.23.1,<5.0.0'
     ],
+    extras_require={
+        # needed only by the `ExecutionKind.DEVTOOLS`
+        'devtools': ['websocket-client>=1.6.0'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3.10',
         'License :: OSI Approved :: MIT License',
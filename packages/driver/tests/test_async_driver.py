@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import unittest
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+
+
+def _launch() -> AsyncFluttereniumDriver:
+    web_driver = FakeWebDriver(FakePage(build_example_tree(rows=10)))
+    return AsyncFluttereniumDriver(
+        FluttereniumDriver(
+            BrowserKind.CHROME,
+            execution_kind=ExecutionKind.POLL,
+            web_driver=web_driver,
+        )
+    )
+
+
+class TestAsyncDriver(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.driver = _launch()
+        await self.driver.open("http://127.0.0.1:5500")
+
+    async def asyncTearDown(self):
+        await self.driver.close(with_browser=True)
+
+    async def test_actions_are_awaitable(self):
+        text_field = self.driver.get(By.text("Enter here"))
+        self.assertTrue(await text_field.set_text("Hello"))
+        self.assertEqual(await text_field.get_text(), "Hello")
+        self.assertTrue(await self.driver.pump())
+
+    async def test_elements_found_from_elements(self):
+        list_view = self.driver.get(By.label("list-view"))
+        row = list_view.get(By.text("3"))
+        self.assertTrue(await row.is_visible())
+        self.assertEqual(await row.get_text(), "3")
+        self.assertIsNone(await list_view.get(By.text("missing")).get_text())
+
+    async def test_requests_of_different_drivers_run_concurrently(self):
+        other = _launch()
+        await other.open("http://127.0.0.1:5500")
+        try:
+            texts = await asyncio.gather(
+                self.driver.get(By.text("1")).get_text(),
+                other.get(By.text("2")).get_text(),
+            )
+        finally:
+            await other.close(with_browser=True)
+        self.assertEqual(texts, ["1", "2"])
+
+    async def test_close_releases_the_worker_thread(self):
+        tab = await self.driver.new_tab(execution_kind=ExecutionKind.POLL)
+        self.assertEqual(await tab.get(By.text("1")).get_text(), "1")
+        threads = threading.active_count()
+        await tab.close()
+        await asyncio.sleep(0.05)
+        self.assertEqual(threading.active_count(), threads - 1)
+        with self.assertRaises(RuntimeError):
+            await tab.get(By.text("1")).get_text()
+
+
+if __name__ == "__main__":
+    unittest.main()
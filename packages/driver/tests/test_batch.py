@@ -0,0 +1,58 @@
+import unittest
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+        self.driver = FluttereniumDriver(
+            BrowserKind.CHROME,
+            instrumentation=self.instrumentation,
+            web_driver=FakeWebDriver(FakePage(build_example_tree(rows=5))),
+        )
+        self.driver.open("http://127.0.0.1:5500")
+
+    def test_queued_actions_are_sent_in_a_single_request(self):
+        with self.driver.batch() as batch:
+            self.assertTrue(batch.get(By.text("Enter here")).set_text("Batched"))
+            batch.pump(PumpKind.SETTLE)
+            self.assertIsNone(batch.get(By.text("Enter here")).get_text())
+            self.assertEqual(self.instrumentation.timings, [])
+        [timing] = self.instrumentation.timings
+        self.assertEqual(timing.action_type, "batch")
+        self.assertEqual(len(batch.results), 3)
+        self.assertTrue(all(did_succeed for did_succeed, _ in batch.results))
+        self.assertEqual(batch.results[-1][1]["text"], "Batched")
+
+    def test_failed_steps(self):
+        with self.driver.batch(stop_on_failure=True) as batch:
+            batch.get(By.text("missing")).press()
+            batch.get(By.text("1")).press()
+        self.assertEqual(batch.results, [(False, None), (False, None)])
+
+    def test_reads_returning_data_give_placeholders(self):
+        with self.driver.batch() as batch:
+            list_view = batch.get(By.label("list-view"))
+            self.assertEqual(list_view.scroll_until_visible(By.text("3")), (None, 0))
+            self.assertEqual(list_view.collect([PropertyKind.TEXT]), [])
+            self.assertIsNone(list_view.screenshot())
+            self.assertEqual(list_view.get_all(By.text("3")), [])
+        did_succeed, data = batch.results[0]
+        self.assertTrue(did_succeed)
+        self.assertTrue(data["found"])
+        did_succeed, data = batch.results[1]
+        self.assertTrue(did_succeed)
+        self.assertEqual(len(data["values"]), 5)
+        did_succeed, data = batch.results[2]
+        self.assertTrue(did_succeed)
+        self.assertIn("screenshot", data)
+        did_succeed, data = batch.results[3]
+        self.assertTrue(did_succeed)
+        self.assertEqual(len(data["elements"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+from datetime import timedelta
+import unittest
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+from lib.frame_stats import FrameStats
+
+
+class TestFrameStats(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = FluttereniumDriver(
+            BrowserKind.CHROME,
+            web_driver=FakeWebDriver(FakePage(build_example_tree(rows=10))),
+        )
+        self.driver.open("http://127.0.0.1:5500")
+
+    def test_settle_frames_are_counted_while_measuring(self):
+        self.assertTrue(self.driver.pump(PumpKind.SETTLE))
+        with self.driver.measure_frames() as outer:
+            self.assertTrue(self.driver.pump(PumpKind.SETTLE))
+            with self.driver.measure_frames() as inner:
+                self.assertTrue(self.driver.pump(PumpKind.SETTLE))
+                # pumping a single frame isn't settling
+                self.assertTrue(self.driver.pump())
+        self.assertTrue(self.driver.pump(PumpKind.SETTLE))
+        self.assertEqual(outer.settle_frames, 2)
+        self.assertEqual(inner.settle_frames, 1)
+        self.assertEqual(outer.summary()["settle_frames"], 2)
+
+    def test_jank_and_dropped_frames(self):
+        stats = FrameStats()
+        stats._update(
+            {
+                "frameBudgetMicroseconds": 16000,
+                # build, raster & total of each frame
+                "frames": [[1000, 2000, 3000], [20000, 1000, 21000], [1000, 40000, 41000]],
+            }
+        )
+        self.assertEqual(stats.frame_budget, timedelta(milliseconds=16))
+        self.assertEqual(stats.frame_count, 3)
+        self.assertEqual(stats.jank_frames, 2)
+        self.assertEqual(stats.dropped_frames, 3)
+        summary = stats.summary()
+        self.assertEqual(summary["total"]["max"], 41)
+        self.assertEqual(summary["settle_frames"], 0)
+
+    def test_empty_stats(self):
+        summary = FrameStats().summary()
+        self.assertEqual(summary["frame_count"], 0)
+        self.assertEqual(summary["dropped_frames"], 0)
+        self.assertEqual(summary["build"]["max"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def open(self, instrumentation: Instrumentation, **kwargs) -> FluttereniumDriver:
+        driver = FluttereniumDriver(
+            BrowserKind.CHROME,
+            instrumentation=instrumentation,
+            web_driver=FakeWebDriver(FakePage(build_example_tree(rows=10))),
+            **kwargs,
+        )
+        driver.open("http://127.0.0.1:5500")
+        return driver
+
+    def test_every_request_is_timed(self):
+        timed = []
+        instrumentation = Instrumentation(on_request_timed=timed.append)
+        driver = self.open(instrumentation)
+        list_view = driver.get(By.label("list-view"))
+        for _ in range(3):
+            self.assertTrue(list_view.get(By.text("1")).press())
+        self.assertTrue(driver.pump())
+
+        self.assertEqual(len(timed), 4)
+        self.assertEqual(timed[0].key, "press:label>text")
+        self.assertEqual(timed[-1].key, "pump:")
+        self.assertTrue(all(timing.visited_nodes > 0 for timing in timed[:3]))
+        summary = instrumentation.summary()
+        self.assertEqual(summary["press:label>text"]["count"], 3)
+        self.assertEqual(summary["pump:"]["count"], 1)
+        total = summary["press:label>text"]["total"]
+        self.assertLessEqual(total["p50"], total["max"])
+        self.assertEqual(sum(total["histogram"]), 3)
+
+    def test_polls_are_counted(self):
+        instrumentation = Instrumentation()
+        driver = self.open(instrumentation, execution_kind=ExecutionKind.POLL)
+        self.assertTrue(driver.get(By.text("1")).press())
+        [timing] = instrumentation.timings
+        self.assertGreaterEqual(timing.polls, 1)
+
+    def test_oldest_timings_are_dropped(self):
+        instrumentation = Instrumentation(max_timings=2)
+        driver = self.open(instrumentation)
+        for text in ("1", "2", "3"):
+            driver.get(By.text(text)).press()
+        self.assertEqual(len(instrumentation.timings), 2)
+        instrumentation.clear()
+        self.assertEqual(instrumentation.timings, [])
+
+    def test_export(self):
+        instrumentation = Instrumentation()
+        driver = self.open(instrumentation)
+        driver.get(By.text("1")).press()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "timings.json")
+            instrumentation.export(path)
+            with open(path) as file:
+                exported = json.load(file)
+        self.assertEqual(exported["summary"], instrumentation.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
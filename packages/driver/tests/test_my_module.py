@@ -1,4 +1,5 @@
 import unittest
+from datetime import timedelta
 
 from lib import *
 
@@ -8,6 +9,7 @@ class TestMyModule(unittest.TestCase):
     def test_my_function(self):
         driver = FluttereniumDriver(browser_kind=BrowserKind.CHROME)
         driver.open("http://127.0.0.1:5500")
+        self.assertGreater(driver.startup_timing.total, timedelta(seconds=0))
 
         # Find a element by the text
         app_bar_text = "Flutterenium Plugin example app"
@@ -67,6 +69,100 @@ class TestMyModule(unittest.TestCase):
         self.assertTrue(save_icon.press())
         self.assertTrue(driver.pump(PumpKind.SETTLE))
 
+        # Cache an element so that further actions won't find it again
+        cached_list_view = list_view.cache()
+        self.assertTrue(cached_list_view.get(By.text("0")).is_visible())
+        self.assertTrue(driver.pump())
+        self.assertTrue(cached_list_view.is_valid())
+
+        # Perform actions on multiple elements in a single request
+        with driver.batch() as batch:
+            batch.get(By.text("Enter here")).set_text("Batched")
+            batch.get(By.text("Show as toast")).press()
+            batch.pump(PumpKind.SETTLE)
+            batch.get(By.text("Enter here")).get_text()
+        self.assertTrue(all(did_succeed for did_succeed, _ in batch.results))
+        self.assertEqual(batch.results[-1][1]["text"], "Batched")
+
+        # Wait till the conditions hold, checked inside the page on every frame
+        self.assertTrue(list_view.get(By.text("0")).wait_until_visible())
+        self.assertTrue(text_field.wait_until_text("Batched"))
+
+        # Find all the matching elements in a single walk of the tree
+        app_bar_texts = driver.get_all(By.text(app_bar_text))
+        self.assertEqual(len(app_bar_texts), 1)
+        self.assertEqual(app_bar_texts.get_text(), [app_bar_text])
+        self.assertEqual(app_bar_texts.is_visible(), [True])
+        self.assertEqual(app_bar_texts[0].get_text(), app_bar_text)
+
+        # Prepare the steps once & run them repeatedly with different values
+        with driver.prepare() as plan:
+            plan.get(By.text("Enter here")).set_text(Param("text"))
+            plan.get(By.text("Enter here")).get_text()
+        for text in ("first", "second"):
+            results = plan.run(text=text)
+            self.assertTrue(results[0][0])
+            self.assertEqual(results[1][1]["text"], text)
+
+        # Bound the search to the visible part of the tree
+        self.assertTrue(
+            driver.get(By.text(app_bar_text).scoped(visible_only=True)).is_valid()
+        )
+        self.assertFalse(driver.get(By.text(app_bar_text).scoped(max_depth=1)).is_valid())
+
+        # Scroll inside the page till a lazily built row becomes visible
+        row, scrolls = list_view.scroll_until_visible(By.text("24"), step=300)
+        self.assertIsNotNone(row)
+        self.assertGreater(scrolls, 0)
+        self.assertEqual(row.get_text(), "24")
+        self.assertTrue(list_view.scroll_by(0))
+
+        # Measure the frames rendered while scrolling
+        with driver.measure_frames() as stats:
+            self.assertTrue(list_view.scroll_by(500, duration=300))
+            self.assertTrue(driver.pump(PumpKind.SETTLE))
+        self.assertGreater(stats.frame_count, 0)
+        self.assertGreaterEqual(stats.frame_count, stats.jank_frames)
+
+        # Collect the texts of all the rows in a single request
+        self.assertTrue(list_view.scroll_by(0))
+        rows = list_view.collect([PropertyKind.TEXT, PropertyKind.VISIBLE])
+        self.assertEqual(rows[0], {"text": "0", "visible": True})
+
+        # Capture only the pixels of the elements
+        self.assertTrue(text_field.screenshot().startswith(b"\x89PNG"))
+        self.assertEqual(len(app_bar_texts.screenshot(scale=0.5)), 1)
+
+        # Query a snapshot of the tree without going to the browser again
+        snapshot = driver.snapshot(chunk_size=100)
+        list_view_node = snapshot.get(By.label("list-view"))
+        self.assertIsNotNone(list_view_node)
+        self.assertEqual(list_view_node.get(By.text("0")).text, "0")
+        self.assertEqual(len(snapshot.get_all(By.text(app_bar_text))), 1)
+
+        # Elements are compared by the path they are found with
+        self.assertEqual(list_view.get(By.text("0")), list_view.get(By.text("0")))
+        self.assertEqual(len({list_view, driver.get(By.label("list-view"))}), 1)
+
+        # Talk to the page over the DevTools protocol instead of the WebDriver
+        devtools_driver = FluttereniumDriver(
+            browser_kind=BrowserKind.CHROME,
+            execution_kind=ExecutionKind.DEVTOOLS,
+        )
+        devtools_driver.open("http://127.0.0.1:5500")
+        self.assertEqual(devtools_driver.get(By.text(app_bar_text)).get_text(), app_bar_text)
+        self.assertEqual(devtools_driver.get_event_logs_size(), 0)
+
+        # Drive another session of the app from a tab of the same browser
+        tab = devtools_driver.new_tab(execution_kind=ExecutionKind.DEVTOOLS)
+        self.assertTrue(tab.get(By.text("Enter here")).set_text("from the tab"))
+        self.assertEqual(tab.get(By.text("Enter here")).get_text(), "from the tab")
+        self.assertNotEqual(
+            devtools_driver.get(By.text("Enter here")).get_text(), "from the tab"
+        )
+        tab.close()
+        devtools_driver.close(with_browser=True)
+
 
 if __name__ == "__main__":
     unittest.main()
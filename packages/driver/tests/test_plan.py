@@ -0,0 +1,61 @@
+import unittest
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+
+
+class TestPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.web_driver = FakeWebDriver(FakePage(build_example_tree(rows=5)))
+        self.instrumentation = Instrumentation()
+        self.driver = FluttereniumDriver(
+            BrowserKind.CHROME,
+            instrumentation=self.instrumentation,
+            web_driver=self.web_driver,
+        )
+        self.driver.open("http://127.0.0.1:5500")
+
+    def count(self, action_type: str) -> int:
+        return sum(
+            1
+            for timing in self.instrumentation.timings
+            if timing.action_type == action_type
+        )
+
+    def record(self) -> Plan:
+        with self.driver.prepare() as plan:
+            plan.get(By.text("Enter here")).set_text(Param("text"))
+            plan.get(By.text("Enter here")).get_text()
+        return plan
+
+    def test_runs_with_the_params(self):
+        plan = self.record()
+        for text in ("first", "second"):
+            [(did_set, _), (did_get, data)] = plan.run(text=text)
+            self.assertTrue(did_set and did_get)
+            self.assertEqual(data["text"], text)
+        self.assertEqual(self.count("prepare"), 1)
+        self.assertEqual(self.count("plan"), 2)
+
+    def test_prepared_again_once_forgotten(self):
+        plan = self.record()
+        self.driver.reload_app()
+        self.assertEqual(plan.run(text="after reload")[1][1]["text"], "after reload")
+        self.assertEqual(self.count("prepare"), 2)
+
+    def test_close_releases_the_plan(self):
+        plan = self.record()
+        self.assertEqual(self.web_driver.page.plan_count, 1)
+        plan.close()
+        self.assertEqual(self.web_driver.page.plan_count, 0)
+        self.assertEqual(self.count("release"), 1)
+        # closing again has nothing to release
+        plan.close()
+        self.assertEqual(self.count("release"), 1)
+        self.assertEqual(plan.run(text="reopened")[1][1]["text"], "reopened")
+        self.assertEqual(self.web_driver.page.plan_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
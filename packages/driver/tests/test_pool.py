@@ -0,0 +1,103 @@
+from datetime import timedelta
+import threading
+import unittest
+from unittest import mock
+
+from selenium.common.exceptions import WebDriverException
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+
+URL = "http://127.0.0.1:5500"
+
+
+class _Browser(FakeWebDriver):
+    def __init__(self):
+        super().__init__(FakePage(build_example_tree(rows=5)))
+        self.did_quit = False
+
+    def quit(self) -> None:
+        super().quit()
+        self.did_quit = True
+
+
+class _Browsers:
+    def __init__(self, failing: set[int] = ()):
+        """
+        Launches the fake browsers in place of Chrome, the ones launched
+        at the positions present in the `failing` can't open any page.
+        """
+        self.failing = set(failing)
+        self.launched: list[_Browser] = []
+        self.__lock = threading.Lock()
+
+    def __call__(self, **kwargs) -> _Browser:
+        browser = _Browser()
+        with self.__lock:
+            if len(self.launched) in self.failing:
+                browser.get = mock.Mock(side_effect=WebDriverException("crashed"))
+            self.launched.append(browser)
+        return browser
+
+
+class TestDriverPool(unittest.TestCase):
+
+    def launch(self, browsers: _Browsers, size: int) -> DriverPool:
+        # replacements are launched while leasing, so keep it patched till the end
+        patcher = mock.patch("lib.driver.webdriver.Chrome", browsers)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return DriverPool(URL, size=size)
+
+    def test_leased_driver_returns_to_the_pool(self):
+        browsers = _Browsers()
+        with self.launch(browsers, size=2) as pool:
+            self.assertEqual(pool.size, 2)
+            with pool.lease() as first, pool.lease() as second:
+                self.assertIsNot(first, second)
+                with self.assertRaises(TimeoutError):
+                    with pool.lease(timeout=timedelta(milliseconds=10)):
+                        pass
+            with pool.lease(timeout=timedelta(seconds=1)) as driver:
+                self.assertIn(driver, (first, second))
+        self.assertTrue(all(browser.did_quit for browser in browsers.launched))
+
+    def test_failed_launch_quits_the_launched_browsers(self):
+        browsers = _Browsers(failing={1})
+        with self.assertRaises(WebDriverException):
+            self.launch(browsers, size=3)
+        self.assertEqual(len(browsers.launched), 3)
+        self.assertTrue(all(browser.did_quit for browser in browsers.launched))
+
+    def test_error_of_the_block_is_not_hidden_by_the_reset(self):
+        browsers = _Browsers()
+        with self.launch(browsers, size=1) as pool:
+            with self.assertRaises(ValueError):
+                with pool.lease() as driver:
+                    driver.reload_app = mock.Mock(side_effect=RuntimeError("reset"))
+                    raise ValueError("test")
+            # slot is still there, so the next lease gets a driver
+            with pool.lease(timeout=timedelta(seconds=1)) as driver:
+                self.assertTrue(driver.get(By.text("Enter here")).is_valid())
+
+    def test_crashed_driver_is_replaced(self):
+        browsers = _Browsers(failing={1})
+        with self.launch(browsers, size=1) as pool:
+            # first replacement couldn't open the page, yet the slot is kept
+            # & a driver gets launched for it on the next lease
+            with self.assertRaises(WebDriverException):
+                with pool.lease() as crashed:
+                    crashed.reload_app = mock.Mock(
+                        side_effect=WebDriverException("crashed")
+                    )
+            self.assertEqual(pool.size, 0)
+            with pool.lease(timeout=timedelta(seconds=1)) as driver:
+                self.assertIsNot(driver, crashed)
+                self.assertTrue(driver.is_ready())
+            self.assertEqual(pool.size, 1)
+        self.assertEqual(len(browsers.launched), 3)
+        self.assertTrue(all(browser.did_quit for browser in browsers.launched))
+
+
+if __name__ == "__main__":
+    unittest.main()
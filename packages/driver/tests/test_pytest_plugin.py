@@ -0,0 +1,153 @@
+import json
+import random
+import unittest
+from unittest import mock
+
+import pytest
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+from lib.pytest_plugin import _split
+
+pytest_plugins = ["pytester"]
+
+_TESTS = """
+from lib import By
+
+def test_first(flutterenium_driver, flutterenium_session):
+    assert flutterenium_driver is flutterenium_session
+    assert flutterenium_driver.get(By.text("1")).get_text() == "1"
+
+def test_second(flutterenium_driver):
+    assert flutterenium_driver.get(By.text("2")).get_text() == "2"
+
+def test_third(flutterenium_session):
+    assert flutterenium_session.get(By.text("3")).get_text() == "3"
+
+def test_fourth():
+    pass
+"""
+
+
+class TestSplit(unittest.TestCase):
+
+    def setUp(self):
+        generator = random.Random(0)
+        self.ids = [f"test_{index}" for index in range(40)]
+        self.durations = {id: generator.uniform(0.1, 10) for id in self.ids}
+
+    def test_every_test_lands_in_exactly_one_shard(self):
+        for count in (1, 3, 7, 50):
+            shards = _split(self.ids, self.durations, count)
+            self.assertEqual(len(shards), count)
+            self.assertEqual(
+                sorted(id for shard in shards for id in shard), sorted(self.ids)
+            )
+
+    def test_shards_are_balanced(self):
+        shards = _split(self.ids, self.durations, 4)
+        loads = [sum(self.durations[id] for id in shard) for shard in shards]
+        # a shard never exceeds the others by more than the longest test
+        self.assertLessEqual(max(loads) - min(loads), max(self.durations.values()))
+        self.assertLess(max(loads), sum(loads) / 4 * 1.1)
+
+    def test_split_is_deterministic(self):
+        shards = _split(self.ids, self.durations, 4)
+        shuffled = list(self.ids)
+        random.Random(1).shuffle(shuffled)
+        self.assertEqual(_split(shuffled, dict(self.durations), 4), shards)
+
+    def test_unknown_tests_take_the_median(self):
+        shards = _split(["new_0", "new_1", "new_2", "new_3"], {"old": 5.0}, 2)
+        self.assertEqual([len(shard) for shard in shards], [2, 2])
+        shards = _split(["new_0", "new_1"], {}, 2)
+        self.assertEqual(shards, [["new_0"], ["new_1"]])
+
+
+# The plugin is exercised by running pytest on a generated suite, which needs
+# the `pytester` fixture, so the tests below are run only by pytest
+
+
+@pytest.fixture
+def app_pytester(pytester: pytest.Pytester) -> pytest.Pytester:
+    pytester.makepyfile(test_app=_TESTS)
+    return pytester
+
+
+def _run_tests(pytester: pytest.Pytester, *args) -> pytest.RunResult:
+    return pytester.runpytest(
+        "-p",
+        "lib.pytest_plugin",
+        "--flutterenium-url",
+        "http://127.0.0.1:5500",
+        *args,
+    )
+
+
+def test_is_opt_in(app_pytester: pytest.Pytester):
+    result = app_pytester.runpytest("--flutterenium-url", "http://127.0.0.1:5500")
+    assert result.ret != 0
+    result.stderr.fnmatch_lines(["*unrecognized arguments: --flutterenium-url*"])
+
+
+def test_browser_is_launched_once_and_the_app_reloaded_per_test(
+    app_pytester: pytest.Pytester,
+):
+    with (
+        mock.patch(
+            "lib.driver.webdriver.Chrome",
+            side_effect=lambda **_: FakeWebDriver(FakePage(build_example_tree(rows=5))),
+        ) as chrome,
+        mock.patch.object(FluttereniumDriver, "reload_app", autospec=True) as reload_app,
+    ):
+        result = _run_tests(app_pytester)
+    result.assert_outcomes(passed=4)
+    assert chrome.call_count == 1
+    # the first test gets the app just opened by the session
+    assert reload_app.call_count == 1
+
+
+def test_url_is_required(app_pytester: pytest.Pytester):
+    result = app_pytester.runpytest("-p", "lib.pytest_plugin")
+    result.assert_outcomes(passed=1, errors=3)
+    result.stdout.fnmatch_lines(["*--flutterenium-url is needed*"])
+
+
+def test_shards_cover_every_test_once(app_pytester: pytest.Pytester):
+    app_pytester.makefile(
+        ".json",
+        **{
+            ".flutterenium-durations": json.dumps(
+                {"test_app.py::test_first": 3.0, "test_app.py::test_fourth": 2.0}
+            )
+        },
+    )
+    selected = []
+    for index in range(2):
+        result = _run_tests(
+            app_pytester, "--collect-only", "-q", f"--flutterenium-shard={index}/2"
+        )
+        selected.append(
+            {line for line in result.outlines if line.startswith("test_app.py::")}
+        )
+    assert selected[0] & selected[1] == set()
+    assert len(selected[0] | selected[1]) == 4
+    # the other two default to the median of 2.5, so the longest & the
+    # shortest ones share a shard to balance them
+    assert {"test_app.py::test_first", "test_app.py::test_fourth"} in selected
+
+
+def test_durations_are_recorded(app_pytester: pytest.Pytester):
+    _run_tests(app_pytester, "-k", "fourth")
+    with open(app_pytester.path / ".flutterenium-durations.json") as file:
+        durations = json.load(file)
+    assert list(durations) == ["test_app.py::test_fourth"]
+
+
+def test_invalid_shard(app_pytester: pytest.Pytester):
+    result = _run_tests(app_pytester, "--flutterenium-shard=2/2")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+from datetime import timedelta
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+from lib.internal.read_cache import ReadCache
+
+
+class _Fetch:
+    def __init__(self, is_idle: bool = True, release: threading.Event = None):
+        self.calls = 0
+        self.started = threading.Event()
+        self.__is_idle = is_idle
+        self.__release = release
+
+    def __call__(self) -> tuple[tuple[bool, dict], bool]:
+        self.calls += 1
+        self.started.set()
+        if self.__release is not None:
+            self.__release.wait(5)
+        return ((True, {"text": f"read {self.calls}"}), self.__is_idle)
+
+
+class TestReadCache(unittest.TestCase):
+
+    def test_results_are_reused_till_they_expire(self):
+        cache = ReadCache(timedelta(milliseconds=50))
+        fetch = _Fetch()
+        self.assertEqual(cache.get("key", fetch), ((True, {"text": "read 1"}), False))
+        self.assertEqual(cache.get("key", fetch), ((True, {"text": "read 1"}), True))
+        time.sleep(0.06)
+        self.assertEqual(cache.get("key", fetch), ((True, {"text": "read 2"}), False))
+        self.assertEqual(fetch.calls, 2)
+
+    def test_nothing_is_reused_by_default_or_when_busy(self):
+        for cache, fetch in (
+            (ReadCache(None), _Fetch()),
+            (ReadCache(timedelta(0)), _Fetch()),
+            (ReadCache(timedelta(minutes=1)), _Fetch(is_idle=False)),
+        ):
+            cache.get("key", fetch)
+            _, is_cached = cache.get("key", fetch)
+            self.assertFalse(is_cached)
+            self.assertEqual(fetch.calls, 2)
+
+    def test_concurrent_reads_are_sent_once(self):
+        cache = ReadCache(None)
+        release = threading.Event()
+        fetch = _Fetch(release=release)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get("key", fetch)))
+            for _ in range(4)
+        ]
+        threads[0].start()
+        fetch.started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        # the others are waiting on the read of the first one
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(fetch.calls, 1)
+        self.assertEqual(
+            sorted(is_cached for _, is_cached in results), [False, True, True, True]
+        )
+        self.assertTrue(all(response == results[0][0] for response, _ in results))
+
+    def test_reads_in_flight_are_forgotten_on_clear(self):
+        cache = ReadCache(timedelta(minutes=1))
+        release = threading.Event()
+        slow_fetch = _Fetch(release=release)
+        thread = threading.Thread(target=cache.get, args=("key", slow_fetch))
+        thread.start()
+        slow_fetch.started.wait(5)
+        cache.clear()
+        # read made after the change doesn't wait for the one made before it
+        fetch = _Fetch()
+        self.assertEqual(cache.get("key", fetch), ((True, {"text": "read 1"}), False))
+        release.set()
+        thread.join(5)
+        self.assertEqual(cache.get("key", fetch)[1], True)
+        self.assertEqual(fetch.calls, 1)
+
+
+class TestDriverReadCache(unittest.TestCase):
+
+    def open(self, **kwargs) -> FluttereniumDriver:
+        self.instrumentation = Instrumentation()
+        self.web_driver = FakeWebDriver(FakePage(build_example_tree(rows=5)))
+        driver = FluttereniumDriver(
+            BrowserKind.CHROME,
+            instrumentation=self.instrumentation,
+            web_driver=self.web_driver,
+            **kwargs,
+        )
+        driver.open("http://127.0.0.1:5500")
+        return driver
+
+    def test_reads_are_not_reused_by_default(self):
+        driver = self.open()
+        element = driver.get(By.text("1"))
+        self.assertEqual(element.get_text(), "1")
+        round_trips = self.web_driver.round_trips
+        self.assertEqual(element.get_text(), "1")
+        self.assertGreater(self.web_driver.round_trips, round_trips)
+        self.assertFalse(any(timing.cached for timing in self.instrumentation.timings))
+
+    def test_reused_reads_are_recorded_and_instrumented(self):
+        driver = self.open(read_cache_ttl=timedelta(minutes=1))
+        element = driver.get(By.text("1"))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "replay.jsonl")
+            with driver.record(path) as recorder:
+                self.assertEqual(element.get_text(), "1")
+                round_trips = self.web_driver.round_trips
+                self.assertEqual(element.get_text(), "1")
+                self.assertEqual(self.web_driver.round_trips, round_trips)
+                self.assertTrue(element.press())
+            self.assertEqual(recorder.count, 3)
+            replayer = Replayer(path)
+        self.assertEqual(
+            [entry.get("cached", False) for entry in replayer.entries],
+            [False, True, False],
+        )
+        summary = self.instrumentation.summary()
+        self.assertEqual(summary["get_text:text"]["count"], 1)
+        self.assertEqual(summary["get_text:text:cached"]["count"], 1)
+        self.assertEqual(summary["get_text:text:cached"]["visited_nodes"], 0)
+        # the cached read never reached the page, so it is not replayed
+        self.assertEqual(replayer.replay([driver]).requests, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+from datetime import timedelta
+import unittest
+from unittest import mock
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+
+
+class TestReload(unittest.TestCase):
+
+    def setUp(self):
+        self.web_driver = FakeWebDriver(FakePage(build_example_tree(rows=5)))
+        patcher = mock.patch(
+            "lib.driver.webdriver.Chrome", return_value=self.web_driver
+        )
+        self.chrome = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.driver = FluttereniumDriver(BrowserKind.CHROME)
+        self.driver.open("http://127.0.0.1:5500")
+
+    def test_app_restarts_in_the_same_browser(self):
+        self.assertTrue(self.driver.get(By.text("1")).press())
+        self.driver.reload_app()
+        self.assertEqual(self.chrome.call_count, 1)
+        # browser was already running, so its launch isn't accounted
+        self.assertEqual(self.driver.startup_timing.launch, timedelta(0))
+        self.assertEqual(self.driver.get(By.text("1")).get_text(), "1")
+
+    def test_reload_into_another_url(self):
+        self.driver.reload_app("http://127.0.0.1:5500/#/other")
+        self.assertEqual(self.web_driver.current_url, "http://127.0.0.1:5500/#/other")
+        self.assertTrue(self.driver.is_ready())
+
+    def test_open_skips_the_ready_app(self):
+        startup_timing = self.driver.startup_timing
+        self.driver.open("http://127.0.0.1:5500")
+        # the page didn't get loaded again
+        self.assertIs(self.driver.startup_timing, startup_timing)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+
+
+def _open() -> FluttereniumDriver:
+    driver = FluttereniumDriver(
+        BrowserKind.CHROME,
+        web_driver=FakeWebDriver(FakePage(build_example_tree(rows=10))),
+    )
+    driver.open("http://127.0.0.1:5500")
+    return driver
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "replay.jsonl")
+        self.driver = _open()
+        with self.driver.record(self.path) as recorder:
+            list_view = self.driver.get(By.label("list-view"))
+            self.assertTrue(list_view.get(By.text("0")).is_valid())
+            self.assertTrue(self.driver.get(By.text("Enter here")).set_text("Hello"))
+            self.assertTrue(self.driver.pump())
+            self.assertFalse(self.driver.get(By.text("missing")).is_valid())
+        self.recorder = recorder
+
+    def test_every_request_is_recorded(self):
+        self.assertEqual(self.recorder.count, 4)
+        with open(self.path) as file:
+            header, *entries = [json.loads(line) for line in file]
+        self.assertEqual(header, {"version": 1})
+        self.assertEqual(len(entries), 4)
+        self.assertTrue(all(entry["wait"] == 0 for entry in entries))
+        self.assertEqual(
+            [entry["at"] for entry in entries], sorted(entry["at"] for entry in entries)
+        )
+
+    def test_requests_made_after_the_recording_are_not_recorded(self):
+        self.driver.pump()
+        self.assertEqual(self.recorder.count, 4)
+
+    def test_replay_kinds(self):
+        for kind, requests in (
+            (ReplayKind.FAST, 4),
+            (ReplayKind.ORIGINAL, 4),
+            # all of them are made for the actions, so they become a single batch
+            (ReplayKind.BATCHED, 1),
+        ):
+            report = self.driver.replay(self.path, kind=kind, iterations=2)
+            self.assertEqual(report.requests, requests * 2, kind)
+            # finding the missing element fails every time, even as a step
+            self.assertEqual(report.failures, 2, kind)
+            self.assertGreater(report.throughput, 0)
+            self.assertLessEqual(report.percentile(50), report.summary()["max"])
+
+    def test_replay_in_many_sessions(self):
+        drivers = [_open() for _ in range(3)]
+        report = Replayer(self.path).replay(drivers, iterations=2)
+        self.assertEqual(report.requests, 4 * 2 * 3)
+        self.assertEqual(
+            [driver.get(By.text("Hello")).get_text() for driver in drivers],
+            ["Hello"] * 3,
+        )
+
+    def test_unknown_version_is_rejected(self):
+        with open(self.path, "w") as file:
+            file.write(json.dumps({"version": 0}) + "\n")
+        with self.assertRaises(ValueError):
+            Replayer(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+from datetime import timedelta
+import unittest
+
+from benchmarks.fake import FakeNode, FakePage, FakeWebDriver, build_example_tree
+from lib import *
+from lib.internal.utils import to_action_response, to_pump_action
+
+
+def _build_tree() -> FakeNode:
+    # "a" is present both shallow & deep, so that the depth first &
+    # breadth first orders of the matches differ from each other
+    return FakeNode(
+        "Column",
+        [
+            FakeNode("Padding", [FakeNode("Padding", [FakeNode("Text", text="a")])]),
+            FakeNode("Text", text="a", label="shallow"),
+            build_example_tree(rows=5),
+        ],
+    )
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = FluttereniumDriver(
+            BrowserKind.CHROME,
+            web_driver=FakeWebDriver(FakePage(_build_tree())),
+        )
+        self.driver.open("http://127.0.0.1:5500")
+        self.snapshot = self.driver.snapshot(chunk_size=7)
+
+    def test_matches_the_page(self):
+        self.assertEqual(
+            len(self.snapshot.get_all(By.text("a"))),
+            len(self.driver.get_all(By.text("a"))),
+        )
+        list_view = self.snapshot.get(By.label("list-view"))
+        self.assertEqual(list_view.get(By.text("3")).text, "3")
+        self.assertIsNone(list_view.get(By.text("a")))
+        self.assertEqual(list_view.get_parent().type, "Column")
+
+    def test_scope_is_honoured(self):
+        for by in (
+            By.text("a").scoped(max_depth=1),
+            By.text("a").scoped(breadth_first=True),
+            By.text("3").scoped(max_depth=4),
+        ):
+            nodes = self.snapshot.get_all(by)
+            elements = self.driver.get_all(by)
+            self.assertEqual(len(nodes), len(elements), by.scope)
+            self.assertEqual([node.text for node in nodes], elements.get_text())
+        self.assertEqual(
+            self.snapshot.get(By.text("a").scoped(breadth_first=True)).label,
+            "shallow",
+        )
+        self.assertIsNone(self.snapshot.get(By.text("a")).label)
+        self.assertEqual(len(self.snapshot.get_all(By.text("a").scoped(max_depth=1))), 1)
+
+    def test_visibility_scopes_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.snapshot.get(By.text("a").scoped(visible_only=True))
+        with self.assertRaises(ValueError):
+            self.snapshot.get_all(By.text("a").scoped(skip_offstage=True))
+
+
+
+class TestSnapshotChunks(unittest.TestCase):
+
+    def setUp(self):
+        self.page = FakePage(_build_tree())
+        self.requests = 0
+
+    def execute(self, actions):
+        self.requests += 1
+        return to_action_response(self.page.handle_request({"actions": actions}))
+
+    def test_chunks_are_not_kept_once_transferred(self):
+        snapshot = Snapshot.take(self.execute, chunk_size=7)
+        self.assertEqual(self.requests, -(-len(snapshot) // 7))
+        self.assertEqual(self.page.pending_snapshot_count, 0)
+
+    def test_pump_between_the_chunks_fails_the_snapshot(self):
+        def execute(actions):
+            if self.requests == 1:
+                self.execute([to_pump_action(PumpKind.NORMAL, timedelta(0))])
+            return self.execute(actions)
+
+        self.assertIsNone(Snapshot.take(execute, chunk_size=7))
+        self.assertEqual(self.page.pending_snapshot_count, 0)
+
+    def test_abandoned_snapshot_is_released(self):
+        def execute(actions):
+            if self.requests == 1:
+                self.requests += 1
+                raise TimeoutError("no response")
+            return self.execute(actions)
+
+        with self.assertRaises(TimeoutError):
+            Snapshot.take(execute, chunk_size=7)
+        self.assertEqual(self.page.pending_snapshot_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+from datetime import timedelta
+import unittest
+from unittest import mock
+
+from benchmarks.fake import FakePage, FakeWebDriver, build_example_tree
+from lib import *
+
+
+class TestTabs(unittest.TestCase):
+
+    def setUp(self):
+        self.web_driver = FakeWebDriver(FakePage(build_example_tree(rows=5)))
+
+    def open(self, **kwargs) -> FluttereniumDriver:
+        driver = FluttereniumDriver(
+            BrowserKind.CHROME, web_driver=self.web_driver, **kwargs
+        )
+        driver.open("http://127.0.0.1:5500")
+        return driver
+
+    def test_default_driver_switches_to_polling(self):
+        driver = self.open()
+        tab = driver.new_tab()
+        self.assertTrue(tab.get(By.text("Enter here")).set_text("Tab"))
+        self.assertTrue(driver.get(By.text("Enter here")).set_text("Driver"))
+        self.assertEqual(tab.get(By.text("Tab")).get_text(), "Tab")
+        self.assertEqual(driver.get(By.text("Driver")).get_text(), "Driver")
+
+    def test_async_tabs_are_rejected(self):
+        driver = self.open(execution_kind=ExecutionKind.POLL)
+        with self.assertRaisesRegex(ValueError, "execution_kind"):
+            driver.new_tab(execution_kind=ExecutionKind.ASYNC)
+
+    def test_script_timeout_is_shared_by_the_tabs(self):
+        driver = self.open(
+            execution_kind=ExecutionKind.POLL, timeout=timedelta(seconds=30)
+        )
+        # a shorter timeout of a tab must not cut the one of the driver
+        driver.new_tab(timeout=timedelta(seconds=5))
+        driver.new_tab(timeout=timedelta(seconds=60))
+        self.assertEqual(self.web_driver.script_timeouts, [31, 61])
+
+    def test_devtools_target_of_some_other_window_is_not_used(self):
+        self.web_driver.capabilities = {
+            "goog:chromeOptions": {"debuggerAddress": "127.0.0.1:9222"}
+        }
+        response = mock.MagicMock()
+        response.__enter__.return_value.read.return_value = (
+            b'[{"id": "other", "type": "page", "webSocketDebuggerUrl": "ws://other"}]'
+        )
+        with (
+            mock.patch("lib.transport.websocket", mock.MagicMock()),
+            mock.patch("urllib.request.urlopen", return_value=response),
+            self.assertRaisesRegex(ValueError, "window-0"),
+        ):
+            DevToolsTransport(self.web_driver, event_logs_limit=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -53,16 +53,19 @@ class MyApp extends StatelessWidget {
               const _TextFieldWithToastButton(),
               const SizedBox(height: 12.0),
               Expanded(
-                child: ListView(
-                  children: List.generate(25, (index) {
-                    return Padding(
-                      padding: const EdgeInsets.all(24.0),
-                      child: Text(
-                        index.toString(),
-                      ),
-                    );
-                  }),
-                )..label = 'list-view',
+                child: Labelled(
+                  label: 'list-view',
+                  child: ListView(
+                    children: List.generate(25, (index) {
+                      return Padding(
+                        padding: const EdgeInsets.all(24.0),
+                        child: Text(
+                          index.toString(),
+                        ),
+                      );
+                    }),
+                  ),
+                ),
               ),
             ],
           ),
@@ -8,6 +8,7 @@ import 'dart:convert';
 import 'dart:js_interop' as js_interop;
 import 'dart:js_interop_unsafe' as js_interop_unsafe;
 
+import 'package:flutter/scheduler.dart';
 import 'package:flutter/widgets.dart' hide Action, ScrollAction;
 import 'package:flutter_web_plugins/flutter_web_plugins.dart';
 
@@ -15,6 +16,8 @@ import 'package:web/web.dart' as web;
 
 import 'flutterenium_platform_interface.dart';
 import 'src/actions/index.dart';
+import 'src/metrics.dart';
+import 'src/plan.dart';
 
 /// A web implementation of the FluttereniumPlatform of the Flutterenium plugin.
 class FluttereniumWeb extends FluttereniumPlatform {
@@ -32,36 +35,164 @@ class FluttereniumWeb extends FluttereniumPlatform {
     return version;
   }
 
-  void _eventHandler(web.Event event) async {
-    if (event is! web.CustomEvent) {
-      return;
+  List<Action> _parseActions(List<dynamic> actions) {
+    return <Action>[
+      for (final action in actions) Action.fromJson(action),
+    ];
+  }
+
+  /// Executes the [actions] one after the other till any one of
+  /// them fails & returns whether all of them got succeeded along
+  /// with the data they produced.
+  ///
+  /// <br>
+  /// If the [actions] contains a [WaitUntilAction], then the rest
+  /// of them will be re-executed once per frame till they succeed.
+  Future<(bool, Map<String, dynamic>)> _executeActions(
+    List<Action> actions,
+    RequestMetrics metrics,
+  ) async {
+    final waitUntilAction = actions.whereType<WaitUntilAction>().firstOrNull;
+    if (waitUntilAction == null) {
+      return _executeActionsOnce(actions, metrics);
     }
-    bool didSucceeded = false;
-    String? id;
+    final actionsToRetry = [
+      for (final action in actions)
+        if (action is! WaitUntilAction) action,
+    ];
+    final waitTill = waitUntilAction.currentDateTime.add(
+      waitUntilAction.timeout,
+    );
+    while (true) {
+      final result = await _executeActionsOnce(actionsToRetry, metrics);
+      final (didSucceeded, _) = result;
+      if (didSucceeded || waitUntilAction.currentDateTime.isAfter(waitTill)) {
+        return result;
+      }
+      await waitUntilAction.execute(binding);
+    }
+  }
+
+  /// Executes every step independently, as if each one of
+  /// them was sent in a separate request
+  Future<List<Map<String, dynamic>>> _executeSteps(
+    List<List<Action>> steps,
+    RequestMetrics metrics, {
+    required bool stopOnFailure,
+  }) async {
+    final results = <Map<String, dynamic>>[];
+    for (final step in steps) {
+      final (didStepSucceeded, stepResponse) = await _executeActions(
+        step,
+        metrics,
+      );
+      results.add(_toResult((didStepSucceeded, stepResponse)));
+      if (!didStepSucceeded && stopOnFailure) {
+        break;
+      }
+    }
+    return results;
+  }
+
+  Map<String, dynamic> _toResult((bool, Map<String, dynamic>) result) {
+    final (didSucceeded, response) = result;
+    return {
+      'didSucceeded': didSucceeded,
+      if (didSucceeded) 'data': response,
+    };
+  }
+
+  /// If [root] is not `null`, then [actions] will be
+  /// executed as if it is the element found so far.
+  Future<(bool, Map<String, dynamic>)> _executeActionsOnce(
+    List<Action> actions,
+    RequestMetrics metrics, {
+    Element? root,
+  }) async {
+    bool didSucceeded = root != null;
     final response = <String, dynamic>{};
     try {
-      final json = jsonDecode(jsonEncode(event.detail.dartify()));
-      if (json is! Map) {
-        return;
+      Element? element = root;
+      int start = 0;
+      // Resume from the deepest handle which is still valid, as all
+      // the actions before it were only meant to find its element.
+      for (int i = actions.length - 1; i >= 0; --i) {
+        final action = actions[i];
+        if (action is HandleAction) {
+          final handleElement = ElementHandles.get(action.id);
+          if (handleElement != null) {
+            element = handleElement;
+            start = i + 1;
+            didSucceeded = true;
+            break;
+          }
+        }
       }
-      id = json['id'];
-      final actions = json['actions'];
-      Element? element;
-      for (int i = 0; i < actions.length; ++i) {
-        final action = Action.fromJson(actions[i]);
+      for (int i = start; i < actions.length; ++i) {
+        final action = actions[i];
         switch (action) {
           case FrameworkAction():
             switch (action) {
+              case FindAllAction():
+                final visitedNodes = FindAction.visitedNodes;
+                metrics.findStopwatch.start();
+                final elements = action.findAll(
+                  binding,
+                  root: element,
+                  skipCurrent: element != null,
+                );
+                metrics.findStopwatch.stop();
+                metrics.visitedNodes += FindAction.visitedNodes - visitedNodes;
+                // rest of the actions are meant for each one of
+                // the matches, so they are executed right here
+                final remainingActions = actions.sublist(i + 1);
+                response['elements'] = [
+                  for (final match in elements)
+                    _toResult(
+                      await _executeActionsOnce(
+                        remainingActions,
+                        metrics,
+                        root: match,
+                      ),
+                    ),
+                ];
+                return (true, response);
               case FindAction():
+                final visitedNodes = FindAction.visitedNodes;
+                metrics.findStopwatch.start();
                 element = action.execute(
                   binding,
                   root: element,
                   skipCurrent: element != null,
                 );
+                metrics.findStopwatch.stop();
+                metrics.visitedNodes += FindAction.visitedNodes - visitedNodes;
                 didSucceeded = element != null;
                 break;
+              case SnapshotAction():
+                metrics.executeStopwatch.start();
+                final snapshot = action.execute(binding, root: element);
+                response['snapshot'] = snapshot;
+                metrics.executeStopwatch.stop();
+                didSucceeded = snapshot != null;
+                break;
+              case StopFrameTimingsAction():
+                response['frameTimings'] = await action.execute(binding);
+                didSucceeded = true;
+                break;
               case _:
-                await action.execute(binding);
+                metrics.executeStopwatch.start();
+                final result = await action.execute(binding);
+                metrics.executeStopwatch.stop();
+                if (action is PumpAndSettleAction) {
+                  response['settleFrames'] = result;
+                }
+                if (action is PumpAction) {
+                  // frames got pumped, so the elements remembered
+                  // earlier might not be the same anymore
+                  ElementHandles.clear();
+                  SnapshotAction.clear();
+                }
                 didSucceeded = true;
                 break;
             }
@@ -72,14 +203,31 @@ class FluttereniumWeb extends FluttereniumPlatform {
                 'Something went wrong while executing `FindAction`, because element cannot be null at this stage',
               );
             }
+            metrics.executeStopwatch.start();
             switch (action) {
               case GetTextAction():
                 response['text'] = action.execute(binding, element);
                 break;
+              case ScreenshotAction():
+                final screenshot = await action.execute(binding, element);
+                response['screenshot'] = screenshot;
+                didSucceeded = screenshot != null;
+                break;
+              case CollectAction():
+                response['values'] = action.execute(binding, element);
+                didSucceeded = true;
+                break;
+              case ScrollUntilVisibleAction():
+                final (found, scrolls) = await action.execute(binding, element);
+                response['found'] = found;
+                response['scrolls'] = scrolls;
+                didSucceeded = true;
+                break;
               case _:
                 didSucceeded = await action.execute(binding, element);
                 break;
             }
+            metrics.executeStopwatch.stop();
             break;
           case _:
             throw UnimplementedError("$action is not supported yet");
@@ -95,6 +243,69 @@ class FluttereniumWeb extends FluttereniumPlatform {
       debugPrintStack(stackTrace: stackTrace);
       didSucceeded = false;
     } finally {
+      metrics.findStopwatch.stop();
+      metrics.executeStopwatch.stop();
+    }
+    return (didSucceeded, response);
+  }
+
+  void _eventHandler(web.Event event) async {
+    if (event is! web.CustomEvent) {
+      return;
+    }
+    bool didSucceeded = false;
+    String? id;
+    var response = <String, dynamic>{};
+    final metrics = RequestMetrics();
+    try {
+      final json = jsonDecode(jsonEncode(event.detail.dartify()));
+      if (json is! Map) {
+        return;
+      }
+      id = json['id'];
+      final steps = json['steps'];
+      final String? planId = json['plan'];
+      if (json['prepare'] != null) {
+        Plan.put(
+          json['prepare'],
+          Plan(steps, stopOnFailure: json['stopOnFailure'] ?? false),
+        );
+        didSucceeded = true;
+      } else if (json['release'] != null) {
+        Plan.remove(json['release']);
+        didSucceeded = true;
+      } else if (planId != null) {
+        // plan won't be there once the app is reloaded or it got evicted,
+        // the failure lets the driver know that it has to be prepared again
+        final plan = Plan.get(planId);
+        if (plan != null) {
+          response['steps'] = await _executeSteps(
+            plan.resolve(Map<String, dynamic>.from(json['params'] ?? {})),
+            metrics,
+            stopOnFailure: plan.stopOnFailure,
+          );
+          didSucceeded = true;
+        }
+      } else if (steps == null) {
+        (didSucceeded, response) = await _executeActions(
+          _parseActions(json['actions']),
+          metrics,
+        );
+      } else {
+        response['steps'] = await _executeSteps(
+          [for (final step in steps) _parseActions(step)],
+          metrics,
+          stopOnFailure: json['stopOnFailure'] ?? false,
+        );
+        didSucceeded = true;
+      }
+    } catch (error, stackTrace) {
+      debugPrint(error.toString());
+      debugPrintStack(stackTrace: stackTrace);
+      didSucceeded = false;
+    } finally {
+      metrics.idle = binding.schedulerPhase == SchedulerPhase.idle &&
+          !binding.hasScheduledFrame;
       web.window.dispatchEvent(
         web.CustomEvent(
           responseEventName,
@@ -103,6 +314,7 @@ class FluttereniumWeb extends FluttereniumPlatform {
               'id': id,
               'didSucceeded': didSucceeded,
               if (didSucceeded) 'data': response,
+              'metrics': metrics.toJson(),
             }.jsify(),
           ),
         ),
@@ -112,6 +324,9 @@ class FluttereniumWeb extends FluttereniumPlatform {
 
   @override
   void onReady() {
+    // Driver might start listening for the event only after it got
+    // dispatched, so leave a mark which it can check upfront
+    web.window.setProperty(readyEventName.toJS, true.toJS);
     web.window.dispatchEvent(web.CustomEvent(readyEventName));
   }
 
@@ -0,0 +1,74 @@
+import 'package:flutter/rendering.dart';
+import 'package:flutter/widgets.dart' hide Action;
+
+import '../../extensions.dart';
+import '../framework/index.dart';
+import 'element.dart';
+import 'get_text.dart';
+import 'is_visible.dart';
+
+/// Walks the subtree of the element once & collects the requested
+/// [properties] of every element matched by the [finder], in the
+/// order they are present in the tree.
+///
+/// <br>
+/// Values are returned as a row per element, in the same order
+/// as the [properties].
+class CollectAction extends ElementAction {
+  const CollectAction(this.properties, this.finder)
+      : _getTextAction = const GetTextAction(),
+        _isVisibleAction = const IsVisibleAction();
+
+  factory CollectAction.fromJson(Map<String, dynamic> json) {
+    final finder = json['finder'];
+    return CollectAction(
+      List<String>.from(json['properties']),
+      finder == null
+          ? const FindWithContentAction()
+          : FindAction.fromJson(finder),
+    );
+  }
+
+  final List<String> properties;
+  final FindAction finder;
+  final GetTextAction _getTextAction;
+  final IsVisibleAction _isVisibleAction;
+
+  List<double>? _boundsOf(Element element) {
+    final renderObject = element.renderObject;
+    if (renderObject is! RenderBox ||
+        !renderObject.attached ||
+        !renderObject.hasSize) {
+      return null;
+    }
+    final bounds = renderObject.globalPaintBounds;
+    return [bounds.left, bounds.top, bounds.right, bounds.bottom];
+  }
+
+  dynamic _valueOf(WidgetsBinding binding, Element element, String property) {
+    return switch (property) {
+      'text' => _getTextAction.execute(binding, element),
+      'label' => element.widget.label,
+      'visible' => _isVisibleAction.execute(binding, element),
+      'type' => element.widget.runtimeType.toString(),
+      'bounds' => _boundsOf(element),
+      _ => throw UnimplementedError('$property is not supported yet'),
+    };
+  }
+
+  @override
+  List<List<dynamic>> execute(WidgetsBinding binding, Element element) {
+    final elements = FindAllAction(finder).findAll(
+      binding,
+      root: element,
+      skipCurrent: true,
+    );
+    return [
+      for (final match in elements)
+        [
+          for (final property in properties)
+            _valueOf(binding, match, property),
+        ],
+    ];
+  }
+}
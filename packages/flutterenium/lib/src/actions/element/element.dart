@@ -3,9 +3,14 @@ import 'dart:async';
 import 'package:flutter/widgets.dart' hide Action, ScrollAction;
 
 import '../action.dart';
+import 'collect.dart';
 import 'press.dart';
 import 'get_text.dart';
+import 'handle.dart';
+import 'has_text.dart';
+import 'screenshot.dart';
 import 'scroll.dart';
+import 'scroll_until_visible.dart';
 import 'set_text.dart';
 import 'is_visible.dart';
 
@@ -20,6 +25,11 @@ abstract class ElementAction extends Action {
       'scroll' => ScrollAction.fromJson(data),
       'is_visible' => const IsVisibleAction(),
       'press' => PressAction.fromJson(data),
+      'handle' => HandleAction.fromJson(data),
+      'has_text' => HasTextAction.fromJson(data),
+      'scroll_until_visible' => ScrollUntilVisibleAction.fromJson(data),
+      'collect' => CollectAction.fromJson(data),
+      'screenshot' => ScreenshotAction.fromJson(data),
       _ => throw UnimplementedError(),
     };
   }
@@ -0,0 +1,89 @@
+import 'dart:math' as math;
+
+import 'package:flutter/widgets.dart' hide Action;
+
+import 'element.dart';
+
+/// Keeps track of the elements which are resolved by the driver
+/// against an id, so that the upcoming requests can reuse them
+/// instead of crawling the whole tree again to find them.
+class ElementHandles {
+  ElementHandles._();
+
+  /// Once the handles grow to this size, the ones which can't be
+  /// used anymore are removed before remembering a new one
+  static const _sweepThreshold = 256;
+
+  /// Held weakly, so that a handle never keeps an unmounted
+  /// element or the widget it was built with alive
+  static final _handles =
+      <String, (WeakReference<Element>, WeakReference<Widget>)>{};
+
+  static int _sweepAt = _sweepThreshold;
+
+  static Element? _resolve(
+    (WeakReference<Element>, WeakReference<Widget>) handle,
+  ) {
+    final element = handle.$1.target;
+    if (element == null ||
+        !element.mounted ||
+        !identical(element.widget, handle.$2.target)) {
+      // element got unmounted or rebuilt with a new widget,
+      // so what was found earlier can't be trusted anymore
+      return null;
+    }
+    return element;
+  }
+
+  /// Returns the [Element] remembered against the [id], if it
+  /// is still safe to perform actions on it, else `null`.
+  static Element? get(String id) {
+    final handle = _handles[id];
+    if (handle == null) {
+      return null;
+    }
+    final element = _resolve(handle);
+    if (element == null) {
+      _handles.remove(id);
+    }
+    return element;
+  }
+
+  static void put(String id, Element element) {
+    if (_handles.length >= _sweepAt) {
+      // handles which are never looked up again would otherwise stay
+      // till the next pump, so drop the stale ones in one go & sweep
+      // again only once the remaining ones double
+      _handles.removeWhere((_, handle) => _resolve(handle) == null);
+      _sweepAt = math.max(_sweepThreshold, _handles.length * 2);
+    }
+    _handles[id] = (WeakReference(element), WeakReference(element.widget));
+  }
+
+  static void clear() {
+    _handles.clear();
+    _sweepAt = _sweepThreshold;
+  }
+}
+
+/// Remembers the [Element] found so far against the [id].
+///
+/// <br>
+/// If a request contains this action & the [id] still points to
+/// a valid element, then all the actions before this will be
+/// skipped & execution resumes right after this action.
+class HandleAction extends ElementAction {
+  const HandleAction(this.id);
+
+  factory HandleAction.fromJson(Map<String, dynamic> json) {
+    return HandleAction(json['id']);
+  }
+
+  final String id;
+
+  @override
+  bool execute(WidgetsBinding binding, Element element) {
+    ElementHandles.put(id, element);
+    return true;
+  }
+}
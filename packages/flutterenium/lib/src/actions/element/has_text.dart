@@ -0,0 +1,20 @@
+import 'package:flutter/widgets.dart' hide Action;
+
+import 'element.dart';
+import 'get_text.dart';
+
+class HasTextAction extends ElementAction {
+  const HasTextAction(this.text) : _getTextAction = const GetTextAction();
+
+  factory HasTextAction.fromJson(Map<String, dynamic> json) {
+    return HasTextAction(json['text']);
+  }
+
+  final String text;
+  final GetTextAction _getTextAction;
+
+  @override
+  bool execute(WidgetsBinding binding, Element element) {
+    return _getTextAction.execute(binding, element) == text;
+  }
+}
@@ -4,3 +4,8 @@ export 'set_text.dart';
 export 'scroll.dart';
 export 'is_visible.dart';
 export 'press.dart';
+export 'handle.dart';
+export 'has_text.dart';
+export 'scroll_until_visible.dart';
+export 'collect.dart';
+export 'screenshot.dart';
@@ -0,0 +1,73 @@
+import 'dart:convert';
+import 'dart:ui' as ui;
+
+import 'package:flutter/rendering.dart';
+import 'package:flutter/widgets.dart' hide Action;
+
+import 'element.dart';
+
+/// Captures only the region the element is painted in as a PNG,
+/// encoded in base64, so that just the element's pixels are
+/// transferred instead of the whole window.
+///
+/// <br>
+/// The image is captured at the device pixel ratio multiplied by
+/// the [scale], so a [scale] below 1 downscales it. Returns `null`
+/// if the element is not painted.
+class ScreenshotAction extends ElementAction {
+  const ScreenshotAction(this.scale);
+
+  factory ScreenshotAction.fromJson(Map<String, dynamic> json) {
+    return ScreenshotAction((json['scale'] ?? 1).toDouble());
+  }
+
+  final double scale;
+
+  @override
+  Future<String?> execute(WidgetsBinding binding, Element element) async {
+    final renderObject = element.renderObject;
+    if (renderObject is! RenderBox ||
+        !renderObject.attached ||
+        !renderObject.hasSize) {
+      return null;
+    }
+    if (binding.hasScheduledFrame) {
+      // layers are up to date only once the pending frame is painted,
+      // `debugNeedsPaint` can't tell it as it works only in debug builds
+      await binding.endOfFrame;
+    }
+    // Only the layer of a repaint boundary can be turned into an image,
+    // so capture the nearest one & crop the element's region out of it.
+    // `RenderView` is skipped as its layer scales by the pixel ratio.
+    RenderObject? boundary = renderObject;
+    while (boundary != null &&
+        (!boundary.isRepaintBoundary || boundary is RenderView)) {
+      boundary = boundary.parent;
+    }
+    // ignore: invalid_use_of_protected_member
+    final layer = boundary?.layer;
+    if (boundary == null || layer is! OffsetLayer) {
+      return null;
+    }
+    final bounds = MatrixUtils.transformRect(
+      renderObject.getTransformTo(boundary),
+      renderObject.paintBounds,
+    );
+    final devicePixelRatio = element
+            .findAncestorWidgetOfExactType<View>()
+            ?.view
+            .devicePixelRatio ??
+        binding.platformDispatcher.implicitView?.devicePixelRatio ??
+        1;
+    final image = await layer.toImage(
+      bounds,
+      pixelRatio: devicePixelRatio * scale,
+    );
+    try {
+      final bytes = await image.toByteData(format: ui.ImageByteFormat.png);
+      return bytes == null ? null : base64Encode(bytes.buffer.asUint8List());
+    } finally {
+      image.dispose();
+    }
+  }
+}
@@ -19,44 +19,75 @@ class ScrollAction extends ElementAction {
   final int? milliseconds;
   final FindByWidget<Scrollable> _scrollableFinder;
 
+  /// Returns the state of the first [Scrollable] in the subtree of
+  /// the [element], which is the one scrolled by this action.
+  ScrollableState? scrollableOf(WidgetsBinding binding, Element element) {
+    final scrollableElement = _scrollableFinder.execute(binding, root: element);
+    if (scrollableElement == null) {
+      return null;
+    }
+    return (scrollableElement as StatefulElement).state as ScrollableState;
+  }
+
+  /// Scrolls the [scrollableState] by the [delta] from its current offset,
+  /// even if it is `0` or `-1` unlike [execute], while staying within the
+  /// extents. Returns `false` if it couldn't move, as the end got reached.
+  Future<bool> scrollBy(ScrollableState scrollableState) async {
+    final pixels = scrollableState.position.pixels;
+    await _scroll(
+      scrollableState,
+      (position) => (position.pixels + delta).clamp(
+        position.minScrollExtent,
+        position.maxScrollExtent,
+      ),
+    );
+    return scrollableState.position.pixels != pixels;
+  }
+
+  /// Moves the [scrollableState] to the offset given by [offsetOf]
+  Future<void> _scroll(
+    ScrollableState scrollableState,
+    double Function(ScrollPosition position) offsetOf,
+  ) async {
+    // 1.Create our own `ScrollController`
+    //
+    // 2. Attach the `position` we got from
+    //    the `scrollableState` to our controller.
+    //
+    // 3. Perform any action we want to do using our controller
+    //
+    // 4. Finally, dispose our controller
+    final scrollController = ScrollController(debugLabel: _kDebugLabel);
+    scrollController.attach(scrollableState.position);
+    final offset = offsetOf(scrollController.position);
+    if ([null, 0].contains(milliseconds)) {
+      scrollController.jumpTo(offset);
+    } else {
+      await scrollController.animateTo(
+        offset,
+        duration: Duration(milliseconds: milliseconds!),
+        curve: Curves.linear,
+      );
+    }
+    scrollController.dispose();
+  }
+
   @override
   FutureOr<bool> execute(WidgetsBinding binding, Element element) async {
     bool didSucceeded = false;
-    final scrollableElement = _scrollableFinder.execute(binding, root: element);
+    final scrollableState = scrollableOf(binding, element);
 
-    if (scrollableElement != null) {
-      final scrollableState =
-          (scrollableElement as StatefulElement).state as ScrollableState;
-      // 1.Create our own `ScrollController`
-      //
-      // 2. Attach the `position` we got from
-      //    the `scrollableState` to our controller.
-      //
-      // 3. Perform any action we want to do using our controller
-      //
-      // 4. Finally, dispose our controller
-      final scrollController = ScrollController(debugLabel: _kDebugLabel);
-      scrollController.attach(scrollableState.position);
-      final double offset;
-      if (delta == 0) {
-        // scroll to very top
-        offset = scrollController.position.minScrollExtent;
-      } else if (delta == -1) {
-        // scroll to very bottom
-        offset = scrollController.position.maxScrollExtent;
-      } else {
-        offset = scrollController.offset + delta;
-      }
-      if ([null, 0].contains(milliseconds)) {
-        scrollController.jumpTo(offset);
-      } else {
-        await scrollController.animateTo(
-          offset,
-          duration: Duration(milliseconds: milliseconds!),
-          curve: Curves.linear,
-        );
-      }
-      scrollController.dispose();
+    if (scrollableState != null) {
+      await _scroll(scrollableState, (position) {
+        if (delta == 0) {
+          // scroll to very top
+          return position.minScrollExtent;
+        } else if (delta == -1) {
+          // scroll to very bottom
+          return position.maxScrollExtent;
+        }
+        return position.pixels + delta;
+      });
       didSucceeded = true;
     }
     return didSucceeded;
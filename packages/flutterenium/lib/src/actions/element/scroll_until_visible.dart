@@ -0,0 +1,73 @@
+import 'package:flutter/widgets.dart' hide Action, ScrollAction;
+
+import '../framework/index.dart';
+import 'element.dart';
+import 'handle.dart';
+import 'is_visible.dart';
+import 'scroll.dart';
+
+/// Keeps scrolling the element by the [step] till the element found
+/// by the [finder] inside it becomes visible, so that the lazily
+/// built children of the lists can be reached in a single request.
+///
+/// <br>
+/// Returns whether the element became visible along with the number
+/// of scrolls made, once visible it is remembered against the [id].
+/// Gives up when [maxScrolls] got exhausted or the scroll reached
+/// its end.
+class ScrollUntilVisibleAction extends ElementAction {
+  const ScrollUntilVisibleAction(
+    this.id,
+    this.finder,
+    this.step,
+    this.maxScrolls,
+  ) : _isVisibleAction = const IsVisibleAction();
+
+  factory ScrollUntilVisibleAction.fromJson(Map<String, dynamic> json) {
+    final double step = json['step'].toDouble();
+    return ScrollUntilVisibleAction(
+      json['id'],
+      FindAction.fromJson(json['finder']),
+      json['direction'] == 'backward' ? -step : step,
+      json['max_scrolls'],
+    );
+  }
+
+  final String id;
+  final FindAction finder;
+  final double step;
+  final int maxScrolls;
+  final IsVisibleAction _isVisibleAction;
+
+  ScrollAction get _scrollAction => ScrollAction(step, null);
+
+  Element? _findVisible(WidgetsBinding binding, Element element) {
+    final match = finder.execute(binding, root: element, skipCurrent: true);
+    if (match != null && _isVisibleAction.execute(binding, match)) {
+      return match;
+    }
+    return null;
+  }
+
+  @override
+  Future<(bool, int)> execute(WidgetsBinding binding, Element element) async {
+    final scrollAction = _scrollAction;
+    final scrollableState = scrollAction.scrollableOf(binding, element);
+    for (int scrolls = 0;; ++scrolls) {
+      final match = _findVisible(binding, element);
+      if (match != null) {
+        ElementHandles.put(id, match);
+        return (true, scrolls);
+      }
+      if (scrollableState == null || scrolls >= maxScrolls) {
+        return (false, scrolls);
+      }
+      if (!await scrollAction.scrollBy(scrollableState)) {
+        // reached the end of the scroll, nothing more to reveal
+        return (false, scrolls);
+      }
+      // lazily built children appear only after the frame
+      await binding.endOfFrame;
+    }
+  }
+}
@@ -1,25 +1,110 @@
+import 'dart:collection';
+
 import 'package:flutter/material.dart' hide Action;
 import 'package:flutter/rendering.dart';
 import 'package:flutter_svg/flutter_svg.dart';
 
 import '../../extensions.dart';
+import '../../labelled.dart';
 import 'framework.dart';
 
+/// Bounds the part of the tree that is looked up by a [FindAction]
+class FindScope {
+  /// If `true`, the subtrees which are painted outside of the
+  /// screen & the ones skipped by [skipOffstage] won't be looked up.
+  final bool visibleOnly;
+
+  /// If `true`, the subtrees of an [Offstage] which is offstage &
+  /// a [TickerMode] which is disabled, like the routes which are
+  /// covered by other routes, won't be looked up.
+  final bool skipOffstage;
+
+  /// If specified, the elements deeper than this from the
+  /// element the search starts at won't be looked up.
+  final int? maxDepth;
+
+  /// If `true`, the elements are looked up level by level instead
+  /// of going deep into a subtree before looking at its siblings.
+  final bool breadthFirst;
+
+  const FindScope({
+    this.visibleOnly = false,
+    this.skipOffstage = false,
+    this.maxDepth,
+    this.breadthFirst = false,
+  });
+
+  factory FindScope.fromJson(Map<String, dynamic>? json) {
+    if (json == null) {
+      return const FindScope();
+    }
+    return FindScope(
+      visibleOnly: json['visible_only'] ?? false,
+      skipOffstage: json['skip_offstage'] ?? false,
+      maxDepth: json['max_depth'],
+      breadthFirst: json['breadth_first'] ?? false,
+    );
+  }
+
+  /// Whether every element is looked up, in the depth first order
+  bool get isUnbounded =>
+      !visibleOnly && !skipOffstage && maxDepth == null && !breadthFirst;
+
+  /// Whether the [element] along with its subtree need to be looked up
+  bool includes(Element element) {
+    if (skipOffstage || visibleOnly) {
+      final widget = element.widget;
+      if ((widget is Offstage && widget.offstage) ||
+          (widget is TickerMode && !widget.enabled)) {
+        return false;
+      }
+    }
+    if (visibleOnly && element is RenderObjectElement) {
+      final renderObject = element.renderObject;
+      final rootNode = renderObject.owner?.rootNode;
+      if (renderObject is RenderBox &&
+          renderObject.attached &&
+          renderObject.hasSize &&
+          rootNode is RenderView) {
+        // a child painting outside of its parent gets skipped along with
+        // the parent, it's a rare case & worth for not visiting the
+        // elements which are laid out beyond the screen
+        final screen = Offset.zero & rootNode.size;
+        if (!screen.overlaps(renderObject.globalPaintBounds)) {
+          return false;
+        }
+      }
+    }
+    return true;
+  }
+}
+
 sealed class FindAction extends FrameworkAction {
-  const FindAction();
+  final FindScope scope;
+
+  const FindAction({this.scope = const FindScope()});
 
   factory FindAction.fromJson(Map<String, dynamic> json) {
+    final scope = FindScope.fromJson(json['scope']);
     return switch (json['type']) {
-      'label' => FindByLabelAction.fromJson(json['data']),
-      'text' => FindByTextAction.fromJson(json['data']),
-      'svg' => FindBySvgAction.fromJson(json['data']),
-      'icon' => FindByIconAction.fromJson(json['data']),
+      'label' => FindByLabelAction.fromJson(json['data'], scope: scope),
+      'text' => FindByTextAction.fromJson(json['data'], scope: scope),
+      'svg' => FindBySvgAction.fromJson(json['data'], scope: scope),
+      'icon' => FindByIconAction.fromJson(json['data'], scope: scope),
       'preceding_sibling' => FindPrecedingSiblingAction.fromJson(json['data']),
       'following_sibling' => FindFollowingSiblingAction.fromJson(json['data']),
+      'all' => FindAllAction.fromJson(json['data']),
+      'nth' => FindNthAction.fromJson(json['data']),
       _ => throw UnimplementedError(),
     };
   }
 
+  static int _visitedNodes = 0;
+
+  /// Number of elements looked up by all the [FindAction]s so far,
+  /// the difference taken around a find tells its cost.
+  static int get visitedNodes => _visitedNodes;
+
   /// If this returns `true` then the [execute] method
   /// will return the [element]
   bool matcher(Element element);
@@ -28,20 +113,67 @@ sealed class FindAction extends FrameworkAction {
   /// won't be  used to match the `Element`, only their
   /// children will be matched.
   Element? _find(Element? visitor, {required bool skipCurrent}) {
+    final result = <Element>[];
+    _findAll(visitor, result, skipCurrent: skipCurrent, limit: 1);
+    return result.firstOrNull;
+  }
+
+  /// Same as [_find], but collects every match into the [result]
+  /// in the order they are looked up as per the [scope]. Stops
+  /// looking further once the [result] has [limit] number of matches.
+  void _findAll(
+    Element? visitor,
+    List<Element> result, {
+    required bool skipCurrent,
+    int? limit,
+  }) {
     if (visitor == null) {
-      return null;
+      return;
     }
-    Element? result;
-    if (!skipCurrent && matcher(visitor)) {
-      result = visitor;
+    bool isFull() => limit != null && result.length >= limit;
+    void visit(Element element, {required bool skip}) {
+      ++_visitedNodes;
+      if (!skip &&
+          matcher(element) &&
+          // a widget & the widgets it builds into share the render object,
+          // ex: `Text` & `RichText`, so they are counted as a single match
+          (result.isEmpty ||
+              result.last.renderObject != element.renderObject)) {
+        result.add(element);
+      }
     }
-    if (result == null) {
-      // as result not found, recursively check for it
-      visitor.visitChildren((visitor) {
-        result ??= _find(visitor, skipCurrent: false);
+
+    final maxDepth = scope.maxDepth;
+    if (scope.breadthFirst) {
+      final queue = Queue<(Element, int)>()..add((visitor, 0));
+      while (queue.isNotEmpty && !isFull()) {
+        final (element, depth) = queue.removeFirst();
+        visit(element, skip: skipCurrent && element == visitor);
+        if (maxDepth != null && depth >= maxDepth) {
+          continue;
+        }
+        element.visitChildren((child) {
+          if (scope.includes(child)) {
+            queue.add((child, depth + 1));
+          }
+        });
+      }
+      return;
+    }
+
+    void visitDepthFirst(Element element, int depth, {required bool skip}) {
+      visit(element, skip: skip);
+      if (maxDepth != null && depth >= maxDepth) {
+        return;
+      }
+      element.visitChildren((child) {
+        if (!isFull() && scope.includes(child)) {
+          visitDepthFirst(child, depth + 1, skip: false);
+        }
       });
     }
-    return result;
+
+    visitDepthFirst(visitor, 0, skip: skipCurrent);
   }
 
   @override
@@ -54,6 +186,71 @@ sealed class FindAction extends FrameworkAction {
   }
 }
 
+class FindAllAction extends FindAction {
+  final FindAction finder;
+
+  /// Finds every [Element] matched by the [finder] in a single
+  /// walk of the tree, in the order they are present in the tree.
+  ///
+  /// <br>
+  /// Actions after this in a request are executed for every
+  /// match, independent of each other.
+  const FindAllAction(this.finder);
+
+  factory FindAllAction.fromJson(Map<String, dynamic> json) {
+    return FindAllAction(FindAction.fromJson(json));
+  }
+
+  @override
+  bool matcher(Element element) => finder.matcher(element);
+
+  List<Element> findAll(
+    WidgetsBinding binding, {
+    Element? root,
+    bool skipCurrent = false,
+  }) {
+    final result = <Element>[];
+    finder._findAll(
+      root ?? binding.rootElement,
+      result,
+      skipCurrent: skipCurrent,
+    );
+    return result;
+  }
+}
+
+class FindNthAction extends FindAction {
+  final FindAction finder;
+  final int index;
+
+  /// Finds the [Element] present at the [index] among all
+  /// the matches of the [finder], in the order they are
+  /// present in the tree.
+  ///
+  /// <br>
+  /// If no matches returns `null`.
+  const FindNthAction(this.finder, this.index);
+
+  factory FindNthAction.fromJson(Map<String, dynamic> json) {
+    return FindNthAction(FindAction.fromJson(json['finder']), json['index']);
+  }
+
+  @override
+  bool matcher(Element element) => finder.matcher(element);
+
+  @override
+  Element? _find(Element? visitor, {required bool skipCurrent}) {
+    final result = <Element>[];
+    finder._findAll(
+      visitor,
+      result,
+      skipCurrent: skipCurrent,
+      limit: index + 1,
+    );
+    return result.length > index ? result[index] : null;
+  }
+}
+
 class FindByLabelAction extends FindAction {
   final String label;
 
@@ -62,16 +259,63 @@ class FindByLabelAction extends FindAction {
   ///
   /// <br>
   /// If no matches returns `null`.
-  const FindByLabelAction(this.label);
+  const FindByLabelAction(this.label, {super.scope});
 
-  factory FindByLabelAction.fromJson(Map<String, dynamic> json) {
-    return FindByLabelAction(json['label']);
+  factory FindByLabelAction.fromJson(
+    Map<String, dynamic> json, {
+    FindScope scope = const FindScope(),
+  }) {
+    return FindByLabelAction(json['label'], scope: scope);
   }
 
   @override
   bool matcher(Element element) {
     return element.widget.label == label;
   }
+
+  @override
+  void _findAll(
+    Element? visitor,
+    List<Element> result, {
+    required bool skipCurrent,
+    int? limit,
+  }) {
+    if (!scope.isUnbounded || WidgetExtension.hasExpandoLabels) {
+      // [LabelledElements] holds only the [Labelled] widgets in the depth
+      // first order, so any other scope or label has to be found by a walk
+      super._findAll(visitor, result, skipCurrent: skipCurrent, limit: limit);
+      return;
+    }
+    if (visitor == null) {
+      return;
+    }
+    final isRoot = visitor == WidgetsBinding.instance.rootElement;
+    for (final element in LabelledElements.lookup(label)) {
+      if (limit != null && result.length >= limit) {
+        return;
+      }
+      ++FindAction._visitedNodes;
+      final isMatch = element == visitor
+          ? !skipCurrent
+          : isRoot || _isDescendant(element, of: visitor);
+      if (isMatch &&
+          // same as the walk, nested widgets sharing
+          // the render object are a single match
+          (result.isEmpty ||
+              result.last.renderObject != element.renderObject)) {
+        result.add(element);
+      }
+    }
+  }
+
+  static bool _isDescendant(Element element, {required Element of}) {
+    bool isDescendant = false;
+    element.visitAncestorElements((ancestor) {
+      isDescendant = ancestor == of;
+      return !isDescendant;
+    });
+    return isDescendant;
+  }
 }
 
 class FindByTextAction extends FindAction {
@@ -82,17 +326,20 @@ class FindByTextAction extends FindAction {
   ///
   /// <br>
   /// If no matches returns `null`.
-  const FindByTextAction(this.text);
+  const FindByTextAction(this.text, {super.scope});
 
-  factory FindByTextAction.fromJson(Map<String, dynamic> json) {
-    return FindByTextAction(json['text']);
+  factory FindByTextAction.fromJson(
+    Map<String, dynamic> json, {
+    FindScope scope = const FindScope(),
+  }) {
+    return FindByTextAction(json['text'], scope: scope);
   }
 
-  @override
-  bool matcher(Element element) {
+  /// Text of the [element] which is used for matching
+  static String? textOf(Element element) {
     final widget = element.widget;
     final renderObject = element.renderObject;
-    final textToMatch = switch (widget) {
+    return switch (widget) {
       InputDecorator() => widget.decoration.hintText,
       _ => switch (renderObject) {
           RenderParagraph() => renderObject.toPlainText(),
@@ -100,7 +347,26 @@ class FindByTextAction extends FindAction {
           _ => null
         }
     };
-    return textToMatch == text;
+  }
+
+  @override
+  bool matcher(Element element) {
+    return textOf(element) == text;
+  }
+}
+
+class FindWithContentAction extends FindAction {
+  /// Finds an [Element] which is rendering any text or the
+  /// `label` is assigned to it.
+  ///
+  /// <br>
+  /// If no matches returns `null`.
+  const FindWithContentAction({super.scope});
+
+  @override
+  bool matcher(Element element) {
+    return element.widget.label != null ||
+        FindByTextAction.textOf(element) != null;
   }
 }
 
@@ -112,19 +378,27 @@ class FindByIconAction extends FindAction {
   ///
   /// <br>
   /// If no matches returns `null`.
-  const FindByIconAction(this.icon);
+  const FindByIconAction(this.icon, {super.scope});
 
-  factory FindByIconAction.fromJson(Map<String, dynamic> json) {
-    return FindByIconAction(json['icon']);
+  factory FindByIconAction.fromJson(
+    Map<String, dynamic> json, {
+    FindScope scope = const FindScope(),
+  }) {
+    return FindByIconAction(json['icon'], scope: scope);
   }
 
-  @override
-  bool matcher(Element element) {
+  /// Code point of the icon the [element] is rendering
+  static int? iconOf(Element element) {
     final widget = element.widget;
     if (widget is! Icon) {
-      return false;
+      return null;
     }
-    return widget.icon?.codePoint == icon;
+    return widget.icon?.codePoint;
+  }
+
+  @override
+  bool matcher(Element element) {
+    return iconOf(element) == icon;
   }
 }
 
@@ -139,7 +413,7 @@ class FindByWidget<T extends Widget> extends FindAction {
   ///
   /// <br>
   /// If no matches returns `null`.
-  const FindByWidget();
+  const FindByWidget({super.scope});
 
   @override
   bool matcher(Element element) {
@@ -167,26 +441,36 @@ class FindBySvgAction extends FindByWidget<SvgPicture> {
 
   /// Finds an [Element] if the `widget` it is holding
   /// is of type [SvgPicture] & matches the [value].
-  const FindBySvgAction(this.value);
+  const FindBySvgAction(this.value, {super.scope});
 
-  factory FindBySvgAction.fromJson(Map<String, dynamic> json) {
-    return FindBySvgAction(json['svg']);
+  factory FindBySvgAction.fromJson(
+    Map<String, dynamic> json, {
+    FindScope scope = const FindScope(),
+  }) {
+    return FindBySvgAction(json['svg'], scope: scope);
+  }
+
+  /// Name of the svg the [element] is rendering
+  static String? svgOf(Element element) {
+    final widget = element.widget;
+    if (widget is! SvgPicture) {
+      return null;
+    }
+    final bytesLoader = widget.bytesLoader;
+    return switch (bytesLoader) {
+      SvgAssetLoader() => bytesLoader.assetName,
+      SvgFileLoader() => bytesLoader.file.path,
+      SvgNetworkLoader() => bytesLoader.url,
+      _ => null,
+    };
   }
 
   @override
   bool matcher(Element element) {
     bool didMatched = false;
-    if (super.matcher(element)) {
-      final bytesLoader = (element.widget as SvgPicture).bytesLoader;
-      final valueToMatch = switch (bytesLoader) {
-        SvgAssetLoader() => bytesLoader.assetName,
-        SvgFileLoader() => bytesLoader.file.path,
-        SvgNetworkLoader() => bytesLoader.url,
-        _ => null,
-      };
-      if (valueToMatch != null) {
-        didMatched = RegExp(value).hasMatch(valueToMatch);
-      }
+    final valueToMatch = svgOf(element);
+    if (valueToMatch != null) {
+      didMatched = RegExp(value).hasMatch(valueToMatch);
     }
     return didMatched;
   }
@@ -244,6 +528,7 @@ class FindPrecedingSiblingAction extends FindSiblingAction {
       final siblings = <Element>[];
       bool didReachedVisitor = false;
       ancestor.visitChildren((element) {
+        ++FindAction._visitedNodes;
         if (!didReachedVisitor) {
           didReachedVisitor = element == prevVisitor;
         }
@@ -284,6 +569,7 @@ class FindFollowingSiblingAction extends FindSiblingAction {
       final siblings = <Element>[];
       bool didReachedVisitor = false;
       ancestor.visitChildren((element) {
+        ++FindAction._visitedNodes;
         if (didReachedVisitor) {
           if (matcher(element)) {
             siblings.add(element);
@@ -0,0 +1,80 @@
+import 'dart:ui';
+
+import 'package:flutter/widgets.dart' hide Action;
+
+import 'framework.dart';
+
+/// Records the [FrameTiming] of every frame rendered between its
+/// `start` & `stop`, which are matched by the [id].
+sealed class FrameTimingsAction extends FrameworkAction {
+  const FrameTimingsAction(this.id);
+
+  factory FrameTimingsAction.fromJson(Map<String, dynamic> json) {
+    final String id = json['data']['id'];
+    return switch (json['type']) {
+      'start' => StartFrameTimingsAction(id),
+      'stop' => StopFrameTimingsAction(id),
+      _ => throw UnimplementedError(),
+    };
+  }
+
+  static final _recorders = <String, (TimingsCallback, List<FrameTiming>)>{};
+
+  /// Engine reports the timings in batches, so the ones of the
+  /// last few frames might arrive only after this much time
+  static const _reportInterval = Duration(milliseconds: 100);
+
+  final String id;
+}
+
+class StartFrameTimingsAction extends FrameTimingsAction {
+  const StartFrameTimingsAction(super.id);
+
+  @override
+  void execute(WidgetsBinding binding) {
+    final timings = <FrameTiming>[];
+    void callback(List<FrameTiming> reported) => timings.addAll(reported);
+    binding.addTimingsCallback(callback);
+    FrameTimingsAction._recorders[id] = (callback, timings);
+  }
+}
+
+/// Stops the recording & returns the build, raster & total durations
+/// of every frame in microseconds, along with the time budget of a
+/// frame as per the refresh rate of the display.
+class StopFrameTimingsAction extends FrameTimingsAction {
+  const StopFrameTimingsAction(super.id);
+
+  @override
+  Future<Map<String, dynamic>> execute(WidgetsBinding binding) async {
+    final recorder = FrameTimingsAction._recorders.remove(id);
+    if (recorder == null) {
+      throw StateError('Frame timings are not being recorded for $id');
+    }
+    final (callback, timings) = recorder;
+    if (binding.hasScheduledFrame) {
+      await binding.endOfFrame;
+    }
+    await Future.delayed(FrameTimingsAction._reportInterval);
+    binding.removeTimingsCallback(callback);
+
+    var refreshRate = binding.platformDispatcher.displays.firstOrNull
+            ?.refreshRate ??
+        0;
+    if (refreshRate <= 0) {
+      // not every platform knows the refresh rate, so assume the usual
+      refreshRate = 60;
+    }
+    return {
+      'frameBudgetMicroseconds': Duration.microsecondsPerSecond ~/ refreshRate,
+      'frames': [
+        for (final timing in timings)
+          [
+            timing.buildDuration.inMicroseconds,
+            timing.rasterDuration.inMicroseconds,
+            timing.totalSpan.inMicroseconds,
+          ],
+      ],
+    };
+  }
+}
@@ -4,7 +4,10 @@ import 'package:flutter/widgets.dart' hide Action;
 
 import '../action.dart';
 import 'find.dart';
+import 'frame_timings.dart';
 import 'pump.dart';
+import 'snapshot.dart';
+import 'wait_until.dart';
 
 /// Any action that can be performed on `FlutterFramework`
 /// should extend this class
@@ -16,6 +19,9 @@ abstract class FrameworkAction extends Action {
     return switch (json['type']) {
       'pump' => PumpAction.fromJson(data),
       'find' => FindAction.fromJson(data),
+      'wait_until' => WaitUntilAction.fromJson(data),
+      'snapshot' => SnapshotAction.fromJson(data),
+      'frame_timings' => FrameTimingsAction.fromJson(data),
       _ => throw UnimplementedError(),
     };
   }
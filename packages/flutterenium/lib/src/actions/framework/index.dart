@@ -1,3 +1,6 @@
 export 'framework.dart';
 export 'pump.dart';
 export 'find.dart';
+export 'wait_until.dart';
+export 'snapshot.dart';
+export 'frame_timings.dart';
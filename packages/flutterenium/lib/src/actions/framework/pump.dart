@@ -26,16 +26,20 @@ class PumpAction extends FrameworkAction {
     };
   }
 
+  /// Returns the number of frames waited for
   @override
-  Future<void> execute(WidgetsBinding binding) async {
+  Future<int> execute(WidgetsBinding binding) async {
     if (duration <= Duration.zero) {
       await binding.endOfFrame;
-      return;
+      return 1;
     }
+    var frames = 0;
     final waitTill = currentDateTime.add(duration);
     while (currentDateTime.isBefore(waitTill)) {
       await binding.endOfFrame;
+      ++frames;
     }
+    return frames;
   }
 }
 
@@ -45,14 +49,17 @@ class PumpAction extends FrameworkAction {
 class PumpAndSettleAction extends PumpAction {
   const PumpAndSettleAction(super.duration);
 
+  /// Returns the number of frames rendered till the app got settled
   @override
-  Future<void> execute(WidgetsBinding binding) async {
+  Future<int> execute(WidgetsBinding binding) async {
+    var frames = 0;
     final waitTill = currentDateTime.add(duration);
     do {
       if (currentDateTime.isAfter(waitTill)) {
         throw TimeoutException('pumpAndSettle timed out', duration);
       }
-      await super.execute(binding);
+      frames += await super.execute(binding);
     } while (binding.hasScheduledFrame);
+    return frames;
   }
 }
@@ -0,0 +1,129 @@
+import 'package:flutter/rendering.dart';
+import 'package:flutter/widgets.dart' hide Action;
+
+import '../../extensions.dart';
+import 'find.dart';
+import 'framework.dart';
+
+/// Serializes the element tree into a list of nodes, in the order
+/// they are present in the tree, every node is a list of
+/// `[parent, type, label, text, icon, svg, bounds]`, where `parent`
+/// is the position of the parent node in the list & `bounds` is
+/// `[left, top, right, bottom]` in global coordinates.
+///
+/// <br>
+/// If [limit] is specified, only that many nodes starting from the
+/// [offset] are returned & the rest of them are kept aside against
+/// the [id], till they are requested. If [release] is `true`, the
+/// nodes kept aside are forgotten without returning any of them.
+class SnapshotAction extends FrameworkAction {
+  const SnapshotAction(
+    this.id,
+    this.offset,
+    this.limit, {
+    this.release = false,
+  });
+
+  factory SnapshotAction.fromJson(Map<String, dynamic> json) {
+    return SnapshotAction(
+      json['id'],
+      json['offset'] ?? 0,
+      json['limit'],
+      release: json['release'] ?? false,
+    );
+  }
+
+  /// Once exceeded, the least recently taken snapshots are forgotten, so
+  /// the ones which the driver never finished won't hold their trees.
+  static const _maxPending = 4;
+
+  /// Ordered from the least to the most recently taken
+  static final _pendingNodes = <String, List<List<dynamic>>>{};
+
+  final String id;
+  final int offset;
+  final int? limit;
+  final bool release;
+
+  /// Forgets the nodes kept aside for every snapshot, should be called
+  /// once the frames get pumped, as the nodes no longer match the tree
+  static void clear() {
+    _pendingNodes.clear();
+  }
+
+  static List<double>? _boundsOf(Element element) {
+    if (element is! RenderObjectElement) {
+      // bounds are same as the nearest descendant which
+      // is a `RenderObjectElement`, so no need to repeat
+      return null;
+    }
+    final renderObject = element.renderObject;
+    if (!renderObject.attached ||
+        (renderObject is RenderBox && !renderObject.hasSize)) {
+      return null;
+    }
+    final bounds = renderObject.globalPaintBounds;
+    return [bounds.left, bounds.top, bounds.right, bounds.bottom];
+  }
+
+  List<List<dynamic>> _serialize(Element root) {
+    final nodes = <List<dynamic>>[];
+    RenderObject? lastTextRenderObject;
+    void visit(Element element, int parent) {
+      final index = nodes.length;
+      var text = FindByTextAction.textOf(element);
+      if (text != null) {
+        // same as `FindAction`, the text is reported only once
+        // for the widgets sharing the render object
+        final renderObject = element.renderObject;
+        if (renderObject == lastTextRenderObject) {
+          text = null;
+        }
+        lastTextRenderObject = renderObject;
+      }
+      nodes.add([
+        parent,
+        element.widget.runtimeType.toString(),
+        element.widget.label,
+        text,
+        FindByIconAction.iconOf(element),
+        FindBySvgAction.svgOf(element),
+        _boundsOf(element),
+      ]);
+      element.visitChildren((child) => visit(child, index));
+    }
+
+    visit(root, -1);
+    return nodes;
+  }
+
+  /// Returns `null` if the nodes kept aside for the [id] are forgotten,
+  /// so that the driver can tell that the snapshot is incomplete.
+  @override
+  Map<String, dynamic>? execute(WidgetsBinding binding, {Element? root}) {
+    if (release) {
+      _pendingNodes.remove(id);
+      return {'nodes': const [], 'total': 0};
+    }
+    final nodes = offset == 0
+        ? _serialize(root ?? binding.rootElement!)
+        : _pendingNodes.remove(id);
+    if (nodes == null) {
+      return null;
+    }
+    final end = limit == null ? nodes.length : offset + limit!;
+    if (end < nodes.length) {
+      _pendingNodes[id] = nodes;
+      while (_pendingNodes.length > _maxPending) {
+        _pendingNodes.remove(_pendingNodes.keys.first);
+      }
+    }
+    return {
+      'nodes': nodes.sublist(
+        offset.clamp(0, nodes.length),
+        end.clamp(0, nodes.length),
+      ),
+      'total': nodes.length,
+    };
+  }
+}
@@ -0,0 +1,25 @@
+import 'package:flutter/widgets.dart' hide Action;
+
+import 'framework.dart';
+
+/// Makes the actions of the request, in which this is present,
+/// to be re-executed once per frame till all of them succeed
+/// or the [timeout] elapses.
+class WaitUntilAction extends FrameworkAction {
+  const WaitUntilAction(this.timeout);
+
+  factory WaitUntilAction.fromJson(Map<String, dynamic> json) {
+    return WaitUntilAction(
+      Duration(milliseconds: (json['milliseconds'] as num).toInt()),
+    );
+  }
+
+  final Duration timeout;
+
+  /// Waits till the end of the next frame, so that the
+  /// upcoming attempt gets to see an updated tree.
+  @override
+  Future<void> execute(WidgetsBinding binding) async {
+    await binding.endOfFrame;
+  }
+}
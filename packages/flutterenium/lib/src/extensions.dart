@@ -1,16 +1,39 @@
 import 'package:flutter/rendering.dart';
 import 'package:flutter/widgets.dart';
 
+import 'labelled.dart';
+
 extension WidgetExtension on Widget {
   /// Add's an extra property to any class that extends [Widget]
   static final _expando = Expando<String>();
 
+  static bool _hasExpandoLabels = false;
+
+  /// Whether a `label` was ever assigned through the property, those
+  /// widgets can be found only by walking the tree unlike the [Labelled].
+  static bool get hasExpandoLabels => _hasExpandoLabels;
+
   /// This will be used in finding `this` widget, while crawling
   /// the widget tree, so its suggested to use unique value
   /// for every widget.
-  String? get label => _expando[this];
+  ///
+  /// <br>
+  /// Prefer wrapping the widget in a [Labelled], which can be
+  /// found without crawling the whole tree.
+  String? get label {
+    final widget = this;
+    if (widget is Labelled) {
+      return widget.label;
+    }
+    return _expando[this];
+  }
 
-  set label(String? value) => _expando[this] = value;
+  set label(String? value) {
+    _expando[this] = value;
+    if (value != null) {
+      _hasExpandoLabels = true;
+    }
+  }
 }
 
 extension RenderObjectExtension on RenderObject {
@@ -1 +1,2 @@
 export 'extensions.dart';
+export 'labelled.dart' hide LabelledElements;
@@ -0,0 +1,124 @@
+import 'package:flutter/widgets.dart';
+
+/// Assigns the [label] to the [child], so that it can be found by the label.
+///
+/// <br>
+/// Unlike the `label` property of a [Widget], the elements of this keep
+/// the label lookups up to date as they get mounted & unmounted, so
+/// finding them won't need to walk the tree.
+class Labelled extends ProxyWidget {
+  /// Same as the `label` property of a [Widget], its suggested
+  /// to use unique value for every widget.
+  final String label;
+
+  const Labelled({super.key, required this.label, required super.child});
+
+  @override
+  Element createElement() => _LabelledElement(this);
+}
+
+class _LabelledElement extends ProxyElement {
+  _LabelledElement(Labelled super.widget);
+
+  String get _label => (widget as Labelled).label;
+
+  @override
+  void mount(Element? parent, Object? newSlot) {
+    super.mount(parent, newSlot);
+    LabelledElements._add(_label, this);
+  }
+
+  @override
+  void activate() {
+    super.activate();
+    LabelledElements._add(_label, this);
+  }
+
+  @override
+  void deactivate() {
+    LabelledElements._remove(_label, this);
+    super.deactivate();
+  }
+
+  @override
+  void updated(covariant Labelled oldWidget) {
+    if (oldWidget.label != _label) {
+      LabelledElements._remove(oldWidget.label, this);
+      LabelledElements._add(_label, this);
+    }
+    super.updated(oldWidget);
+  }
+
+  @override
+  void notifyClients(covariant ProxyWidget oldWidget) {}
+}
+
+/// Elements of the [Labelled] widgets which are in the tree,
+/// grouped by the label.
+///
+/// <br>
+/// It is meant only for the finders, hence not exported.
+abstract final class LabelledElements {
+  static final _elements = <String, List<Element>>{};
+
+  /// Elements assigned the [label], in the order they are present in the tree
+  static List<Element> lookup(String label) {
+    final elements = _elements[label];
+    if (elements == null) {
+      return const [];
+    }
+    if (elements.length > 1) {
+      // Elements can be moved around without getting unmounted, ex: keyed
+      // children getting reordered, so the order is found on every lookup.
+      // Only the labels assigned to multiple elements pay for it.
+      final paths = {for (final element in elements) element: _pathOf(element)};
+      elements.sort((a, b) => _compare(paths[a]!, paths[b]!));
+    }
+    return elements;
+  }
+
+  static void _add(String label, Element element) {
+    _elements.putIfAbsent(label, () => []).add(element);
+  }
+
+  static void _remove(String label, Element element) {
+    final elements = _elements[label];
+    if (elements == null) {
+      return;
+    }
+    elements.remove(element);
+    if (elements.isEmpty) {
+      _elements.remove(label);
+    }
+  }
+
+  /// Position of the [element] among its siblings, at every level from the root
+  static List<int> _pathOf(Element element) {
+    final path = <int>[];
+    Element child = element;
+    element.visitAncestorElements((ancestor) {
+      var index = 0;
+      var position = -1;
+      ancestor.visitChildren((sibling) {
+        if (sibling == child) {
+          position = index;
+        }
+        ++index;
+      });
+      path.add(position);
+      child = ancestor;
+      return true;
+    });
+    return path.reversed.toList();
+  }
+
+  static int _compare(List<int> a, List<int> b) {
+    for (var i = 0; i < a.length && i < b.length; ++i) {
+      if (a[i] != b[i]) {
+        return a[i].compareTo(b[i]);
+      }
+    }
+    // an ancestor comes before its descendants
+    return a.length.compareTo(b.length);
+  }
+}
@@ -0,0 +1,29 @@
+/// Keeps track of where the time went while executing a request,
+/// so that the driver can tell apart the time spent inside the
+/// page from the time spent in transporting the request.
+class RequestMetrics {
+  RequestMetrics();
+
+  /// Time spent in finding the elements
+  final findStopwatch = Stopwatch();
+
+  /// Time spent in executing the actions other than finding
+  final executeStopwatch = Stopwatch();
+
+  /// Number of elements looked up while finding the elements
+  int visitedNodes = 0;
+
+  /// Whether no frame was pending when the response got emitted, i.e. the
+  /// tree can't change till something schedules a frame. The driver reuses
+  /// the results of the reads made while idle, till the next frame.
+  bool idle = false;
+
+  Map<String, dynamic> toJson() {
+    return {
+      'findMicroseconds': findStopwatch.elapsedMicroseconds,
+      'executeMicroseconds': executeStopwatch.elapsedMicroseconds,
+      'visitedNodes': visitedNodes,
+      'idle': idle,
+    };
+  }
+}
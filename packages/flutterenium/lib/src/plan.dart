@@ -0,0 +1,95 @@
+import 'actions/index.dart';
+
+/// Steps which are parsed once & executed as many times as the
+/// driver wants, by sending only the id of the plan along with
+/// the values of the parameters used in it.
+///
+/// <br>
+/// A parameter is marked by a `{"$param": name}` placeholder in
+/// place of any value, only the actions containing them are
+/// parsed again on every run.
+class Plan {
+  Plan(List<dynamic> steps, {required this.stopOnFailure})
+      : _steps = [
+          for (final step in steps)
+            [
+              for (final action in step)
+                _hasParam(action) ? action : Action.fromJson(action),
+            ],
+        ];
+
+  static const _paramKey = r'$param';
+
+  /// Once exceeded, the least recently used plans are forgotten, so the
+  /// plans which the driver never released won't pile up. Driver prepares
+  /// a plan again if it gets run after being forgotten.
+  static const _maxPlans = 256;
+
+  /// Ordered from the least to the most recently used
+  static final _plans = <String, Plan>{};
+
+  /// Each action is either a parsed [Action] or the json of the
+  /// action which still contains the placeholders
+  final List<List<dynamic>> _steps;
+
+  final bool stopOnFailure;
+
+  static Plan? get(String id) {
+    final plan = _plans.remove(id);
+    if (plan != null) {
+      _plans[id] = plan;
+    }
+    return plan;
+  }
+
+  static void put(String id, Plan plan) {
+    _plans.remove(id);
+    _plans[id] = plan;
+    while (_plans.length > _maxPlans) {
+      _plans.remove(_plans.keys.first);
+    }
+  }
+
+  static void remove(String id) {
+    _plans.remove(id);
+  }
+
+  static bool _hasParam(dynamic json) {
+    return switch (json) {
+      Map() => json.containsKey(_paramKey) || json.values.any(_hasParam),
+      List() => json.any(_hasParam),
+      _ => false,
+    };
+  }
+
+  static dynamic _substitute(dynamic json, Map<String, dynamic> params) {
+    if (json is Map && json.containsKey(_paramKey)) {
+      final name = json[_paramKey];
+      if (!params.containsKey(name)) {
+        throw ArgumentError('Missing value for the parameter $name');
+      }
+      return params[name];
+    }
+    return switch (json) {
+      Map() => <String, dynamic>{
+          for (final entry in json.entries)
+            entry.key: _substitute(entry.value, params),
+        },
+      List() => [for (final item in json) _substitute(item, params)],
+      _ => json,
+    };
+  }
+
+  /// Returns the steps with the placeholders replaced by the [params]
+  List<List<Action>> resolve(Map<String, dynamic> params) {
+    return [
+      for (final step in _steps)
+        [
+          for (final action in step)
+            action is Action
+                ? action
+                : Action.fromJson(_substitute(action, params)),
+        ],
+    ];
+  }
+}
@@ -0,0 +1,259 @@
+import 'dart:convert';
+import 'dart:typed_data';
+
+import 'package:flutter/material.dart' hide Action, ScrollAction;
+import 'package:flutter_test/flutter_test.dart';
+import 'package:flutterenium/flutterenium.dart';
+import 'package:flutterenium/src/actions/index.dart';
+
+/// Keeps pumping the frames till the [future] completes, as
+/// the actions waiting for a frame won't get one otherwise
+Future<T> pumpTill<T>(WidgetTester tester, Future<T> future) async {
+  var isCompleted = false;
+  late T result;
+  future.then((value) {
+    result = value;
+    isCompleted = true;
+  });
+  while (!isCompleted) {
+    await tester.pump();
+  }
+  return result;
+}
+
+String? textOf(Element? element) {
+  return element == null ? null : FindByTextAction.textOf(element);
+}
+
+void main() {
+  group('ScrollUntilVisibleAction', () {
+    // 800x600 screen shows 12 of the 100 items, so the list scrolls by 4400
+    Widget buildList() {
+      return Directionality(
+        textDirection: TextDirection.ltr,
+        child: ListView.builder(
+          itemExtent: 50,
+          itemCount: 100,
+          itemBuilder: (context, index) => Text('item $index'),
+        ),
+      );
+    }
+
+    Future<(bool, int)> scrollUntilVisible(
+      WidgetTester tester,
+      String text, {
+      double step = 300,
+      int maxScrolls = 1000,
+    }) {
+      final list = find.byType(ListView).evaluate().single;
+      final action = ScrollUntilVisibleAction(
+        'handle',
+        FindByTextAction(text),
+        step,
+        maxScrolls,
+      );
+      return pumpTill(tester, action.execute(tester.binding, list));
+    }
+
+    double pixelsOf(WidgetTester tester) {
+      return tester
+          .state<ScrollableState>(find.byType(Scrollable))
+          .position
+          .pixels;
+    }
+
+    setUp(ElementHandles.clear);
+
+    testWidgets('reaches the lazily built children', (tester) async {
+      await tester.pumpWidget(buildList());
+      expect(FindByTextAction('item 40').execute(tester.binding), isNull);
+
+      final (found, scrolls) = await scrollUntilVisible(tester, 'item 40');
+      expect(found, isTrue);
+      expect(scrolls, greaterThan(0));
+      final match = ElementHandles.get('handle');
+      expect(textOf(match), 'item 40');
+      expect(const IsVisibleAction().execute(tester.binding, match!), isTrue);
+    });
+
+    testWidgets('does not scroll when already visible', (tester) async {
+      await tester.pumpWidget(buildList());
+      expect(await scrollUntilVisible(tester, 'item 1'), (true, 0));
+      expect(pixelsOf(tester), 0);
+    });
+
+    testWidgets('gives up once the max scrolls are made', (tester) async {
+      await tester.pumpWidget(buildList());
+      expect(
+        await scrollUntilVisible(tester, 'item 90', maxScrolls: 2),
+        (false, 2),
+      );
+      expect(pixelsOf(tester), 600);
+      expect(ElementHandles.get('handle'), isNull);
+    });
+
+    testWidgets('gives up once the end of the scroll is reached', (
+      tester,
+    ) async {
+      await tester.pumpWidget(buildList());
+      // the last scroll is clamped from 4500 to the 4400
+      expect(await scrollUntilVisible(tester, 'missing'), (false, 15));
+      expect(pixelsOf(tester), 4400);
+
+      expect(
+        await scrollUntilVisible(tester, 'item 0', step: -1000),
+        (true, 5),
+      );
+      expect(pixelsOf(tester), 0);
+      // already at the start, so the `-1` isn't treated as the very bottom
+      expect(
+        await scrollUntilVisible(tester, 'missing', step: -1),
+        (false, 0),
+      );
+    });
+  });
+
+  group('ElementHandles', () {
+    setUp(ElementHandles.clear);
+
+    testWidgets('handles are dropped once the element changes', (
+      tester,
+    ) async {
+      late StateSetter setState;
+      var text = 'first';
+      await tester.pumpWidget(
+        Directionality(
+          textDirection: TextDirection.ltr,
+          child: StatefulBuilder(
+            builder: (context, setter) {
+              setState = setter;
+              return Text(text);
+            },
+          ),
+        ),
+      );
+      final element = FindByTextAction('first').execute(tester.binding)!;
+      expect(
+        const HandleAction('text').execute(tester.binding, element),
+        isTrue,
+      );
+      expect(ElementHandles.get('text'), element);
+
+      // a frame with no rebuild keeps the handle
+      await tester.pump();
+      expect(ElementHandles.get('text'), element);
+
+      // rebuilt with a new widget
+      setState(() => text = 'second');
+      await tester.pump();
+      expect(ElementHandles.get('text'), isNull);
+
+      final rebuilt = FindByTextAction('second').execute(tester.binding)!;
+      ElementHandles.put('text', rebuilt);
+      await tester.pumpWidget(const SizedBox());
+      expect(ElementHandles.get('text'), isNull);
+    });
+  });
+
+  testWidgets('CollectAction reads the properties of every match', (
+    tester,
+  ) async {
+    await tester.pumpWidget(
+      const Directionality(
+        textDirection: TextDirection.ltr,
+        child: Column(
+          children: [
+            Labelled(label: 'title', child: Text('first')),
+            SizedBox(height: 10),
+            Text('second'),
+          ],
+        ),
+      ),
+    );
+    final column = find.byType(Column).evaluate().single;
+    final rows = const CollectAction(
+      ['text', 'label', 'type', 'visible'],
+      FindWithContentAction(),
+    ).execute(tester.binding, column);
+    // a widget & the ones it builds into are a single match
+    expect(rows, [
+      ['first', 'title', 'Labelled', true],
+      ['second', null, 'Text', true],
+    ]);
+
+    final bounds = const CollectAction(
+      ['bounds'],
+      FindByWidget<Text>(),
+    ).execute(tester.binding, column);
+    expect(bounds, hasLength(2));
+    final [first] = bounds[0];
+    final [second] = bounds[1];
+    expect(first[1], 0);
+    expect(second[1], first[3] + 10);
+  });
+
+  group('ScreenshotAction', () {
+    Widget buildBox() {
+      return const Directionality(
+        textDirection: TextDirection.ltr,
+        child: Align(
+          alignment: Alignment.bottomRight,
+          child: RepaintBoundary(
+            child: Padding(
+              padding: EdgeInsets.all(20),
+              child: SizedBox(
+                width: 100,
+                height: 50,
+                child: ColoredBox(color: Color(0xFF00FF00)),
+              ),
+            ),
+          ),
+        ),
+      );
+    }
+
+    /// Width & height from the header of the [png]
+    (int, int) sizeOf(String png) {
+      final header = ByteData.sublistView(base64Decode(png), 0, 24);
+      return (header.getUint32(16), header.getUint32(20));
+    }
+
+    testWidgets('captures only the region of the element', (tester) async {
+      await tester.pumpWidget(buildBox());
+      final box = find.byType(ColoredBox).evaluate().single;
+      final ratio = tester.view.devicePixelRatio;
+
+      final png = await tester.runAsync(
+        () => const ScreenshotAction(1).execute(tester.binding, box),
+      );
+      expect(sizeOf(png!), ((100 * ratio).round(), (50 * ratio).round()));
+
+      final scaled = await tester.runAsync(
+        () => const ScreenshotAction(0.5).execute(tester.binding, box),
+      );
+      expect(
+        sizeOf(scaled!),
+        ((50 * ratio).round(), (25 * ratio).round()),
+      );
+    });
+
+    testWidgets('is null for the elements which are not boxes', (
+      tester,
+    ) async {
+      await tester.pumpWidget(
+        const Directionality(
+          textDirection: TextDirection.ltr,
+          child: CustomScrollView(
+            slivers: [SliverToBoxAdapter(child: SizedBox(height: 10))],
+          ),
+        ),
+      );
+      // only the region of a box can be cropped out
+      final sliver = find.byType(SliverToBoxAdapter).evaluate().single;
+      final png = await tester.runAsync(
+        () => const ScreenshotAction(1).execute(tester.binding, sliver),
+      );
+      expect(png, isNull);
+    });
+  });
+}
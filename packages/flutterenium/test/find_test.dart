@@ -0,0 +1,188 @@
+import 'package:flutter/material.dart' hide Action;
+import 'package:flutter_test/flutter_test.dart';
+import 'package:flutterenium/flutterenium.dart';
+import 'package:flutterenium/src/actions/index.dart';
+
+void main() {
+  late StateSetter setOuterState;
+  late StateSetter setInnerState;
+  var count = 0;
+  var showExtra = false;
+  var rows = <int>[];
+  // built every time, but never mounted
+  late Widget unused;
+
+  Widget buildApp() {
+    return Directionality(
+      textDirection: TextDirection.ltr,
+      child: StatefulBuilder(
+        builder: (context, setState) {
+          setOuterState = setState;
+          unused = Labelled(label: 'extra', child: Text('unused $count'));
+          return Column(
+            children: [
+              for (var index = 0; index < 30; ++index) Text('$index'),
+              StatefulBuilder(
+                builder: (context, setState) {
+                  setInnerState = setState;
+                  return Labelled(label: 'counter', child: Text('$count'));
+                },
+              ),
+              if (showExtra)
+                Labelled(label: 'extra', child: Text('extra $count')),
+              for (final row in rows)
+                Labelled(
+                  key: ValueKey(row),
+                  label: 'row',
+                  child: Text('row $row'),
+                ),
+            ],
+          );
+        },
+      ),
+    );
+  }
+
+  int countElements(WidgetTester tester) {
+    var elements = 0;
+    void visit(Element element) {
+      ++elements;
+      element.visitChildren(visit);
+    }
+
+    visit(tester.binding.rootElement!);
+    return elements;
+  }
+
+  (Element?, int) findLabel(WidgetTester tester, String label) {
+    final visitedNodes = FindAction.visitedNodes;
+    final element = FindByLabelAction(label).execute(tester.binding);
+    return (element, FindAction.visitedNodes - visitedNodes);
+  }
+
+  String? textOf(Element? element) {
+    return element == null ? null : FindByTextAction.textOf(element);
+  }
+
+  List<String?> findRows(WidgetTester tester) {
+    return FindAllAction(const FindByLabelAction('row'))
+        .findAll(tester.binding)
+        .map(textOf)
+        .toList();
+  }
+
+  setUp(() {
+    count = 0;
+    showExtra = false;
+    rows = [];
+  });
+
+  testWidgets('label finds do not walk the tree', (tester) async {
+    await tester.pumpWidget(buildApp());
+    final elements = countElements(tester);
+    var (element, visits) = findLabel(tester, 'counter');
+    expect(textOf(element), '0');
+    expect(visits, lessThan(elements ~/ 10));
+
+    setInnerState(() => ++count);
+    await tester.pump();
+    (element, visits) = findLabel(tester, 'counter');
+    expect(textOf(element), '1');
+    expect(visits, lessThan(elements ~/ 10));
+
+    // every labelled widget is built again along with the unlabelled ones
+    setOuterState(() => ++count);
+    await tester.pump();
+    (element, visits) = findLabel(tester, 'counter');
+    expect(textOf(element), '2');
+    expect(visits, lessThan(elements ~/ 10));
+  });
+
+  testWidgets('labelled elements getting mounted & unmounted are found', (
+    tester,
+  ) async {
+    await tester.pumpWidget(buildApp());
+    expect(unused.label, 'extra');
+    expect(findLabel(tester, 'extra').$1, isNull);
+
+    setOuterState(() => showExtra = true);
+    await tester.pump();
+    expect(textOf(findLabel(tester, 'extra').$1), 'extra 0');
+
+    setOuterState(() => showExtra = false);
+    await tester.pump();
+    expect(findLabel(tester, 'extra').$1, isNull);
+    expect(findLabel(tester, 'counter').$1, isNotNull);
+
+    await tester.pumpWidget(const SizedBox());
+    expect(findLabel(tester, 'counter').$1, isNull);
+  });
+
+  testWidgets('repeated labels are found in the order of the tree', (
+    tester,
+  ) async {
+    rows = [0, 1, 2];
+    await tester.pumpWidget(buildApp());
+    expect(findRows(tester), ['row 0', 'row 1', 'row 2']);
+
+    // keyed elements are moved without getting mounted again
+    setOuterState(() => rows = [2, 0, 1]);
+    await tester.pump();
+    expect(findRows(tester), ['row 2', 'row 0', 'row 1']);
+    expect(
+      textOf(
+        const FindNthAction(FindByLabelAction('row'), 1).execute(
+          tester.binding,
+        ),
+      ),
+      'row 0',
+    );
+
+    setOuterState(() => rows = [1, 3]);
+    await tester.pump();
+    expect(findRows(tester), ['row 1', 'row 3']);
+  });
+
+  testWidgets('labels of a subtree are found within it', (tester) async {
+    rows = [0, 1];
+    await tester.pumpWidget(buildApp());
+    final row = findLabel(tester, 'row').$1!;
+    expect(
+      const FindByLabelAction('row').execute(tester.binding, root: row),
+      row,
+    );
+    expect(
+      const FindByLabelAction('row').execute(
+        tester.binding,
+        root: row,
+        skipCurrent: true,
+      ),
+      isNull,
+    );
+    final counter = findLabel(tester, 'counter').$1!;
+    expect(
+      const FindByLabelAction('row').execute(tester.binding, root: counter),
+      isNull,
+    );
+  });
+
+  // labels assigned through the property can't be tracked, so this
+  // has to be the last test, as every label find walks the tree after it
+  testWidgets('labels assigned through the property are found', (
+    tester,
+  ) async {
+    await tester.pumpWidget(
+      Directionality(
+        textDirection: TextDirection.ltr,
+        child: Column(
+          children: [
+            Text('0')..label = 'property',
+            const Labelled(label: 'counter', child: Text('1')),
+          ],
+        ),
+      ),
+    );
+    expect(textOf(findLabel(tester, 'property').$1), '0');
+    expect(textOf(findLabel(tester, 'counter').$1), '1');
+  });
+}